@@ -1,8 +1,11 @@
 from burp import IBurpExtender # for the extension
 from burp import IContextMenuFactory # for adding an option to the right click popup menu
+from burp import IExtensionStateListener # for stopping the issue submission thread when the extension is unloaded
 from burp import IHttpRequestResponse # for custom IHttpRequestResponse
 from burp import IHttpService # for custom IHttpService
+from burp import IMessageEditorController # for giving the request and response message editors the selected message
 from burp import IScanIssue # for adding a new issue
+from burp import IScannerListener # for tracking new issues from the scanner in the duplicate issue index
 from burp import ITab # for creating an extension tab
 from java.awt import BorderLayout # for panel layouts
 from java.awt import Color # for setting a darker background on disabled text areas
@@ -15,13 +18,20 @@ from java.awt.event import ActionListener # for custom action listener for proto
 from java.awt.event import InputEvent # for undo and redo in text areas
 from java.awt.event import KeyEvent # for allowing tab key to change focus instead of inserting tab into text areas
 from java.awt.event import MouseListener # for detecting mouse clicks on tables so row doesn't flash when dragging a clicked mouse
+from java.io import RandomAccessFile # for memory mapping mounted issue libraries and locking the issue journal
 from java.lang import Integer # for filter on port text area
-from java.lang import StringBuilder # for filter on port text area
+from java.lang import Runnable # for running imports and exports on a background thread and updating the table on the Swing event thread
+from java.lang import Thread # for running imports and exports on a background thread
 from java.net import URL # for creating URLs
+from java.nio.channels import FileChannel # for memory mapping mounted issue libraries
+from java.util import Comparator # for ordering issue names by how well they matched a search
+from java.util.concurrent import Semaphore # for limiting how far a bulk add gets ahead of burp
+from java.util.concurrent import TimeUnit # for waiting for a bulk issue slot with a timeout
 from javax.swing import AbstractAction # for undo and redo in text areas
 from javax.swing import Action # for undo and redo in text areas
 from javax.swing import BorderFactory # for panel borders
 from javax.swing import JButton # for buttons
+from javax.swing import JCheckBox # for adding an issue to all selected messages
 from javax.swing import JComboBox # for severity, confidence, and protocol combo boxes
 from javax.swing import JDialog # for main popup dialog box
 from javax.swing import JFileChooser # for importing and exporting dialog boxes
@@ -30,36 +40,60 @@ from javax.swing import JLabel # for labels
 from javax.swing import JMenuItem # for adding menu choices to add a new issue
 from javax.swing import JOptionPane # for import and export message boxes
 from javax.swing import JPanel # for panels
+from javax.swing import JProgressBar # for showing the progress of imports and exports
 from javax.swing import JScrollPane # for scroll panes to help with extended text areas
 from javax.swing import JSplitPane # for split panes in issue selection popup dialog tab and main tab
 from javax.swing import JTabbedPane # for tabbed pane in popup dialog
 from javax.swing import JTable # for tables in issue selection popup dialog tab and main tab
 from javax.swing import JTextArea # for text areas in popup dialog and main panel
+from javax.swing import JTextField # for search fields in issue selection popup dialog tab and main tab
 from javax.swing import JTextPane # for centering text in disabled issue name and severity text panes
 from javax.swing import KeyStroke # for undo and redo in text areas
 from javax.swing import ListSelectionModel # for only allowing single row selection
+from javax.swing import RowFilter # for filtering tables by search results
+from javax.swing import RowSorter # for ordering the issue selection table by how well issue names matched a search
 from javax.swing import SortOrder # for setting table sort order ascending descending unsorted
+from javax.swing import SwingUtilities # for updating the table on the Swing event thread from imports and exports
 from javax.swing import SwingConstants # for Swing constants
 from javax.swing.border import TitledBorder # for panel borders
 from javax.swing.event import DocumentListener # for detecting changes to text areas to update the issue location
 from javax.swing.event import UndoableEditListener # for undo and redo in text areas
+from javax.swing.filechooser import FileFilter # for choosing gzip compressed files when importing and exporting
 from javax.swing.filechooser import FileNameExtensionFilter # for importing and exporting
-from javax.swing.table import DefaultTableModel # for creating shared a custom table model
+from javax.swing.table import AbstractTableModel # for creating a shared custom table model
 from javax.swing.table import TableRowSorter # for setting table sort order ascending descending unsorted
+from javax.swing.table import TableStringConverter # for sorting text columns by cached sort keys
 from javax.swing.text import DocumentFilter # for applying filters on the issue name, host, and port text areas
 from javax.swing.text import SimpleAttributeSet # for centering text in disabled issue name and severity text panes
 from javax.swing.text import StyleConstants # for centering text in disabled issue name and severity text panes
 from javax.swing.undo import UndoManager # for undo and redo in text areas
+from array import array # for storing the severity and issue type columns as small ordinals
+from collections import OrderedDict # for keeping json keys in column order when exporting
+from threading import Event # for waiting until the duplicate issue index has been seeded
+from threading import Lock # for handing imported issues from the background thread to the Swing event thread
+import bisect # for finding words by prefix in the search index
+import cgi # for escaping the affected urls listed in combined issues
+import codecs # for decoding json files as they are read
 import csv # for importing and exporting to and from csv
+import gzip # for importing and exporting gzip compressed csv and json files
+import hashlib # for creating fingerprints of issues to quickly detect duplicates
+import jarray # for reading bytes from memory mapped issue libraries
+import heapq # for getting the best matching issue names
 import json # for importing and exporting to and from json
 import os # for splitting the file name and file extension when importing and exporting
+import Queue # for adding issues to burp from a background thread
+import re # for splitting text into words for the search index
+import struct # for reading and writing binary issue snapshots
+import sys # for setting the csv field size limit when importing
+import time # for timing imports and exports
+import zlib # for compressing the blocks of binary issue snapshots
 
 
 #
 # Burp extender main class
 #
 
-class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
+class BurpExtender(IBurpExtender, ITab, IContextMenuFactory, IExtensionStateListener, IScannerListener):
 
 	#
 	# implement IBurpExtender when the extension is loaded
@@ -85,7 +119,7 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		self._DIALOG_TAB_2_NAME = "Issue Selection"
 
 		# create the button names for the main tab
-		self._MAIN_TAB_BUTTON_NAMES = ["Add Issue", "Export Issues To CSV", "Import Issues From CSV", "Delete Issue", "Export Issues To JSON", "Import Issues From JSON"]
+		self._MAIN_TAB_BUTTON_NAMES = ["Add Issue", "Export Issues To CSV", "Import Issues From CSV", "Delete Issue", "Export Issues To JSON", "Import Issues From JSON", "Export Issues To Snapshot", "Import Issues From Snapshot", "Mount Snapshot As Library", "Export Changes Since Last Export", "Import Changes", "Unmount Library"]
 
 		# create a consistent background color for disabled text areas and text panes
 		self._DISABLED_BACKGROUND_COLOR = Color(224, 225, 226)
@@ -112,6 +146,7 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# create a dictionaries for code reuse
 		self._dictionaryOfTextAreas = dict()
 		self._dictionaryOfTextPanes = dict()
+		self._dictionaryOfMessageEditors = dict()
 		self._dictionaryOfScrollPanes = dict()
 		self._dictionaryOfScrollPaneBorders = dict()
 		self._dictionaryOfComboBoxes = dict()
@@ -122,13 +157,65 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		self._dictionaryOfButtons = dict()
 		self._dictionaryOfLabels = dict()
 		self._dictionaryOfLastSelectedRowsAndColumns = dict()
+		self._dictionaryOfSearchFields = dict()
 
-		# create main extension tab and issue selection tab for popup dialog
+		# create a dictionary of the original bytes of the request and response, so unedited messages are submitted unchanged
+		self._dictionaryOfMessageBytes = dict()
+
+		# create the controller that gives the request and response message editors the selected message
+		self._messageEditorController = CustomIMessageEditorController()
+
+		# create a list of the messages or issues selected when the dialog was opened from the menu, for adding an issue to all of them
+		self._selectedMessagesOrIssues = []
+
+		# set the search indexes to none since they are created the first time a search is made
+		self._searchIndex = None
+		self._trigramIndex = None
+
+		# create a dictionary of the path of each mounted library to the library
+		self._dictionaryOfMountedLibraries = dict()
+
+		# set the number of similar issue names to show in the issue selection tab when searching
+		self._MAXIMUM_SIMILAR_ISSUE_NAMES = 50
+
+		# set the running import or export task to none
+		self._importExportTask = None
+
+		# set the popup dialog to none since it is created the first time it is opened
+		self._dialogAddIssue = None
+
+		# set that the table has not been updated since the last export
+		self._tableUpdatedSinceLastExport = False
+
+		# set the generation of the table model that the last export was taken at, so only the changes since then are exported as a delta
+		self._lastExportGeneration = 0
+
+		# set that no update of the issue location is waiting to run
+		self._issueLocationUpdatePending = False
+
+		# get the start time to print how long each part of loading the extension takes
+		startTime = time.time()
+
+		# create a shared table model for the issue selection tab and main tab
+		self.createSharedTableModel()
+
+		# mount the read only issue libraries that were mounted before the extension was last unloaded
+		self.mountSavedLibraries()
+
+		# restore the issues that were added and deleted before the extension was last unloaded
+		self.restoreIssueJournal()
+
+		# start a new generation so the issues that were loaded do not count as changes since the last export
+		self._lastExportGeneration = self._tableModelShared.startGeneration()
+
+		# get the time to create the table model
+		tableModelTime = time.time()
+
+		# create main extension tab, the issue selection tab is created with the popup dialog the first time it is opened
 		self.createMainTabOrIssueSelectionTab(self._MAIN_TAB_NAME)
-		self.createMainTabOrIssueSelectionTab(self._DIALOG_TAB_2_NAME)
 
-		# create popup dialog to add a new issue
-		self.createAddIssueDialog(self._DIALOG_TAB_1_NAME)
+		# get the time to create the main tab
+		mainTabTime = time.time()
 
 		# set the extension name
 		callbacks.setExtensionName(self._EXTENSION_NAME)
@@ -136,22 +223,71 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# register the context menu factory
 		callbacks.registerContextMenuFactory(self)
 
+		# create the index of issues already in burp, which is seeded from burp's issues on a background thread
+		self._scanIssueIndex = CustomScanIssueIndex(callbacks)
+
+		# register the scanner listener to add new issues from the scanner to the index
+		callbacks.registerScannerListener(self)
+
+		# create the queue that adds issues to burp from a background thread so the user interface does not wait on burp
+		self._scanIssueSubmissionQueue = CustomScanIssueSubmissionQueue(callbacks, self._scanIssueIndex, self._EXTENSION_NAME)
+
+		# register the extension state listener to stop the queue when the extension is unloaded
+		callbacks.registerExtensionStateListener(self)
+
 		# customize UI components (recursive on child components) sets highlighted text in tables black instead of white. Will not center text in combo boxes
 		callbacks.customizeUiComponent(self._dictionaryOfTables[self._MAIN_TAB_NAME])
-		callbacks.customizeUiComponent(self._dictionaryOfTables[self._DIALOG_TAB_2_NAME])
 
 		# add custom tab to Burp's UI
 		callbacks.addSuiteTab(self)
 
+		# get the time to register with Burp
+		registerTime = time.time()
+
 		# print text to output window
 		print(self._EXTENSION_NAME + " v" + self._EXTENSION_VERSION)
 		print("Created by James Morris")
 		print("https://github.com/jamesm0rr1s")
 
+		# print how long each part of loading the extension took
+		print("Loaded in %.3f seconds (table model %.3f, main tab %.3f, register with Burp %.3f)" % (registerTime - startTime, tableModelTime - startTime, mainTabTime - tableModelTime, registerTime - mainTabTime))
+
+		# print the memory saved by storing repeated text once
+		print("Deduplicated text saved " + str(self._tableModelShared.textStore.getBytesSaved()) + " bytes")
+
 		# end of BurpExtender
 		return
 
 
+	#
+	# implement IExtensionStateListener - stop the background threads when the extension is unloaded
+	#
+
+	def extensionUnloaded(self):
+
+		# stop adding issues to burp
+		self._scanIssueSubmissionQueue.stop()
+
+		# check if the journal was opened
+		if self._issueJournal != None:
+
+			# close the journal
+			self._issueJournal.close()
+
+		# close the file of default issues
+		self._templatePack.close()
+
+
+	#
+	# implement IScannerListener - add new issues to the index of issues already in burp
+	#
+
+	def newScanIssue(self, issue):
+
+		# add the issue to the index
+		self._scanIssueIndex.addIssue(issue)
+
+
 	#
 	# implement ITab - set tab caption
 	#
@@ -247,11 +383,6 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 			# create text areas
 			self._dictionaryOfTextAreas[longName] = CustomJTextArea("")
 
-			# possible feature for the future, but it crowds everything and does not look as clean
-			# create text editor for requests and responses that includes a search bar
-			# if shortName == "Request" or shortName == "Response":
-			#	self._dictionaryOfTextAreas[longName] = self._callbacks.createTextEditor().getComponent()
-
 			# set row count to keep text areas from resizing when more or less text is displayed
 			self._dictionaryOfTextAreas[longName].setRows(rowHeight)
 
@@ -332,6 +463,12 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 				# set disabled background color
 				self._dictionaryOfTextPanes[longName].setBackground(self._DISABLED_BACKGROUND_COLOR)
 
+		# check if the type is a message editor
+		elif textType == "MessageEditor":
+
+			# create a burp message editor, which only renders the visible part of the message and keeps it as bytes
+			self._dictionaryOfMessageEditors[longName] = self._callbacks.createMessageEditor(self._messageEditorController, editable == "editableY")
+
 		# create panels
 		self._dictionaryOfPanels[longName] = JPanel()
 
@@ -341,8 +478,16 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# set layout for panels
 		self._dictionaryOfPanels[longName].setLayout(BorderLayout())
 
-		# add scroll panes to panels
-		self._dictionaryOfPanels[longName].add(self._dictionaryOfScrollPanes[longName])
+		# check if the type is a message editor
+		if textType == "MessageEditor":
+
+			# add the message editor, which has its own scroll panes, to the panel
+			self._dictionaryOfPanels[longName].add(self._dictionaryOfMessageEditors[longName].getComponent())
+
+		# the type has a scroll pane
+		else:
+			# add scroll panes to panels
+			self._dictionaryOfPanels[longName].add(self._dictionaryOfScrollPanes[longName])
 
 		# return
 		return
@@ -481,11 +626,422 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# create headers for the tables
 		headers = ["Issue Name", "Severity", "Type", "Issue Detail", "Issue Background", "Remediation Detail", "Remediation Background"]
 
-		# create custom default table model
-		self._tableModelShared = CustomDefaultTableModel(None, headers)
+		# create custom table model that stores the columns as arrays, with the severity and issue type stored as ordinals
+		self._tableModelShared = CustomIssueTableModel(headers, [choice.strip() for choice in self._SEVERITY_COMBOBOX_CHOICES], ["Default", "Custom"])
+
+		# create an index of issue fingerprints to the ids of the rows with them, kept next to the table model so duplicate checks and deletes by fingerprint do not have to compare every row
+		self._dictionaryOfIssueFingerprints = dict()
+
+		# create a dictionary of the id of each row to its fingerprint, so a row can be removed from the index without reading its text
+		self._dictionaryOfRowIdFingerprints = dict()
+
+		# set that the fingerprints have not been created yet, so the text of the default issues is not read until an issue is added or deleted
+		self._issueFingerprintsIndexed = False
+
+		# create the pack of default issues from the file of templates bundled next to the extension
+		self._templatePack = DefaultTemplatePack(os.path.dirname(self._callbacks.getExtensionFilename()))
+
+		# try to read the index of the default issues
+		try:
+			# populate the table with the names and severities of the default issues, the rest of the text is loaded from the file when an issue is first selected
+			self._tableModelShared.addLazyRows(self._templatePack, self._templatePack.getIndex())
+
+		# the file of templates could not be read
+		except:
+			# print the error
+			print("Failed to load the default issues from " + self._templatePack.path + ": " + str(sys.exc_info()[1]))
+
+		# return
+		return
+
+
+	#
+	# restore the issue library from the snapshot and journal in the user's home directory, then record each add and delete in the journal
+	#
+
+	def restoreIssueJournal(self):
+
+		# set the journal to none so restoring the issues does not write them to the journal again
+		self._issueJournal = None
+
+		# create the journal
+		issueJournal = CustomIssueJournal(os.path.join(os.path.expanduser("~"), ".add-and-track-custom-issues"), lambda row: self.createIssueFingerprint(row[0], row[1], row[3], row[4], row[5], row[6]).encode("hex"))
+
+		# try to read the snapshot and journal
+		try:
+			listOfAddedRows, dictionaryOfDeletedFingerprints = issueJournal.restore()
+
+		# the snapshot and journal could not be read
+		except:
+			# print the error
+			print("Failed to restore the issue journal, changes will not be saved: " + str(sys.exc_info()[1]))
+
+			# close the journal so its lock is released
+			issueJournal.close()
+
+			# do not continue
+			return
+
+		# check if rows that were not added by the journal, such as default issues, were deleted
+		if len(dictionaryOfDeletedFingerprints) > 0:
+
+			# delete the rows, which are already recorded in the journal
+			self.removeRowsFromTableModel(self.getRowsByFingerprint(self.decodeFingerprints([fingerprint for fingerprint, count in dictionaryOfDeletedFingerprints.iteritems() for index in range(count)])))
+
+		# check if rows were added
+		if len(listOfAddedRows) > 0:
+
+			# add the rows, which were saved in the journal so they do not count as changes since the last export
+			self.addIssuesToTableModel(listOfAddedRows)
+			self._tableUpdatedSinceLastExport = False
+
+		# print the number of issues restored
+		print("Restored " + str(len(listOfAddedRows)) + " issues from " + issueJournal.directory)
+
+		# check if another instance of burp is writing to the journal
+		if issueJournal.readOnly:
+
+			# print that changes will not be saved
+			print("The issue journal is in use by another instance of Burp, changes will not be saved")
+
+			# do not continue
+			return
+
+		# record each add and delete from now on
+		self._issueJournal = issueJournal
+
+		# return
+		return
+
+
+	#
+	# create the fingerprints for the issues in the table the first time they are needed
+	#
+
+	def indexIssueFingerprints(self):
+
+		# check if the fingerprints have already been created
+		if self._issueFingerprintsIndexed:
+			return
+
+		# loop through each row in the table model
+		for row in range(self._tableModelShared.getRowCount()):
+
+			# add the fingerprint of the row to the index
+			self.addIssueFingerprint(self.createIssueFingerprintFromTableModelRow(row), self._tableModelShared.getRowId(row))
+
+		# set that the fingerprints have been created
+		self._issueFingerprintsIndexed = True
+
+		# return
+		return
+
+
+	#
+	# create a fingerprint from the columns that make an issue unique
+	#
+
+	def createIssueFingerprint(self, issueName, severity, issueDetail, issueBackground, remediationDetail, remediationBackground):
+
+		# create a hash for the fingerprint
+		issueHash = hashlib.sha1()
+
+		# loop through each column that makes an issue unique, the issue type is not included
+		for text in [issueName, severity, issueDetail, issueBackground, remediationDetail, remediationBackground]:
+
+			# check if the text is unicode
+			if isinstance(text, unicode):
+
+				# convert the text to bytes before hashing
+				text = text.encode("utf-8")
+
+			# add the text and a separator so text cannot shift from one column into the next
+			issueHash.update(text)
+			issueHash.update("\x00")
+
+		# return the fingerprint
+		return issueHash.digest()
+
+
+	#
+	# create a fingerprint from a row in the table model
+	#
+
+	def createIssueFingerprintFromTableModelRow(self, row):
+
+		# get the values that make an issue unique, the issue type is not included
+		issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground = self._tableModelShared.getRow(row)
+
+		# return the fingerprint
+		return self.createIssueFingerprint(issueName, severity, issueDetail, issueBackground, remediationDetail, remediationBackground)
+
+
+	#
+	# add the fingerprint of a row to the index of issue fingerprints
+	#
+
+	def addIssueFingerprint(self, fingerprint, rowId):
+
+		# add the row to the rows with the fingerprint since the initial issues can contain duplicates
+		self._dictionaryOfIssueFingerprints.setdefault(fingerprint, []).append(rowId)
+		self._dictionaryOfRowIdFingerprints[rowId] = fingerprint
+
+		# return
+		return
+
+
+	#
+	# remove the fingerprint of a row from the index of issue fingerprints and return the fingerprint
+	#
+
+	def removeIssueFingerprint(self, rowId):
+
+		# get the fingerprint of the row
+		fingerprint = self._dictionaryOfRowIdFingerprints.pop(rowId)
+
+		# get the rows with the fingerprint
+		listOfRowIds = self._dictionaryOfIssueFingerprints[fingerprint]
+
+		# check if this is the last row with the fingerprint
+		if len(listOfRowIds) <= 1:
+
+			# remove the fingerprint
+			del self._dictionaryOfIssueFingerprints[fingerprint]
+
+		# there are other rows with the fingerprint
+		else:
+			# remove the row from the rows with the fingerprint
+			listOfRowIds.remove(rowId)
+
+		# return the fingerprint
+		return fingerprint
+
+
+	#
+	# get the rows with the fingerprints in a list, once for each time a fingerprint is in the list, from the bottom of the table up so they can be deleted in order
+	#
+
+	def getRowsByFingerprint(self, listOfFingerprints):
+
+		# create the fingerprints for the issues in the table if they have not been created yet
+		self.indexIssueFingerprints()
+
+		# create a dictionary of the number of times each fingerprint is in the list
+		dictionaryOfFingerprintCounts = dict()
+		for fingerprint in listOfFingerprints:
+			dictionaryOfFingerprintCounts[fingerprint] = dictionaryOfFingerprintCounts.get(fingerprint, 0) + 1
+
+		# create a set of the ids of the rows with the fingerprints
+		setOfRowIds = set()
+
+		# loop through each fingerprint
+		for fingerprint, count in dictionaryOfFingerprintCounts.iteritems():
+
+			# add the ids of up to that many rows with the fingerprint
+			setOfRowIds.update(self._dictionaryOfIssueFingerprints.get(fingerprint, [])[:count])
+
+		# return the rows, which are found by id without reading the text of any row
+		return self._tableModelShared.getRowsOfRowIds(setOfRowIds)
+
+
+	#
+	# get the search index, creating it from every row in the table the first time a search is made
+	#
+
+	def getSearchIndex(self):
+
+		# check if the search index has not been created
+		if self._searchIndex == None:
+
+			# create the search index
+			self._searchIndex = CustomInvertedIndex()
+
+			# loop through each row in the table model
+			for row in range(self._tableModelShared.getRowCount()):
+
+				# add the row to the search index
+				self._searchIndex.addRow(self._tableModelShared.getRowId(row), self._tableModelShared.getSearchableRow(row))
+
+		# return the search index
+		return self._searchIndex
+
+
+	#
+	# get the trigram index of issue names, creating it from every row in the table the first time a search is made
+	#
+
+	def getTrigramIndex(self):
+
+		# check if the trigram index has not been created
+		if self._trigramIndex == None:
+
+			# create the trigram index
+			self._trigramIndex = CustomTrigramIndex()
+
+			# loop through each row in the table model
+			for row in range(self._tableModelShared.getRowCount()):
+
+				# add the issue name of the row to the trigram index
+				self._trigramIndex.addRow(self._tableModelShared.getRowId(row), self._tableModelShared.getValueAt(row, 0))
+
+		# return the trigram index
+		return self._trigramIndex
+
+
+	#
+	# add new rows to the search index and update any searches that are being displayed
+	#
+
+	def addRowsToSearchIndex(self, firstRow, endRow):
+
+		# check if the search index has been created
+		if self._searchIndex != None:
+
+			# loop through each new row
+			for row in range(firstRow, endRow):
+
+				# add the row to the search index
+				self._searchIndex.addRow(self._tableModelShared.getRowId(row), self._tableModelShared.getSearchableRow(row))
+
+		# check if the trigram index has been created
+		if self._trigramIndex != None:
+
+			# loop through each new row
+			for row in range(firstRow, endRow):
+
+				# add the issue name of the row to the trigram index
+				self._trigramIndex.addRow(self._tableModelShared.getRowId(row), self._tableModelShared.getValueAt(row, 0))
+
+		# loop through each tab with a search field
+		for tabName in self._dictionaryOfSearchFields:
+
+			# check if there is a search
+			if self._dictionaryOfSearchFields[tabName].getText().strip() != "":
+
+				# filter the table again so new rows that match the search are displayed
+				self.filterTable(tabName)
+
+		# return
+		return
+
+
+	#
+	# remove a row from the search index before it is deleted from the table model
+	#
+
+	def removeRowFromSearchIndex(self, row):
+
+		# check if the search index has been created
+		if self._searchIndex != None:
+
+			# remove the row from the search index
+			self._searchIndex.removeRow(self._tableModelShared.getRowId(row), self._tableModelShared.getSearchableRow(row))
+
+		# check if the trigram index has been created
+		if self._trigramIndex != None:
+
+			# remove the row from the trigram index
+			self._trigramIndex.removeRow(self._tableModelShared.getRowId(row))
+
+		# return
+		return
+
+
+	#
+	# remove multiple rows from the fingerprint index, the search index, and the issue table model at once, recording them as deleted issues if needed
+	#
+
+	def removeRowsFromTableModel(self, listOfRows, recordDeletions=False):
+
+		# create a list of the fingerprints of the deleted rows
+		listOfDeletedFingerprints = []
+
+		# loop through each row
+		for row in listOfRows:
+
+			# remove the row from the fingerprint index and the search index
+			fingerprint = self.removeIssueFingerprint(self._tableModelShared.getRowId(row))
+			self.removeRowFromSearchIndex(row)
+
+			# check if the row should be recorded as a deleted issue
+			if recordDeletions:
+
+				# record the deleted issue for the next delta export
+				self._tableModelShared.recordDeletion(row, fingerprint.encode("hex"))
+				listOfDeletedFingerprints.append(fingerprint.encode("hex"))
+
+		# check if the journal is open and there are deleted issues
+		if self._issueJournal != None and len(listOfDeletedFingerprints) > 0:
+
+			# record the deleted issues in the journal together
+			self._issueJournal.appendDeletes(listOfDeletedFingerprints)
+
+		# remove the rows from the table model with a single table changed event
+		self._tableModelShared.removeRows(listOfRows)
+
+		# return
+		return
+
+
+	#
+	# filter a table to the rows that match the text in its search field
+	#
+
+	def filterTable(self, tabName):
+
+		# get the search
+		search = self._dictionaryOfSearchFields[tabName].getText()
+
+		# get the rows that match the search
+		matchingRowIds = self.getSearchIndex().search(search)
 
-		# populate the table with initial issues
-		PopulateSharedTableModel(self).populate()
+		# check if this is the issue selection tab, where issue names that are similar to the search are also shown
+		if tabName == self._DIALOG_TAB_2_NAME:
+
+			# create a dictionary of the similar issue names and their scores
+			dictionaryOfScores = None
+
+			# check if the search contains words
+			if matchingRowIds != None:
+
+				# create the dictionary of scores
+				dictionaryOfScores = dict()
+
+				# loop through the issue names that are most similar to the search
+				for score, rowId in self.getTrigramIndex().search(search, self._MAXIMUM_SIMILAR_ISSUE_NAMES):
+
+					# add the row to the rows that match the search
+					matchingRowIds.add(rowId)
+
+					# get the issue name
+					issueName = self._trigramIndex.getIssueName(rowId)
+
+					# keep the highest score for the issue name
+					dictionaryOfScores[issueName] = max(score, dictionaryOfScores.get(issueName, 0))
+
+			# order the table by how well the issue names matched the search
+			self._dictionaryOfTableRowSorters[tabName].setRanking(dictionaryOfScores)
+
+		# check if the search did not contain any words
+		if matchingRowIds == None:
+
+			# show all rows
+			self._dictionaryOfTableRowSorters[tabName].setRowFilter(None)
+
+		# the search contains words
+		else:
+			# only show the rows that match the search
+			self._dictionaryOfTableRowSorters[tabName].setRowFilter(CustomRowFilter(self._tableModelShared, matchingRowIds))
+
+		# check if the selected row was filtered out
+		if self._dictionaryOfTables[tabName].getSelectedRow() == -1:
+
+			# clear the tab
+			self.clearMainTabOrIssueSelectionTab(tabName)
+
+			# clear the last selected row and column
+			self._dictionaryOfLastSelectedRowsAndColumns[tabName + " Row"] = -1
+			self._dictionaryOfLastSelectedRowsAndColumns[tabName + " Column"] = -1
 
 		# return
 		return
@@ -533,8 +1089,8 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# check if main tab
 		if tabName == self._MAIN_TAB_NAME:
 
-			# create a custom grid layout
-			customGridLayout = GridLayout(2, 3)
+			# create a custom grid layout with three buttons per row
+			customGridLayout = GridLayout(0, 3)
 
 			# set vertical gap to help with spacing
 			customGridLayout.setVgap(10)
@@ -617,6 +1173,9 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# create custom table row sorter that can unsort
 		self._dictionaryOfTableRowSorters[tabName] = CustomTableRowSorter(self._dictionaryOfTables[tabName].getModel())
 
+		# sort by severity and by cached sort keys instead of comparing the full text of each cell
+		self._dictionaryOfTableRowSorters[tabName].useSortKeys()
+
 		# set row sorter
 		self._dictionaryOfTables[tabName].setRowSorter(self._dictionaryOfTableRowSorters[tabName])
 
@@ -632,6 +1191,24 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# create scroll pane
 		self._dictionaryOfScrollPanes[tabName] = JScrollPane(self._dictionaryOfTables[tabName])
 
+		# create search field
+		self._dictionaryOfSearchFields[tabName] = JTextField()
+
+		# add listener to search field to filter the table as text is entered
+		self._dictionaryOfSearchFields[tabName].getDocument().addDocumentListener(CustomSearchDocumentListener(self, tabName))
+
+		# create search panel
+		self._dictionaryOfPanels[tabName + " Search"] = JPanel()
+		self._dictionaryOfPanels[tabName + " Search"].setLayout(BorderLayout())
+		self._dictionaryOfPanels[tabName + " Search"].add(JLabel(" Search: "), BorderLayout.WEST)
+		self._dictionaryOfPanels[tabName + " Search"].add(self._dictionaryOfSearchFields[tabName], BorderLayout.CENTER)
+
+		# create table panel with the search panel above the table
+		self._dictionaryOfPanels[tabName + " Table"] = JPanel()
+		self._dictionaryOfPanels[tabName + " Table"].setLayout(BorderLayout())
+		self._dictionaryOfPanels[tabName + " Table"].add(self._dictionaryOfPanels[tabName + " Search"], BorderLayout.NORTH)
+		self._dictionaryOfPanels[tabName + " Table"].add(self._dictionaryOfScrollPanes[tabName], BorderLayout.CENTER)
+
 		##### Bottom Section - Start #####
 
 		# create text areas, scroll panes, and panels
@@ -684,7 +1261,7 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 
 		# set top panel
 		self._dictionaryOfPanels[tabName + " Top"].add(self._dictionaryOfPanels[tabName + " Top North"], BorderLayout.NORTH)
-		self._dictionaryOfPanels[tabName + " Top"].add(self._dictionaryOfScrollPanes[tabName], BorderLayout.CENTER)
+		self._dictionaryOfPanels[tabName + " Top"].add(self._dictionaryOfPanels[tabName + " Table"], BorderLayout.CENTER)
 
 		# set top and bottom of split pane
 		self._dictionaryOfSplitPanes[tabName].setLeftComponent(self._dictionaryOfPanels[tabName + " Top"])
@@ -701,20 +1278,55 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 
 
 	#
-	# create the popup dialog to add a new issue from
+	# create the issue selection tab and the popup dialog the first time the popup dialog is needed
 	#
 
-	def createAddIssueDialog(self, tabName):
+	def createAddIssueDialogIfNeeded(self):
 
-		# create dialog box to add issues manually
-		self._dialogAddIssue = JDialog()
+		# check if the popup dialog has already been created
+		if self._dialogAddIssue != None:
+			return
 
-		# hide dialog box
-		self._dialogAddIssue.setVisible(False)
+		# get the start time
+		startTime = time.time()
 
-		# create panel for dialog box
-		self._panelDialogAddIssueMain = JPanel()
-		self._panelDialogAddIssueMain.setLayout(BorderLayout())
+		# create issue selection tab for popup dialog
+		self.createMainTabOrIssueSelectionTab(self._DIALOG_TAB_2_NAME)
+
+		# create popup dialog to add a new issue
+		self.createAddIssueDialog(self._DIALOG_TAB_1_NAME)
+
+		# customize UI components (recursive on child components) sets highlighted text in tables black instead of white
+		self._callbacks.customizeUiComponent(self._dictionaryOfTables[self._DIALOG_TAB_2_NAME])
+
+		# check if the table has been updated since the last export
+		if self._tableUpdatedSinceLastExport:
+
+			# show warning labels on the new tab
+			self.showWarningLabels()
+
+		# print how long creating the popup dialog took
+		print("Created the popup dialog in %.3f seconds" % (time.time() - startTime))
+
+		# return
+		return
+
+
+	#
+	# create the popup dialog to add a new issue from
+	#
+
+	def createAddIssueDialog(self, tabName):
+
+		# create dialog box to add issues manually
+		self._dialogAddIssue = JDialog()
+
+		# hide dialog box
+		self._dialogAddIssue.setVisible(False)
+
+		# create panel for dialog box
+		self._panelDialogAddIssueMain = JPanel()
+		self._panelDialogAddIssueMain.setLayout(BorderLayout())
 
 		# create top panel for first row of five columns
 		self._panelDialogAddIssueTop = JPanel()
@@ -734,8 +1346,8 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		self.createTextAndScrollPaneAndPanel("TextArea", "editableY", tabName, 4, "Issue Background")
 		self.createTextAndScrollPaneAndPanel("TextArea", "editableY", tabName, 4, "Remediation Detail")
 		self.createTextAndScrollPaneAndPanel("TextArea", "editableY", tabName, 4, "Remediation Background")
-		self.createTextAndScrollPaneAndPanel("TextArea", "editableY", tabName, 6, "Request")
-		self.createTextAndScrollPaneAndPanel("TextArea", "editableY", tabName, 6, "Response")
+		self.createTextAndScrollPaneAndPanel("MessageEditor", "editableY", tabName, 6, "Request")
+		self.createTextAndScrollPaneAndPanel("MessageEditor", "editableY", tabName, 6, "Response")
 
 		# create combo boxes and panels for main tab
 		self.createComboBoxAndPanel(tabName, "Severity")
@@ -790,8 +1402,25 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# create button
 		self._buttonDialogAddIssue = JButton("    " + self._EXTENSION_NAME[:-1] + "    ", actionPerformed=self.buttonActionAddIssue)
 
+		# create check box to add the issue to all selected messages, which is only shown when more than one message was selected
+		self._checkBoxDialogAddToAllSelected = JCheckBox()
+		self._checkBoxDialogAddToAllSelected.setVisible(False)
+
+		# create check box to combine the issues for all selected messages into one issue per host
+		self._checkBoxDialogCombinePerHost = JCheckBox("Combine into one issue per host")
+		self._checkBoxDialogCombinePerHost.setVisible(False)
+
+		# only allow combining when the issue is added to all selected messages
+		self._checkBoxDialogAddToAllSelected.addItemListener(lambda event: self._checkBoxDialogCombinePerHost.setEnabled(self._checkBoxDialogAddToAllSelected.isSelected()))
+
+		# create panel for the button and check boxes
+		panelDialogAddIssueButton = JPanel()
+		panelDialogAddIssueButton.add(self._buttonDialogAddIssue)
+		panelDialogAddIssueButton.add(self._checkBoxDialogAddToAllSelected)
+		panelDialogAddIssueButton.add(self._checkBoxDialogCombinePerHost)
+
 		# add seventh row
-		self.addPanelWithConstraints(0, 10, 2, 1, 0, self._panelDialogAddIssueBottom, self._buttonDialogAddIssue, self._gridBagConstraints)
+		self.addPanelWithConstraints(0, 10, 2, 1, 0, self._panelDialogAddIssueBottom, panelDialogAddIssueButton, self._gridBagConstraints)
 
 		# add top and bottom panels to main panel
 		self._panelDialogAddIssueMain.add(self._panelDialogAddIssueTop, BorderLayout.NORTH)
@@ -821,6 +1450,9 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 
 	def menuActionOpenAddIssueDialog(self, invocation):
 
+		# create the popup dialog if it has not been created yet
+		self.createAddIssueDialogIfNeeded()
+
 		# clear the popup dialog
 		self.clearAddIssueDialog()
 
@@ -854,6 +1486,7 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# no message or issue
 		else:
 			# set to none
+			invocationMessagesOrIssues = []
 			invocationMessagesOrIssue = None
 
 			# set port to default value instead of blank
@@ -864,8 +1497,8 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 			# set http service
 			httpService = invocationMessagesOrIssue.getHttpService()
 		except:
-			# set to blank
-			httpService = ""
+			# set to none
+			httpService = None
 
 		# try to get the protocol
 		try:
@@ -916,19 +1549,19 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 
 		# try to get the request
 		try:
-			# set request
-			request = invocationMessagesOrIssue.getRequest().tostring()
+			# keep the request bytes by reference
+			request = invocationMessagesOrIssue.getRequest()
 		except:
-			# set to blank
-			request = ""
+			# set to none
+			request = None
 
 		# try to get the response
 		try:
-			# set response
-			response = invocationMessagesOrIssue.getResponse().tostring()
+			# keep the response bytes by reference
+			response = invocationMessagesOrIssue.getResponse()
 		except:
-			# set to blank
-			response = ""
+			# set to none
+			response = None
 
 		# loop through each protocol choice for the combo box
 		for protocolChoice in self._PROTOCOL_COMBOBOX_CHOICES:
@@ -946,8 +1579,29 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Port"].setText(port)
 		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Host"].setText(host)
 		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Path"].setText(path)
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Request"].setText(request)
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Response"].setText(response)
+
+		# give the message editors the http service and the original messages
+		self._messageEditorController.setMessage(httpService, request, response)
+
+		# set the message editors
+		self.setMessageEditor(self._DIALOG_TAB_1_NAME + " Request", request, True)
+		self.setMessageEditor(self._DIALOG_TAB_1_NAME + " Response", response, False)
+
+		# check if more than one message or issue was selected
+		if len(invocationMessagesOrIssues) > 1:
+
+			# keep all of the selected messages or issues
+			self._selectedMessagesOrIssues = list(invocationMessagesOrIssues)
+
+			# show the check box to add the issue to all of them
+			self._checkBoxDialogAddToAllSelected.setText("Add to all " + str(len(self._selectedMessagesOrIssues)) + " selected " + ("messages" if invocation.getSelectedMessages() else "issues"))
+			self._checkBoxDialogAddToAllSelected.setSelected(False)
+			self._checkBoxDialogAddToAllSelected.setVisible(True)
+
+			# show the check box to combine them into one issue per host
+			self._checkBoxDialogCombinePerHost.setSelected(False)
+			self._checkBoxDialogCombinePerHost.setEnabled(False)
+			self._checkBoxDialogCombinePerHost.setVisible(True)
 
 		# return
 		return
@@ -959,6 +1613,9 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 
 	def buttonActionOpenAddIssueDialog(self, tabName):
 
+		# create the popup dialog if it has not been created yet
+		self.createAddIssueDialogIfNeeded()
+
 		# get the selected row
 		selectedRow = self._dictionaryOfTables[tabName].getSelectedRow()
 
@@ -1043,79 +1700,162 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		return
 
 
+	#
+	# convert text to unicode so the table model and the fingerprints always see the same value
+	#
+
+	def convertTextToUnicode(self, text):
+
+		# check if the text is already unicode
+		if isinstance(text, unicode):
+
+			# return the text
+			return text
+
+		# try to decode the text as utf-8
+		try:
+			# return the decoded text
+			return text.decode("utf-8")
+
+		# text is not utf-8, which can happen with csv files saved from other programs
+		except UnicodeDecodeError:
+			# return the text decoded as latin-1 since every byte is valid
+			return text.decode("latin-1")
+
+
 	#
 	# add the manually created issue or the imported issue to the issue table model
 	#
 
 	def addIssueToTableModel(self, issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground):
 
-		# create unique string from new issue
-		newIssue = "0: " + issueName + "1: " + severity + "3: " + issueDetail + "4: " + issueBackground + "5: " + remediationDetail + "6: " + remediationBackground
+		# add the issue as a batch of one
+		return self.addIssuesToTableModel([[issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground]])
 
-		# set a variable to determine if the new issue is already in the table of issues
-		issueNotInTable = True
 
-		# get row and column counts 
-		rowCount = self._tableModelShared.getRowCount()
-		columnCount = self._tableModelShared.getColumnCount()
+	#
+	# add a batch of issues to the issue table model with a single table update
+	#
 
-		# loop through each row in the table model
-		for row in range(rowCount):
+	def addIssuesToTableModel(self, listOfIssues):
 
-			# create unique string from issue in current row
-			rowIssue = ""
+		# create the fingerprints for the issues already in the table if they have not been created yet
+		self.indexIssueFingerprints()
 
-			# loop through each column in the row
-			for column in range(columnCount):
+		# create a list of rows that are not already in the table and their fingerprints
+		newRows = []
+		newFingerprints = []
+		setOfNewFingerprints = set()
 
-				# check if third column
-				if column == 2:
+		# loop through each issue
+		for issue in listOfIssues:
 
-					# do not include issue type in unique name
-					continue
+			# convert each column to unicode
+			issue = [self.convertTextToUnicode(text) for text in issue]
 
-				# add column to row issue
-				rowIssue += str(column) + ": " + self._tableModelShared.getValueAt(row, column)
+			# get the values that make an issue unique
+			issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground = issue
 
-			# check if the row issue matches the new issue
-			if rowIssue == newIssue:
+			# create fingerprint from new issue
+			newIssueFingerprint = self.createIssueFingerprint(issueName, severity, issueDetail, issueBackground, remediationDetail, remediationBackground)
 
-				# new issue is in the issue table
-				issueNotInTable = False
+			# check if the new issue is already in the table of issues or earlier in the batch
+			if newIssueFingerprint in self._dictionaryOfIssueFingerprints or newIssueFingerprint in setOfNewFingerprints:
 
-				# do not continue looping
-				break
+				# skip the duplicate
+				continue
 
-		# check if the new issue is not in the issue table
-		if issueNotInTable:
+			# add the new issue to the rows to add
+			newRows.append(issue)
+			newFingerprints.append(newIssueFingerprint)
+			setOfNewFingerprints.add(newIssueFingerprint)
 
-			# add new issue to issue table
-			self._tableModelShared.addRow([issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground])
+		# check if there are no new issues
+		if len(newRows) == 0:
 
-			# show warning labels that table has been modified since last export
-			self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 1"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
-			self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 2"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
-			self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 1"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
-			self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 2"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
+			# return that no issues were added
+			return 0
 
-			# get the currently selected rows
-			selectedRowMainTab = self._dictionaryOfTables[self._MAIN_TAB_NAME].getSelectedRow()
-			selectedRowIssueSelectionTab = self._dictionaryOfTables[self._DIALOG_TAB_2_NAME].getSelectedRow()
+		# get the index of the first new row
+		firstNewRow = self._tableModelShared.getRowCount()
 
-			# check if a row has been selected
-			if selectedRowMainTab != -1:
+		# add new issues to issue table with a single table update and resort
+		self._tableModelShared.addRows(newRows)
 
-				# update the last selected row in case importing causes last selected row to stay at one index but highlighted row goes down a row
-				self._dictionaryOfLastSelectedRowsAndColumns[self._MAIN_TAB_NAME + " Row"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].convertRowIndexToModel(selectedRowMainTab)
+		# loop through the fingerprints of the new issues
+		for offset, newIssueFingerprint in enumerate(newFingerprints):
+
+			# add the fingerprint of the new issue to the index
+			self.addIssueFingerprint(newIssueFingerprint, self._tableModelShared.getRowId(firstNewRow + offset))
+
+		# check if the journal is open
+		if self._issueJournal != None:
+
+			# record the new issues in the journal
+			self._issueJournal.appendAdds(newRows)
+
+		# add the new issues to the search index
+		self.addRowsToSearchIndex(firstNewRow, self._tableModelShared.getRowCount())
+
+		# show warning labels that table has been modified since last export
+		self.showWarningLabels()
+
+		# loop through the tabs that have been created
+		for tabName in self._dictionaryOfTables:
+
+			# get the currently selected row
+			selectedRow = self._dictionaryOfTables[tabName].getSelectedRow()
 
 			# check if a row has been selected
-			if selectedRowIssueSelectionTab != -1:
+			if selectedRow != -1:
 
 				# update the last selected row in case importing causes last selected row to stay at one index but highlighted row goes down a row
-				self._dictionaryOfLastSelectedRowsAndColumns[self._DIALOG_TAB_2_NAME + " Row"] = self._dictionaryOfTables[self._DIALOG_TAB_2_NAME].convertRowIndexToModel(selectedRowIssueSelectionTab)
+				self._dictionaryOfLastSelectedRowsAndColumns[tabName + " Row"] = self._dictionaryOfTables[tabName].convertRowIndexToModel(selectedRow)
 
-		# return
-		return
+		# return the number of issues that were added
+		return len(newRows)
+
+
+	#
+	# create an issue from a row in a csv file
+	#
+
+	def createIssueFromCsvRow(self, row):
+
+		# check if the row does not have a value for every column
+		if len(row) < 7:
+
+			# return that the row is not a valid issue
+			return None
+
+		# return the issue name, severity, issue type, issue detail, issue background, remediation detail, and remediation background
+		return row[:7]
+
+
+	#
+	# create an issue from an object in a json file
+	#
+
+	def createIssueFromJson(self, tempJson):
+
+		# try to get values to create new row in table
+		try:
+			# get values to create new row in table
+			issueName = tempJson["Issue Name"]
+			severity = tempJson["Severity"]
+			issueType = tempJson["Issue Type"]
+			issueDetail = tempJson["Issue Details"]
+			issueBackground = tempJson["Issue Background"]
+			remediationDetail = tempJson["Remediation Details"]
+			remediationBackground = tempJson["Remediation Background"]
+
+		# object is missing a value or is not an object
+		except (KeyError, TypeError):
+			# return that the object is not a valid issue
+			return None
+
+		# return the issue
+		return [issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground]
 
 
 	#
@@ -1137,8 +1877,8 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		issueBackground = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Background"].getText()
 		remediationDetail = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Remediation Detail"].getText()
 		remediationBackground = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Remediation Background"].getText()
-		request = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Request"].getText()
-		response = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Response"].getText()
+		request = self.getMessageBytes(self._DIALOG_TAB_1_NAME + " Request")
+		response = self.getMessageBytes(self._DIALOG_TAB_1_NAME + " Response")
 
 		# check if there is a value in the port field
 		if port != "":
@@ -1209,6 +1949,33 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 			# do not continue
 			return
 
+		# set if the issue should be added to all of the selected messages or issues
+		addToAllSelected = self._checkBoxDialogAddToAllSelected.isVisible() and self._checkBoxDialogAddToAllSelected.isSelected()
+
+		# check if the issue is only being added to one location and the issues already in burp are still being loaded
+		if not addToAllSelected and not self._scanIssueIndex.isSeeded():
+
+			# ask if the issue should be added without checking for a duplicate
+			dialogOption = JOptionPane.showConfirmDialog(self._dialogAddIssue, "The issues already in Burp are still loading, so this issue cannot be checked for duplicates yet.\nAdd it anyway?", "Duplicate Issue", JOptionPane.YES_NO_OPTION)
+
+			# check if the user did not choose to add the issue
+			if dialogOption != JOptionPane.YES_OPTION:
+
+				# do not continue
+				return
+
+		# check if the issue is only being added to one location and burp already has the same issue there
+		elif not addToAllSelected and self._scanIssueIndex.containsIssue(protocol, host, port, path, issueName, severity):
+
+			# ask if the issue should be added anyway
+			dialogOption = JOptionPane.showConfirmDialog(self._dialogAddIssue, "Burp already has a " + severity + " issue named \"" + issueName + "\" at this location.\nAdd it anyway?", "Duplicate Issue", JOptionPane.YES_NO_OPTION)
+
+			# check if the user did not choose to add the issue
+			if dialogOption != JOptionPane.YES_OPTION:
+
+				# do not continue
+				return
+
 		# hide dialog box
 		self._dialogAddIssue.setVisible(False)
 
@@ -1221,6 +1988,38 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		remediationDetail = remediationDetail.replace("\n", "<br>")
 		remediationBackground = remediationBackground.replace("\n", "<br>")
 
+		# check if the issue should be added to all of the selected messages or issues
+		if addToAllSelected:
+
+			# get the selected messages or issues and if they should be combined before the dialog is cleared
+			messagesOrIssues = self._selectedMessagesOrIssues
+			combinePerHost = self._checkBoxDialogCombinePerHost.isSelected()
+
+			# clear the popup dialog
+			self.clearAddIssueDialog()
+
+			# create and add an issue for each message or issue on a background thread
+			self.startImportExportTask("Bulk Add", lambda task: self.bulkAddIssueInBackground(task, messagesOrIssues, combinePerHost, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail))
+
+			# do not continue
+			return
+
+		# create the issue and add it to burp on the background thread
+		self._scanIssueSubmissionQueue.submit(self.createCustomScanIssue, (protocol, host, port, path, request, response, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail))
+
+		# clear the popup dialog
+		self.clearAddIssueDialog()
+
+		# return
+		return
+
+
+	#
+	# create an issue from the values in the popup dialog
+	#
+
+	def createCustomScanIssue(self, protocol, host, port, path, request, response, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail):
+
 		# create http service
 		httpService = CustomIHttpService(protocol, host, port)
 
@@ -1235,18 +2034,303 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		url = URL(protocol + "://" + host + ":" + unicode(port) + path)
 
 		# create new issue
-		issue = CustomScanIssue(httpService, url, httpMessages, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail)
+		return CustomScanIssue(httpService, url, httpMessages, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail)
 
-		# add new issue
-		self._callbacks.addScanIssue(issue)
 
-		# clear the popup dialog
-		self.clearAddIssueDialog()
+	#
+	# set the message of the request or response message editor and keep the original bytes
+	#
+
+	def setMessageEditor(self, longName, message, isRequest):
+
+		# keep the original bytes
+		self._dictionaryOfMessageBytes[longName] = message
+
+		# set the message, or a blank message if there is none
+		self._dictionaryOfMessageEditors[longName].setMessage(message or self._helpers.stringToBytes(""), isRequest)
+
+		# return
+		return
+
+
+	#
+	# get the bytes of the request or response, using the original bytes if the message was not edited
+	#
+
+	def getMessageBytes(self, longName):
+
+		# get the original bytes
+		originalBytes = self._dictionaryOfMessageBytes.get(longName)
+
+		# check if there are original bytes and the message was not edited
+		if originalBytes != None and not self._dictionaryOfMessageEditors[longName].isMessageModified():
+
+			# return the original bytes so binary and non-UTF-8 bodies are unchanged
+			return originalBytes
+
+		# return the edited message
+		return self._dictionaryOfMessageEditors[longName].getMessage()
+
+
+	#
+	# create an issue for each selected message or issue, or one issue per host if they are combined, and add them to burp on the background thread
+	#
+
+	def bulkAddIssueInBackground(self, task, messagesOrIssues, combinePerHost, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail):
+
+		# create a batch of issues
+		batchOfIssues = []
+
+		# wait until the index of issues already in burp has been seeded so duplicates can be skipped
+		self._scanIssueIndex.waitUntilSeeded()
+
+		# create a set of the keys of the issues created, so messages for the same location are only added once
+		setOfKeys = set()
+
+		# create a dictionary of each host to its http service, affected urls, and http messages when combining issues
+		dictionaryOfHosts = OrderedDict()
+
+		# loop through each message or issue
+		for index, messageOrIssue in enumerate(messagesOrIssues):
+
+			# check if the task was cancelled
+			if task.isCancelled():
+				break
+
+			# try to create the issue
+			try:
+				# check if this is an issue
+				if isinstance(messageOrIssue, IScanIssue):
+
+					# use the http service, url, and messages of the issue
+					httpService = messageOrIssue.getHttpService()
+					url = messageOrIssue.getUrl()
+					httpMessages = messageOrIssue.getHttpMessages()
+
+				# this is a message
+				else:
+					# get the http service and url of the message
+					httpService = messageOrIssue.getHttpService()
+					url = self._helpers.analyzeRequest(httpService, messageOrIssue.getRequest()).getUrl()
+
+					# create array of http messages with the request and response bytes by reference
+					httpMessages = [CustomIHttpRequestResponse(None, None, httpService, messageOrIssue.getRequest(), messageOrIssue.getResponse())]
+
+				# check if the issues are combined per host
+				if combinePerHost:
+
+					# add the url and http messages to the host
+					self.addToCombinedHost(dictionaryOfHosts, httpService, url, httpMessages)
+
+					# add to the count of messages read
+					task.rowsRead += 1
+
+					# update the progress
+					task.setProgress(index + 1, len(messagesOrIssues))
+
+					# do not create an issue for the message
+					continue
+
+				# create new issue
+				issue = CustomScanIssue(httpService, url, httpMessages, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail)
+
+				# get the key of the issue
+				key = self._scanIssueIndex.createKey(url, issueName, severity)
+
+				# check if burp already has the issue or it was already created for another message
+				if key in setOfKeys or self._scanIssueIndex.containsKey(key):
+
+					# add to the count of duplicates
+					task.rowsDuplicate += 1
+
+				# the issue is new
+				else:
+					# add the issue to the batch
+					setOfKeys.add(key)
+					batchOfIssues.append(issue)
+
+			# the message or issue did not have a request or http service
+			except:
+				# add to the count of skipped messages
+				task.rowsInvalid += 1
+
+			# add to the count of messages read
+			task.rowsRead += 1
+
+			# check if the batch is full or this is the last message
+			if len(batchOfIssues) >= task.batchSize or index == len(messagesOrIssues) - 1:
+
+				# add the batch of issues to burp
+				self.addScanIssues(batchOfIssues)
+
+				# update the count of issues submitted
+				task.rowsWritten += len(batchOfIssues)
+				batchOfIssues = []
+
+			# update the progress
+			task.setProgress(index + 1, len(messagesOrIssues))
+
+		# add any issues left after cancelling
+		self.addScanIssues(batchOfIssues)
+		task.rowsWritten += len(batchOfIssues)
+
+		# check if the issues are combined per host and the task was not cancelled
+		if combinePerHost and not task.isCancelled():
+
+			# loop through each host
+			for httpService, urls, httpMessages in dictionaryOfHosts.itervalues():
+
+				# create the url of the root of the host
+				url = URL(httpService.getProtocol(), httpService.getHost(), httpService.getPort(), "/")
+
+				# get the key of the issue
+				key = self._scanIssueIndex.createKey(url, issueName, severity)
+
+				# check if burp already has the issue for the host
+				if self._scanIssueIndex.containsKey(key):
+
+					# add to the count of duplicates
+					task.rowsDuplicate += 1
+
+					# do not add the issue
+					continue
+
+				# list the affected urls after the issue detail
+				combinedIssueDetail = issueDetail + ("<br><br>" if issueDetail else "") + "Affected URLs:<br>" + "<br>".join(cgi.escape(affectedUrl) for affectedUrl in urls)
+
+				# create one issue with the http messages of every affected url
+				batchOfIssues.append(CustomScanIssue(httpService, url, httpMessages, issueName, combinedIssueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail))
+
+			# add the combined issues to burp
+			self.addScanIssues(batchOfIssues)
+			task.rowsWritten += len(batchOfIssues)
+
+
+	#
+	# add the url and http messages of a message or issue to its host when combining issues per host
+	#
+
+	def addToCombinedHost(self, dictionaryOfHosts, httpService, url, httpMessages):
+
+		# create the key of the host
+		hostKey = (httpService.getProtocol().lower(), httpService.getHost().lower(), httpService.getPort())
+
+		# get the http service, affected urls, and http messages of the host
+		host = dictionaryOfHosts.get(hostKey)
+
+		# check if this is the first message for the host
+		if host == None:
+
+			# add the host with an ordered set of urls so each url is listed once
+			host = (httpService, OrderedDict(), [])
+			dictionaryOfHosts[hostKey] = host
+
+		# add the url and http messages
+		host[1][unicode(url)] = None
+		host[2].extend(httpMessages)
+
+
+	#
+	# add issues to burp on the background thread of the submission queue
+	#
+
+	def addScanIssues(self, issues):
+
+		# loop through each issue
+		for issue in issues:
+
+			# add the issue to the queue, which waits while too many bulk issues are waiting so a bulk add does not get far ahead of burp
+			self._scanIssueSubmissionQueue.submitBulkIssue(issue)
+
+		# return
+		return
+
+
+	#
+	# delete a row from the issue table model and record the deletion
+	#
+
+	def deleteIssueFromTableModel(self, row):
+
+		# remove the fingerprint of the row from the index
+		fingerprint = self.removeIssueFingerprint(self._tableModelShared.getRowId(row))
+
+		# check if the journal is open
+		if self._issueJournal != None:
+
+			# record the deleted issue in the journal
+			self._issueJournal.appendDelete(fingerprint.encode("hex"))
+
+		# record the deleted issue for the next delta export
+		self._tableModelShared.recordDeletion(row, fingerprint.encode("hex"))
+
+		# remove the row from the search index
+		self.removeRowFromSearchIndex(row)
+
+		# delete the row
+		self._tableModelShared.removeRow(row)
 
 		# return
 		return
 
 
+	#
+	# convert fingerprints from hex, skipping any that are not valid
+	#
+
+	def decodeFingerprints(self, listOfFingerprints):
+
+		# create a list of the converted fingerprints
+		listOfDecodedFingerprints = []
+
+		# loop through each fingerprint
+		for fingerprint in listOfFingerprints:
+
+			# try to convert the fingerprint from hex
+			try:
+				listOfDecodedFingerprints.append(str(fingerprint).decode("hex"))
+
+			# the fingerprint is not valid
+			except:
+				# skip the fingerprint
+				continue
+
+		# return the converted fingerprints
+		return listOfDecodedFingerprints
+
+
+	#
+	# delete the rows whose fingerprints are in a list, such as the deleted issues in a delta, and return the number of rows deleted
+	#
+
+	def deleteIssuesByFingerprint(self, listOfFingerprints):
+
+		# get the rows with the fingerprints
+		listOfRows = self.getRowsByFingerprint(self.decodeFingerprints(listOfFingerprints))
+
+		# check if there are no rows to delete
+		if len(listOfRows) == 0:
+
+			# return that no rows were deleted
+			return 0
+
+		# delete the rows
+		self.removeRowsFromTableModel(listOfRows, True)
+
+		# loop through the tabs that have been created
+		for tabName in self._dictionaryOfTables:
+
+			# clear the tab and the selected row since the selected row may have been deleted
+			self.clearMainTabOrIssueSelectionTab(tabName)
+			self._dictionaryOfTables[tabName].getSelectionModel().clearSelection()
+
+		# show warning labels that table has been modified since last export
+		self.showWarningLabels()
+
+		# return the number of rows deleted
+		return len(listOfRows)
+
+
 	#
 	# delete an issue from the table
 	#
@@ -1262,15 +2346,23 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 			# get index of selected row accounting for sorting
 			modelRowIndex = self._dictionaryOfTables[self._MAIN_TAB_NAME].getRowSorter().convertRowIndexToModel(selectedRow)
 
+			# create the fingerprints for the issues in the table if they have not been created yet
+			self.indexIssueFingerprints()
+
 			# delete the selected row
-			self._dictionaryOfTables[self._MAIN_TAB_NAME].getModel().removeRow(modelRowIndex)
+			self.deleteIssueFromTableModel(modelRowIndex)
 
-			# clear both tabs
+			# clear the main tab
 			self.clearMainTabOrIssueSelectionTab(self._MAIN_TAB_NAME)
-			self.clearMainTabOrIssueSelectionTab(self._DIALOG_TAB_2_NAME)
 
-			# clear the selected row in the issue selection tab
-			self._dictionaryOfTables[self._DIALOG_TAB_2_NAME].getSelectionModel().clearSelection()
+			# check if the issue selection tab has been created
+			if self._DIALOG_TAB_2_NAME in self._dictionaryOfTables:
+
+				# clear the issue selection tab
+				self.clearMainTabOrIssueSelectionTab(self._DIALOG_TAB_2_NAME)
+
+				# clear the selected row in the issue selection tab
+				self._dictionaryOfTables[self._DIALOG_TAB_2_NAME].getSelectionModel().clearSelection()
 
 			# check if the last row remaining in the table was deleted
 			if selectedRow == 0 and self._dictionaryOfTables[self._MAIN_TAB_NAME].getRowCount() == 0:
@@ -1302,10 +2394,7 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 			self._allowTableRowToBeUnselected = True
 
 			# show warning labels that table has been modified since last export
-			self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 1"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
-			self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 2"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
-			self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 1"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
-			self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 2"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
+			self.showWarningLabels()
 
 		# return
 		return
@@ -1315,7 +2404,7 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 	# create dialog box for import and export
 	#
 
-	def createDialogBoxForImportExport(self, dialogTitle, extensionFilter, buttonText):
+	def createDialogBoxForImportExport(self, dialogTitle, extensionFilter, buttonText, compressedExtensionFilter=None):
 
 		# create frame
 		frameImportExportDialogBox = JFrame()
@@ -1342,6 +2431,15 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# set extension filter
 		fileChooserImportExportDialogBox.setFileFilter(filterImportExportDialogBox)
 
+		# check if the file can also be gzip compressed
+		if compressedExtensionFilter != None:
+
+			# create the compressed extension filter, which matches the whole double extension such as .csv.gz
+			compressedFilterImportExportDialogBox = CustomFileNameSuffixFilter(compressedExtensionFilter[0], compressedExtensionFilter[2])
+
+			# add the compressed extension filter as a choice after the plain extension filter
+			fileChooserImportExportDialogBox.addChoosableFileFilter(compressedFilterImportExportDialogBox)
+
 		# show dialog box and get value
 		valueFileChooserImportExportDialogBox = fileChooserImportExportDialogBox.showDialog(frameImportExportDialogBox, buttonText)
 
@@ -1366,15 +2464,148 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# check if file does not have an extention
 		if fileExtensionImportExportDialogBox == "":
 
-			# add extension to file
-			fileChosenImportExportDialogBox = fileChosenImportExportDialogBox + extensionFilter[2]
+			# check if the compressed extension filter was chosen
+			if compressedExtensionFilter != None and fileChooserImportExportDialogBox.getFileFilter() == compressedFilterImportExportDialogBox:
+
+				# add compressed extension to file
+				fileChosenImportExportDialogBox = fileChosenImportExportDialogBox + compressedExtensionFilter[2]
+
+			# the plain extension filter was chosen
+			else:
+				# add extension to file
+				fileChosenImportExportDialogBox = fileChosenImportExportDialogBox + extensionFilter[2]
 
 		# return dialog box value and path/file
 		return True, fileChosenImportExportDialogBox
 
 
 	#
-	# export issues from the table to a CSV file
+	# show the warning labels that the table has been modified since the last export
+	#
+
+	def showWarningLabels(self):
+
+		# set that the table has been updated since the last export
+		self._tableUpdatedSinceLastExport = True
+
+		# loop through the tabs that have been created
+		for tabName in self._dictionaryOfTables:
+
+			# show warning labels that table has been modified since last export
+			self._dictionaryOfLabels[tabName + " 1"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
+			self._dictionaryOfLabels[tabName + " 2"].setText(self._WARNING_MESSAGE_TABLE_UPDATED)
+
+		# return
+		return
+
+
+	#
+	# hide the warning labels that the table has been modified since the last export
+	#
+
+	def hideWarningLabels(self):
+
+		# set that the table has not been updated since the last export
+		self._tableUpdatedSinceLastExport = False
+
+		# loop through the tabs that have been created
+		for tabName in self._dictionaryOfTables:
+
+			# hide warning labels that table has been modified since last export
+			self._dictionaryOfLabels[tabName + " 1"].setText(" ")
+			self._dictionaryOfLabels[tabName + " 2"].setText(" ")
+
+		# return
+		return
+
+
+	#
+	# set the generation the last export was taken at once an export has finished
+	#
+
+	def finishExport(self, exportGeneration):
+
+		# set the generation of the last export
+		self._lastExportGeneration = exportGeneration
+
+		# drop the deleted issues that were exported
+		self._tableModelShared.discardDeletionsBefore(exportGeneration)
+
+		# hide warning labels that table has been modified since last export
+		self.hideWarningLabels()
+
+		# return
+		return
+
+
+	#
+	# get a copy of the rows in the order they are displayed in the main tab so they can be exported on a background thread
+	#
+
+	def getRowsForExport(self):
+
+		# create a list of rows
+		listOfRows = []
+
+		# get the main tab table
+		table = self._dictionaryOfTables[self._MAIN_TAB_NAME]
+
+		# loop through the table
+		for i in range(0, table.getRowCount()):
+
+			# get index of row accounting for sorting
+			modelRowIndex = table.convertRowIndexToModel(i)
+
+			# add the values from each column
+			listOfRows.append(self._tableModelShared.getRow(modelRowIndex))
+
+		# return the rows
+		return listOfRows
+
+
+	#
+	# open a file to import or export, which is streamed through gzip if the file name ends in .gz
+	#
+
+	def openFileForImportExport(self, fileImportExport, mode):
+
+		# check if the file is gzip compressed
+		if fileImportExport.lower().endswith(".gz"):
+
+			# open the file so it is compressed or decompressed as it is written or read
+			return gzip.open(fileImportExport, mode, 6)
+
+		# open the file with a large buffer
+		return open(fileImportExport, mode, 65536)
+
+
+	#
+	# run an import or export on a background thread so the Burp UI does not hang
+	#
+
+	def startImportExportTask(self, taskType, work, onSuccess=None):
+
+		# check if an import or export is already running
+		if self._importExportTask != None:
+
+			# display message that only one import or export can run at a time
+			JOptionPane.showMessageDialog(None, "An import, export, or bulk add is already running.", self._EXTENSION_NAME, JOptionPane.INFORMATION_MESSAGE)
+
+			# do not continue
+			return
+
+		# create the task
+		self._importExportTask = CustomImportExportTask(self, taskType, work, onSuccess)
+
+		# start the task
+		self._importExportTask.start()
+
+		# return
+		return
+
+
+	#
+	# export issues from the table to a CSV file
 	#
 
 	def buttonClickedExportCsv(self):
@@ -1382,47 +2613,59 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# set dialog options
 		dialogBoxTitle = "Export CSV File"
 		dialogBoxExtensionFilter = ["CSV Files (*.csv)", ["csv"], ".csv"]
+		dialogBoxCompressedExtensionFilter = ["Gzip Compressed CSV Files (*.csv.gz)", ["gz"], ".csv.gz"]
 		dialogBoxButtonText = "Export"
 
 		# get the selected file
-		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText, dialogBoxCompressedExtensionFilter)
 
 		# return if user exited dialog box
 		if fileChosen == False:
 			return
 
+		# get the rows while on the Swing event thread
+		listOfRows = self.getRowsForExport()
+
+		# start a new generation so changes made from now on are in the next delta
+		exportGeneration = self._tableModelShared.startGeneration()
+
+		# write the file on a background thread
+		self.startImportExportTask("Export", lambda task: self.exportCsvInBackground(task, fileImportExport, listOfRows), lambda: self.finishExport(exportGeneration))
+
+		# return
+		return
+
+
+	#
+	# write issues to a CSV file from a background thread
+	#
+
+	def exportCsvInBackground(self, task, fileImportExport, listOfRows):
+
 		# open the file
-		with open(fileImportExport, "wb") as csvFile:
+		with self.openFileForImportExport(fileImportExport, "wb") as csvFile:
 
 			# create csv writer
 			csvWriter = csv.writer(csvFile, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
 
-			# get the table size
-			tableSize = self._dictionaryOfTables[self._MAIN_TAB_NAME].getRowCount()
+			# loop through the rows
+			for csvRow in listOfRows:
 
-			# loop through the table
-			for i in range(0, tableSize):
+				# check if the export was cancelled
+				if task.isCancelled():
+					break
 
-				# create export variables for each row
-				issueName = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 0)
-				severity = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 1)
-				issueType = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 2)
-				issueDetails = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 3)
-				issueBackground = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 4)
-				remediationDetails = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 5)
-				remediationBackground = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 6)
+				# write row to file encoded as utf-8 since the csv module does not write unicode
+				csvWriter.writerow([self.convertTextToUnicode(text).encode("utf-8") for text in csvRow])
 
-				# create a row to add
-				csvRow = [issueName, severity, issueType, issueDetails, issueBackground, remediationDetails, remediationBackground]
+				# update the progress
+				task.addRowWritten(len(listOfRows))
 
-				# write row to file
-				csvWriter.writerow(csvRow)
+		# check if the export was cancelled
+		if task.isCancelled():
 
-		# hide warning labels that table has been modified since last export
-		self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 1"].setText(" ")
-		self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 2"].setText(" ")
-		self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 1"].setText(" ")
-		self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 2"].setText(" ")
+			# remove the partially written file
+			os.remove(fileImportExport)
 
 		# return
 		return
@@ -1437,38 +2680,50 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# set dialog options
 		dialogBoxTitle = "Import CSV File"
 		dialogBoxExtensionFilter = ["CSV Files (*.csv)", ["csv"], ".csv"]
+		dialogBoxCompressedExtensionFilter = ["Gzip Compressed CSV Files (*.csv.gz)", ["gz"], ".csv.gz"]
 		dialogBoxButtonText = "Import"
 
 		# get the selected file
-		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText, dialogBoxCompressedExtensionFilter)
 
 		# return if user exited dialog box
 		if fileChosen == False:
 			return
 
+		# read the file on a background thread
+		self.startImportExportTask("Import", lambda task: self.importCsvInBackground(task, fileImportExport))
+
+		# return
+		return
+
+
+	#
+	# read issues from a CSV file on a background thread
+	#
+
+	def importCsvInBackground(self, task, fileImportExport):
+
 		# set the limit to the max size
 		csv.field_size_limit(sys.maxsize)
 
+		# get the file size for the progress bar
+		fileSize = os.path.getsize(fileImportExport)
+
 		# open the file
-		with open(fileImportExport, "r") as csvFile:
+		with self.openFileForImportExport(fileImportExport, "rb") as csvFile:
 
-			# read the csv
-			csvReader = csv.reader(csvFile, delimiter=',', quotechar='"')
+			# read the csv while tracking how much of the file has been read
+			csvReader = csv.reader(task.readLinesWithProgress(csvFile, fileSize), delimiter=',', quotechar='"')
 
 			# loop through each row in the csv file
 			for row in csvReader:
 
-				# get data from each row
-				issueName = row[0]
-				severity = row[1]
-				issueType = row[2]
-				issueDetail = row[3]
-				issueBackground = row[4]
-				remediationDetail = row[5]
-				remediationBackground = row[6]
+				# check if the import was cancelled
+				if task.isCancelled():
+					break
 
-				# add issue to the table model
-				self.addIssueToTableModel(issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground)
+				# get data from each row and hand it to the table model in batches
+				task.addIssue(self.createIssueFromCsvRow(row))
 
 		# return
 		return
@@ -1483,53 +2738,98 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# set dialog options
 		dialogBoxTitle = "Export JSON File"
 		dialogBoxExtensionFilter = ["JSON Files (*.json)", ["json"], ".json"]
+		dialogBoxCompressedExtensionFilter = ["Gzip Compressed JSON Files (*.json.gz)", ["gz"], ".json.gz"]
 		dialogBoxButtonText = "Export"
 
 		# get the selected file
-		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText, dialogBoxCompressedExtensionFilter)
 
 		# return if user exited dialog box
 		if fileChosen == False:
 			return
 
+		# get the rows while on the Swing event thread
+		listOfRows = self.getRowsForExport()
+
+		# start a new generation so changes made from now on are in the next delta
+		exportGeneration = self._tableModelShared.startGeneration()
+
+		# write the file on a background thread
+		self.startImportExportTask("Export", lambda task: self.exportJsonInBackground(task, fileImportExport, listOfRows), lambda: self.finishExport(exportGeneration))
+
+		# return
+		return
+
+
+	#
+	# create a json object from a row in the table
+	#
+
+	def createJsonFromIssue(self, row):
+
+		# create a temp json for the row that keeps the keys in column order
+		tempJson = OrderedDict()
+
+		# create temp variables for the row
+		tempJson["Issue Name"] = self.convertTextToUnicode(row[0])
+		tempJson["Severity"] = self.convertTextToUnicode(row[1])
+		tempJson["Issue Type"] = self.convertTextToUnicode(row[2])
+		tempJson["Issue Details"] = self.convertTextToUnicode(row[3])
+		tempJson["Issue Background"] = self.convertTextToUnicode(row[4])
+		tempJson["Remediation Details"] = self.convertTextToUnicode(row[5])
+		tempJson["Remediation Background"] = self.convertTextToUnicode(row[6])
+
+		# return the json
+		return tempJson
+
+
+	#
+	# write issues to a JSON file from a background thread one issue at a time
+	#
+
+	def exportJsonInBackground(self, task, fileImportExport, listOfRows):
+
 		# open the file
-		with open(fileImportExport, "w") as jsonFile:
+		with self.openFileForImportExport(fileImportExport, "wb") as jsonFile:
 
-			# create a json dictionary
-			jsonDictionaryIssues = {}
+			# write the start of the json dictionary and the array for the issues, formatted the same as json.dumps with an indent of 4
+			jsonFile.write("{\n    \"Issues\": [")
 
-			# create an array for the issues
-			jsonDictionaryIssues["Issues"] = []
+			# loop through the rows
+			for index, row in enumerate(listOfRows):
 
-			# get the table size
-			tableSize = self._dictionaryOfTables[self._MAIN_TAB_NAME].getRowCount()
+				# check if the export was cancelled
+				if task.isCancelled():
+					break
 
-			# loop through the table
-			for i in range(0, tableSize):
+				# serialize only this issue
+				jsonIssue = json.dumps(self.createJsonFromIssue(row), ensure_ascii=False, indent=4, sort_keys=False, separators=(",", ": "))
 
-				# create a temp json for each row
-				tempJson = {}
+				# indent the issue to its place inside the array and separate it from the previous issue
+				jsonIssue = ("\n" if index == 0 else ",\n") + "\n".join("        " + line for line in jsonIssue.split("\n"))
 
-				# create temp variables for each row
-				tempJson["Issue Name"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 0)
-				tempJson["Severity"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 1)
-				tempJson["Issue Type"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 2)
-				tempJson["Issue Details"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 3)
-				tempJson["Issue Background"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 4)
-				tempJson["Remediation Details"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 5)
-				tempJson["Remediation Background"] = self._dictionaryOfTables[self._MAIN_TAB_NAME].getValueAt(i, 6)
+				# write the issue to the file
+				jsonFile.write(jsonIssue.encode("utf-8"))
 
-				# export issues to json
-				jsonDictionaryIssues["Issues"].append(tempJson)
+				# update the progress
+				task.addRowWritten(len(listOfRows))
 
-			# write json to file
-			jsonFile.write(json.dumps(jsonDictionaryIssues, ensure_ascii=False, indent=4, sort_keys=False, separators=(",", ": ")))
+			# check if there were issues in the array
+			if len(listOfRows) > 0:
 
-		# hide warning labels that table has been modified since last export
-		self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 1"].setText(" ")
-		self._dictionaryOfLabels[self._MAIN_TAB_NAME + " 2"].setText(" ")
-		self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 1"].setText(" ")
-		self._dictionaryOfLabels[self._DIALOG_TAB_2_NAME + " 2"].setText(" ")
+				# write the end of the array on its own line
+				jsonFile.write("\n    ]\n}")
+
+			# there were no issues
+			else:
+				# write the end of the empty array
+				jsonFile.write("]\n}")
+
+		# check if the export was cancelled
+		if task.isCancelled():
+
+			# remove the partially written file
+			os.remove(fileImportExport)
 
 		# return
 		return
@@ -1544,1170 +2844,4096 @@ class BurpExtender(IBurpExtender, ITab, IContextMenuFactory):
 		# set dialog options
 		dialogBoxTitle = "Import JSON File"
 		dialogBoxExtensionFilter = ["JSON Files (*.json)", ["json"], ".json"]
+		dialogBoxCompressedExtensionFilter = ["Gzip Compressed JSON Files (*.json.gz)", ["gz"], ".json.gz"]
 		dialogBoxButtonText = "Import"
 
 		# get the selected file
-		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText, dialogBoxCompressedExtensionFilter)
 
 		# return if user exited dialog box
 		if fileChosen == False:
 			return
 
-		# open the file
-		with open(fileImportExport, "r") as jsonFile:
+		# read the file on a background thread
+		self.startImportExportTask("Import", lambda task: self.importJsonInBackground(task, fileImportExport))
 
-			# load the json data
-			jsonData = json.load(jsonFile)
+		# return
+		return
 
-			# check if there is no data to import
-			if jsonData["Issues"] == None :
 
-				# do not continue
-				return
+	#
+	# read issues from a JSON file on a background thread
+	#
+
+	def importJsonInBackground(self, task, fileImportExport):
 
-			# loop through the json file
-			for tempJson in jsonData["Issues"]:
+		# get the file size for the progress bar
+		fileSize = os.path.getsize(fileImportExport)
 
-				# get values to create new row in table
-				issueName = tempJson["Issue Name"]
-				severity = tempJson["Severity"]
-				issueType = tempJson["Issue Type"]
-				issueDetail = tempJson["Issue Details"]
-				issueBackground = tempJson["Issue Background"]
-				remediationDetail = tempJson["Remediation Details"]
-				remediationBackground = tempJson["Remediation Background"]
+		# open the file
+		with self.openFileForImportExport(fileImportExport, "rb") as jsonFile:
+
+			# create a reader that decodes one issue at a time so the whole file is never loaded into memory
+			jsonReader = CustomJsonIssueReader(codecs.getreader("utf-8-sig")(jsonFile))
+
+			# loop through each issue in the json file
+			for tempJson in jsonReader.readIssues():
+
+				# check if the import was cancelled
+				if task.isCancelled():
+					break
 
-				# add issue to the table model
-				self.addIssueToTableModel(issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground)
+				# get values to create new row in table and hand it to the table model in batches
+				task.addIssue(self.createIssueFromJson(tempJson))
+
+				# update the progress
+				task.setProgress(task.getFilePosition(jsonFile), fileSize)
 
 		# return
 		return
 
 
 	#
-	# handle all button clicks from the main tab
+	# export issues from the table to a binary snapshot file
 	#
 
-	def buttonActionButtonClickedFromMainTab(self, buttonClicked):
+	def buttonClickedExportSnapshot(self):
 
-		# check if the add issue button was clicked
-		if buttonClicked == self._MAIN_TAB_BUTTON_NAMES[0]:
+		# set dialog options
+		dialogBoxTitle = "Export Snapshot File"
+		dialogBoxExtensionFilter = ["Issue Snapshot Files (*.atci)", ["atci"], ".atci"]
+		dialogBoxButtonText = "Export"
 
-			# add issue from main tab
-			self.buttonActionOpenAddIssueDialog(self._MAIN_TAB_NAME)
+		# get the selected file
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
 
-		# check if the delete issue button was clicked
-		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[3]:
+		# return if user exited dialog box
+		if fileChosen == False:
+			return
 
-			# delete the issue
-			self.buttonClickedDeleteIssue()
+		# get the rows while on the Swing event thread
+		listOfRows = self.getRowsForExport()
 
-		# check if the export csv issues button was clicked
-		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[1]:
+		# start a new generation so changes made from now on are in the next delta
+		exportGeneration = self._tableModelShared.startGeneration()
 
-			# export csv
-			self.buttonClickedExportCsv()
+		# write the file on a background thread
+		self.startImportExportTask("Export", lambda task: self.exportSnapshotInBackground(task, fileImportExport, listOfRows), lambda: self.finishExport(exportGeneration))
 
-		# check if the import csv issues button was clicked
-		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[2]:
+		# return
+		return
 
-			# import csv
-			self.buttonClickedImportCsv()
 
-		# check if the export json issues button was clicked
-		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[4]:
+	#
+	# write issues to a binary snapshot file on a background thread
+	#
 
-			# export json
-			self.buttonClickedExportJson()
+	def exportSnapshotInBackground(self, task, fileImportExport, listOfRows):
 
-		# check if the import json issues button was clicked
-		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[5]:
+		# open the file
+		with open(fileImportExport, "wb", 65536) as snapshotFile:
 
-			# import json
-			self.buttonClickedImportJson()
+			# create the writer, which compresses each block of rows
+			snapshotWriter = CustomIssueSnapshotWriter(snapshotFile, len(listOfRows))
 
-		# return
-		return
+			# loop through the rows
+			for row in listOfRows:
 
+				# check if the export was cancelled
+				if task.isCancelled():
+					break
 
-	#
-	# clear the main tab or the issue selection tab
-	#
+				# add the row
+				snapshotWriter.addRow([self.convertTextToUnicode(value) for value in row])
 
-	def clearMainTabOrIssueSelectionTab(self, tabName):
+				# update the progress
+				task.addRowWritten(len(listOfRows))
 
-		# clear text panes
-		self._dictionaryOfTextPanes[tabName + " Issue Name"].setText(self._HTML_FOR_TEXT_PANES[0] + "&nbsp" + self._HTML_FOR_TEXT_PANES[1])
-		self._dictionaryOfTextPanes[tabName + " Severity"].setText(self._HTML_FOR_TEXT_PANES[0] + "&nbsp" + self._HTML_FOR_TEXT_PANES[1])
+			# check if the export was not cancelled
+			if not task.isCancelled():
 
-		# clear text areas
-		self._dictionaryOfTextAreas[tabName + " Issue Detail"].setText("")
-		self._dictionaryOfTextAreas[tabName + " Issue Background"].setText("")
-		self._dictionaryOfTextAreas[tabName + " Remediation Detail"].setText("")
-		self._dictionaryOfTextAreas[tabName + " Remediation Background"].setText("")
+				# write the last block and the block table
+				snapshotWriter.close()
+
+		# check if the export was cancelled
+		if task.isCancelled():
+
+			# remove the partially written file
+			os.remove(fileImportExport)
 
 		# return
 		return
 
 
 	#
-	# clear the popup dialog
+	# import issues from a binary snapshot file to the table
 	#
 
-	def clearAddIssueDialog(self):
+	def buttonClickedImportSnapshot(self):
 
-		# clear text areas
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Name"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Port"].setText("443")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Host"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Path"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Detail"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Background"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Remediation Detail"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Remediation Background"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Request"].setText("")
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Response"].setText("")
+		# set dialog options
+		dialogBoxTitle = "Import Snapshot File"
+		dialogBoxExtensionFilter = ["Issue Snapshot Files (*.atci)", ["atci"], ".atci"]
+		dialogBoxButtonText = "Import"
 
-		# set combo boxes to defaults
-		self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Severity"].setSelectedItem(self._SEVERITY_COMBOBOX_CHOICES[0])
-		self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Confidence"].setSelectedItem(self._CONFIDENCE_COMBOBOX_CHOICES[0])
-		self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Protocol"].setSelectedItem(self._PROTOCOL_COMBOBOX_CHOICES[0])
+		# get the selected file
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
+
+		# return if user exited dialog box
+		if fileChosen == False:
+			return
+
+		# read the file on a background thread
+		self.startImportExportTask("Import", lambda task: self.importSnapshotInBackground(task, fileImportExport))
 
 		# return
 		return
 
 
 	#
-	# make the add issue dialog visible
+	# read issues from a binary snapshot file on a background thread
 	#
 
-	def makeAddIssueDialogVisible(self):
+	def importSnapshotInBackground(self, task, fileImportExport):
 
-		# change focus to the add issue tab
-	 	self._tabbedPaneDialog.setSelectedIndex(0)
+		# open the file
+		with open(fileImportExport, "rb") as snapshotFile:
 
-		# make the dialog box visible in case the click is coming from the main tab
-		self._dialogAddIssue.setVisible(True)
+			# create the reader, which reads the header and block table
+			snapshotReader = CustomIssueSnapshotReader.fromFile(snapshotFile)
 
-		# check if this is the first time the issue selection tab became visible
-		if self._issueSelectionTabFirstTimeVisible == True:
+			# loop through each row in the snapshot
+			for index, row in enumerate(snapshotReader.readRows()):
 
-			# change to false to prevent the divider location from resetting
-			self._issueSelectionTabFirstTimeVisible = False
+				# check if the import was cancelled
+				if task.isCancelled():
+					break
 
-			# set the divider location since it will not set when it is creating since it was not visible
-			self._dictionaryOfSplitPanes[self._DIALOG_TAB_2_NAME].setDividerLocation(0.3)
+				# hand the row to the table model in batches
+				task.addIssue(row)
+
+				# update the progress
+				task.setProgress(index + 1, snapshotReader.getRowCount())
 
 		# return
 		return
 
 
 	#
-	# update the text area for the issue location
+	# export the issues added and deleted since the last export to a JSON delta file
 	#
 
-	def updateTextAreaIssueLocation(self):
-
-		# get the protocol by stripping spacing, converting to lowercase, and adding "://"
-		protocol = self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Protocol"].getSelectedItem().strip().lower() + "://"
+	def buttonClickedExportDelta(self):
 
-		# get the host, port, and path
-		host = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Host"].getText()
-		port = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Port"].getText()
-		path = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Path"].getText()
+		# get the issues added and the fingerprints of the issues deleted since the last export while on the Swing event thread
+		listOfRows, listOfFingerprints = self._tableModelShared.getChangesSince(self._lastExportGeneration)
 
-		# check if the host and path are blank
-		if host == "" and path == "":
+		# check if nothing has changed
+		if len(listOfRows) == 0 and len(listOfFingerprints) == 0:
 
-			# set the location to blank
-			self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Location"].setText("")
+			# display message that there are no changes to export
+			JOptionPane.showMessageDialog(None, "There are no changes since the last export.", self._EXTENSION_NAME, JOptionPane.INFORMATION_MESSAGE)
 
 			# do not continue
 			return
 
-		# check if the host ends with a slash and does not only contain slashes and does not start with the protocol
-		if host.endswith("/") and host != "https:/" and host != "http:/" and host != "https://" and host != "http://" and host.strip("/") != "":
-
-			# remove last character
-			host = host[:-1]
+		# set dialog options
+		dialogBoxTitle = "Export Changes Since Last Export"
+		dialogBoxExtensionFilter = ["JSON Files (*.json)", ["json"], ".json"]
+		dialogBoxCompressedExtensionFilter = ["Gzip Compressed JSON Files (*.json.gz)", ["gz"], ".json.gz"]
+		dialogBoxButtonText = "Export"
 
-		# check if host is blank
-		if host == "":
+		# get the selected file
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText, dialogBoxCompressedExtensionFilter)
 
-			# set message that a host is required
-			host = protocol + "HOST_REQUIRED"
+		# return if user exited dialog box
+		if fileChosen == False:
+			return
 
-		# check that the host starts with https://
-		elif host.startswith("https://"):
+		# start a new generation so changes made from now on are in the next delta
+		exportGeneration = self._tableModelShared.startGeneration()
 
-			# add protocol and remove "https://"
-			host = protocol + host[8:]
+		# write the file on a background thread
+		self.startImportExportTask("Export", lambda task: self.exportDeltaInBackground(task, fileImportExport, listOfRows, listOfFingerprints), lambda: self.finishExport(exportGeneration))
+
+		# return
+		return
+
+
+	#
+	# write the issues added and the fingerprints of the issues deleted to a JSON delta file from a background thread
+	#
+
+	def exportDeltaInBackground(self, task, fileImportExport, listOfRows, listOfFingerprints):
+
+		# create the delta, with the issues under the same key as a full export so the added issues can also be imported as a normal JSON file
+		jsonDelta = OrderedDict()
+		jsonDelta["Issues"] = []
+		jsonDelta["Deleted Issue Fingerprints"] = listOfFingerprints
+
+		# loop through the rows
+		for row in listOfRows:
+
+			# check if the export was cancelled
+			if task.isCancelled():
+
+				# do not write the file
+				return
+
+			# add the issue
+			jsonDelta["Issues"].append(self.createJsonFromIssue(row))
+
+			# update the progress
+			task.addRowWritten(len(listOfRows))
+
+		# open the file
+		with self.openFileForImportExport(fileImportExport, "wb") as jsonFile:
+
+			# write the delta, which is small enough to serialize at once
+			jsonFile.write(json.dumps(jsonDelta, ensure_ascii=False, indent=4, sort_keys=False, separators=(",", ": ")).encode("utf-8"))
+
+		# return
+		return
+
+
+	#
+	# import a JSON delta file, deleting the issues it deleted and adding the issues it added
+	#
+
+	def buttonClickedImportDelta(self):
+
+		# set dialog options
+		dialogBoxTitle = "Import Changes"
+		dialogBoxExtensionFilter = ["JSON Files (*.json)", ["json"], ".json"]
+		dialogBoxCompressedExtensionFilter = ["Gzip Compressed JSON Files (*.json.gz)", ["gz"], ".json.gz"]
+		dialogBoxButtonText = "Import"
+
+		# get the selected file
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText, dialogBoxCompressedExtensionFilter)
+
+		# return if user exited dialog box
+		if fileChosen == False:
+			return
+
+		# read the file on a background thread
+		self.startImportExportTask("Import", lambda task: self.importDeltaInBackground(task, fileImportExport))
+
+		# return
+		return
+
+
+	#
+	# read a JSON delta file on a background thread
+	#
+
+	def importDeltaInBackground(self, task, fileImportExport):
+
+		# open the file
+		with self.openFileForImportExport(fileImportExport, "rb") as jsonFile:
+
+			# read the delta, which is small enough to decode at once
+			jsonDelta = json.load(codecs.getreader("utf-8-sig")(jsonFile))
+
+		# check if the file is not a delta
+		if not isinstance(jsonDelta, dict) or not isinstance(jsonDelta.get("Issues"), list) or not isinstance(jsonDelta.get("Deleted Issue Fingerprints"), list):
+
+			# the file is not a delta
+			raise ValueError("The JSON file is not a delta of changes.")
+
+		# delete the issues on the Swing event thread before adding issues, so an issue that was deleted and added again is kept
+		SwingUtilities.invokeAndWait(CustomRunnable(lambda: setattr(task, "rowsDeleted", self.deleteIssuesByFingerprint(jsonDelta["Deleted Issue Fingerprints"]))))
+
+		# loop through each issue in the delta
+		for index, tempJson in enumerate(jsonDelta["Issues"]):
+
+			# check if the import was cancelled
+			if task.isCancelled():
+				break
+
+			# get values to create new row in table and hand it to the table model in batches
+			task.addIssue(self.createIssueFromJson(tempJson))
+
+			# update the progress
+			task.setProgress(index + 1, len(jsonDelta["Issues"]))
+
+		# return
+		return
+
+
+	#
+	# mount a binary snapshot file as a read only issue library
+	#
+
+	def buttonClickedMountSnapshot(self):
+
+		# set dialog options
+		dialogBoxTitle = "Mount Snapshot File As Library"
+		dialogBoxExtensionFilter = ["Issue Snapshot Files (*.atci)", ["atci"], ".atci"]
+		dialogBoxButtonText = "Mount"
+
+		# get the selected file
+		fileChosen, fileImportExport = self.createDialogBoxForImportExport(dialogBoxTitle, dialogBoxExtensionFilter, dialogBoxButtonText)
+
+		# return if user exited dialog box
+		if fileChosen == False:
+			return
+
+		# check if the library is already mounted
+		if fileImportExport in self.getSavedLibraries():
+
+			# display message that the library is already mounted
+			JOptionPane.showMessageDialog(None, "The library is already mounted.", self._EXTENSION_NAME, JOptionPane.INFORMATION_MESSAGE)
+
+			# do not continue
+			return
+
+		# create a list for the task, the library, its index, and the fingerprints of its rows, which are created on the background thread
+		libraryAndIndex = []
+
+		# read the index on a background thread and add the rows to the table when finished
+		self.startImportExportTask("Mount", lambda task: libraryAndIndex.extend((task,) + self.readLibraryIndexInBackground(task, fileImportExport)), lambda: self.addLibraryToTableModel(libraryAndIndex[0], fileImportExport, *libraryAndIndex[1:]))
+
+		# return
+		return
+
+
+	#
+	# map a library and read the issue name, severity, issue type, and fingerprint of each row on a background thread
+	#
+
+	def readLibraryIndexInBackground(self, task, fileImportExport):
+
+		# map the library
+		library = CustomMappedIssueLibrary(fileImportExport)
+
+		# create the index and the fingerprints
+		index = []
+		listOfFingerprints = []
+
+		# loop through the index of the library
+		for indexEntry, fingerprint in library.readIndexAndFingerprints(self.createIssueFingerprint):
+
+			# check if the mount was cancelled
+			if task.isCancelled():
+				break
+
+			# add the row to the index
+			index.append(indexEntry)
+			listOfFingerprints.append(fingerprint)
+
+			# update the count and the progress
+			task.rowsRead += 1
+			task.setProgress(task.rowsRead, library.getRowCount())
+
+		# return the library, its index, and the fingerprints
+		return library, index, listOfFingerprints
+
+
+	#
+	# add the rows of a mounted library to the table and remember the library so it is mounted the next time the extension is loaded
+	#
+
+	def addLibraryToTableModel(self, task, fileImportExport, library, index, listOfFingerprints):
+
+		# get the index of the first new row
+		firstNewRow = self._tableModelShared.getRowCount()
+
+		# add the rows that are not already in the table
+		task.rowsAdded = self.addLibraryRows(fileImportExport, library, index, listOfFingerprints)
+		task.rowsDuplicate = len(index) - task.rowsAdded
+
+		# add the new rows to the search index
+		self.addRowsToSearchIndex(firstNewRow, self._tableModelShared.getRowCount())
+
+		# get the mounted libraries
+		listOfLibraries = self.getSavedLibraries()
+
+		# check if the library is not saved
+		if fileImportExport not in listOfLibraries:
+
+			# save the library so it is mounted the next time the extension is loaded
+			listOfLibraries.append(fileImportExport)
+			self._callbacks.saveExtensionSetting("mountedLibraries", "\n".join(listOfLibraries))
+
+		# return
+		return
+
+
+	#
+	# add the rows of a library that are not already in the table and return the number of rows added
+	#
+
+	def addLibraryRows(self, fileImportExport, library, index, listOfFingerprints):
+
+		# create the fingerprints for the issues already in the table if they have not been created yet
+		self.indexIssueFingerprints()
+
+		# create a list of rows that are not already in the table and their fingerprints
+		newIndex = []
+		newFingerprints = []
+		setOfNewFingerprints = set()
+
+		# loop through each row and its fingerprint
+		for indexEntry, fingerprint in zip(index, listOfFingerprints):
+
+			# check if the row is already in the table or earlier in the library
+			if fingerprint in self._dictionaryOfIssueFingerprints or fingerprint in setOfNewFingerprints:
+
+				# skip the duplicate
+				continue
+
+			# add the row to the rows to add
+			newIndex.append(indexEntry)
+			newFingerprints.append(fingerprint)
+			setOfNewFingerprints.add(fingerprint)
+
+		# get the index of the first new row
+		firstNewRow = self._tableModelShared.getRowCount()
+
+		# add the rows, whose text is decoded from the mapped library each time it is needed, as part of the last export since the library is shared as a file rather than in a delta
+		self._tableModelShared.addLazyRows(library, newIndex, self._lastExportGeneration - 1)
+
+		# loop through the fingerprints of the new rows
+		for offset, fingerprint in enumerate(newFingerprints):
+
+			# add the fingerprint of the row to the index
+			self.addIssueFingerprint(fingerprint, self._tableModelShared.getRowId(firstNewRow + offset))
+
+		# keep the library so it can be unmounted
+		self._dictionaryOfMountedLibraries[fileImportExport] = library
+
+		# return the number of rows added
+		return len(newIndex)
+
+
+	#
+	# get the paths of the mounted libraries
+	#
+
+	def getSavedLibraries(self):
+
+		# load the paths
+		savedLibraries = self._callbacks.loadExtensionSetting("mountedLibraries")
+
+		# return the paths
+		return savedLibraries.split("\n") if savedLibraries else []
+
+
+	#
+	# mount the libraries that were mounted before the extension was last unloaded
+	#
+
+	def mountSavedLibraries(self):
+
+		# create a list of the libraries that could be mounted
+		listOfMountedLibraries = []
+
+		# loop through each saved library
+		for fileImportExport in self.getSavedLibraries():
+
+			# try to mount the library
+			try:
+				# map the library and read its index and fingerprints
+				library = CustomMappedIssueLibrary(fileImportExport)
+				listOfIndexEntriesAndFingerprints = list(library.readIndexAndFingerprints(self.createIssueFingerprint))
+
+				# add the rows that are not already in the table
+				rowsAdded = self.addLibraryRows(fileImportExport, library, [indexEntry for indexEntry, fingerprint in listOfIndexEntriesAndFingerprints], [fingerprint for indexEntry, fingerprint in listOfIndexEntriesAndFingerprints])
+
+				# add the library to the libraries that could be mounted
+				listOfMountedLibraries.append(fileImportExport)
+
+				# print the library that was mounted
+				print("Mounted " + str(rowsAdded) + " issues from " + fileImportExport)
+
+			# the library could not be mounted, such as if it was moved or deleted
+			except:
+				# print the error
+				print("Failed to mount " + fileImportExport + ": " + str(sys.exc_info()[1]))
+
+		# save only the libraries that could be mounted
+		self._callbacks.saveExtensionSetting("mountedLibraries", "\n".join(listOfMountedLibraries))
+
+		# return
+		return
+
+
+	#
+	# unmount a library that was mounted, removing its rows from the table
+	#
+
+	def buttonClickedUnmountLibrary(self):
+
+		# get the mounted libraries
+		listOfLibraries = sorted(self._dictionaryOfMountedLibraries.keys())
+
+		# check if there are no mounted libraries
+		if len(listOfLibraries) == 0:
+
+			# display message that there are no libraries to unmount
+			JOptionPane.showMessageDialog(None, "There are no mounted libraries.", self._EXTENSION_NAME, JOptionPane.INFORMATION_MESSAGE)
+
+			# do not continue
+			return
+
+		# ask which library to unmount
+		fileImportExport = JOptionPane.showInputDialog(None, "Select the library to unmount.", self._EXTENSION_NAME, JOptionPane.QUESTION_MESSAGE, None, listOfLibraries, listOfLibraries[0])
+
+		# return if user exited dialog box
+		if fileImportExport == None:
+			return
+
+		# unmount the library
+		self.unmountLibrary(fileImportExport)
+
+		# return
+		return
+
+
+	#
+	# remove the rows of a mounted library from the table and forget the library so it is not mounted the next time the extension is loaded
+	#
+
+	def unmountLibrary(self, fileImportExport):
+
+		# get the library
+		library = self._dictionaryOfMountedLibraries.pop(fileImportExport)
+
+		# create the fingerprints for the issues in the table if they have not been created yet
+		self.indexIssueFingerprints()
+
+		# get the rows from the library
+		listOfRows = [row for row in range(self._tableModelShared.getRowCount()) if self._tableModelShared.isRowFromLoader(row, library)]
+
+		# remove the rows, which are not recorded as deleted issues since the library itself is unchanged
+		self.removeRowsFromTableModel(listOfRows)
+
+		# loop through the tabs that have been created
+		for tabName in self._dictionaryOfTables:
+
+			# clear the tab and the selected row since the selected row may have been removed
+			self.clearMainTabOrIssueSelectionTab(tabName)
+			self._dictionaryOfTables[tabName].getSelectionModel().clearSelection()
+
+		# save the libraries without the library so it is not mounted the next time the extension is loaded
+		self._callbacks.saveExtensionSetting("mountedLibraries", "\n".join([path for path in self.getSavedLibraries() if path != fileImportExport]))
+
+		# print the library that was unmounted
+		print("Unmounted " + str(len(listOfRows)) + " issues from " + fileImportExport)
+
+		# return
+		return
+
+
+	#
+	# handle all button clicks from the main tab
+	#
+
+	def buttonActionButtonClickedFromMainTab(self, buttonClicked):
+
+		# check if the add issue button was clicked
+		if buttonClicked == self._MAIN_TAB_BUTTON_NAMES[0]:
+
+			# add issue from main tab
+			self.buttonActionOpenAddIssueDialog(self._MAIN_TAB_NAME)
+
+		# check if the delete issue button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[3]:
+
+			# delete the issue
+			self.buttonClickedDeleteIssue()
+
+		# check if the export csv issues button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[1]:
+
+			# export csv
+			self.buttonClickedExportCsv()
+
+		# check if the import csv issues button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[2]:
+
+			# import csv
+			self.buttonClickedImportCsv()
+
+		# check if the export json issues button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[4]:
+
+			# export json
+			self.buttonClickedExportJson()
+
+		# check if the import json issues button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[5]:
+
+			# import json
+			self.buttonClickedImportJson()
+
+		# check if the export snapshot button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[6]:
+
+			# export snapshot
+			self.buttonClickedExportSnapshot()
+
+		# check if the import snapshot button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[7]:
+
+			# import snapshot
+			self.buttonClickedImportSnapshot()
+
+		# check if the mount snapshot button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[8]:
+
+			# mount snapshot
+			self.buttonClickedMountSnapshot()
+
+		# check if the export changes button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[9]:
+
+			# export changes
+			self.buttonClickedExportDelta()
+
+		# check if the import changes button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[10]:
+
+			# import changes
+			self.buttonClickedImportDelta()
+
+		# check if the unmount library button was clicked
+		elif buttonClicked == self._MAIN_TAB_BUTTON_NAMES[11]:
+
+			# unmount library
+			self.buttonClickedUnmountLibrary()
+
+		# return
+		return
+
+
+	#
+	# clear the main tab or the issue selection tab
+	#
+
+	def clearMainTabOrIssueSelectionTab(self, tabName):
+
+		# clear text panes
+		self._dictionaryOfTextPanes[tabName + " Issue Name"].setText(self._HTML_FOR_TEXT_PANES[0] + "&nbsp" + self._HTML_FOR_TEXT_PANES[1])
+		self._dictionaryOfTextPanes[tabName + " Severity"].setText(self._HTML_FOR_TEXT_PANES[0] + "&nbsp" + self._HTML_FOR_TEXT_PANES[1])
+
+		# clear text areas
+		self._dictionaryOfTextAreas[tabName + " Issue Detail"].setText("")
+		self._dictionaryOfTextAreas[tabName + " Issue Background"].setText("")
+		self._dictionaryOfTextAreas[tabName + " Remediation Detail"].setText("")
+		self._dictionaryOfTextAreas[tabName + " Remediation Background"].setText("")
+
+		# return
+		return
+
+
+	#
+	# clear the popup dialog
+	#
+
+	def clearAddIssueDialog(self):
+
+		# clear text areas
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Name"].setText("")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Port"].setText("443")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Host"].setText("")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Path"].setText("")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Detail"].setText("")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Background"].setText("")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Remediation Detail"].setText("")
+		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Remediation Background"].setText("")
+
+		# clear the message editors and the original bytes of the request and response
+		self._messageEditorController.setMessage(None, None, None)
+		self.setMessageEditor(self._DIALOG_TAB_1_NAME + " Request", None, True)
+		self.setMessageEditor(self._DIALOG_TAB_1_NAME + " Response", None, False)
+
+		# forget the selected messages or issues and hide the check box to add the issue to all of them
+		self._selectedMessagesOrIssues = []
+		self._checkBoxDialogAddToAllSelected.setVisible(False)
+		self._checkBoxDialogCombinePerHost.setVisible(False)
+
+		# set combo boxes to defaults
+		self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Severity"].setSelectedItem(self._SEVERITY_COMBOBOX_CHOICES[0])
+		self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Confidence"].setSelectedItem(self._CONFIDENCE_COMBOBOX_CHOICES[0])
+		self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Protocol"].setSelectedItem(self._PROTOCOL_COMBOBOX_CHOICES[0])
+
+		# return
+		return
+
+
+	#
+	# make the add issue dialog visible
+	#
+
+	def makeAddIssueDialogVisible(self):
+
+		# change focus to the add issue tab
+	 	self._tabbedPaneDialog.setSelectedIndex(0)
+
+		# make the dialog box visible in case the click is coming from the main tab
+		self._dialogAddIssue.setVisible(True)
+
+		# check if this is the first time the issue selection tab became visible
+		if self._issueSelectionTabFirstTimeVisible == True:
+
+			# change to false to prevent the divider location from resetting
+			self._issueSelectionTabFirstTimeVisible = False
+
+			# set the divider location since it will not set when it is creating since it was not visible
+			self._dictionaryOfSplitPanes[self._DIALOG_TAB_2_NAME].setDividerLocation(0.3)
+
+		# return
+		return
+
+
+	#
+	# update the text area for the issue location once all of the pending changes to the protocol, host, port, and path have been made
+	#
+
+	def updateTextAreaIssueLocation(self):
+
+		# check if an update is already waiting to run
+		if self._issueLocationUpdatePending:
+			return
+
+		# set that an update is waiting to run
+		self._issueLocationUpdatePending = True
+
+		# update the issue location after the current events, so many changes at once such as pasting a long path only update it once
+		SwingUtilities.invokeLater(CustomRunnable(self.applyIssueLocationUpdate))
+
+		# return
+		return
+
+
+	#
+	# set the text area for the issue location from the protocol, host, port, and path
+	#
+
+	def applyIssueLocationUpdate(self):
+
+		# set that no update is waiting to run so the next change schedules another one
+		self._issueLocationUpdatePending = False
+
+		# get the protocol by stripping spacing, converting to lowercase, and adding "://"
+		protocol = self._dictionaryOfComboBoxes[self._DIALOG_TAB_1_NAME + " Protocol"].getSelectedItem().strip().lower() + "://"
+
+		# get the host, port, and path
+		host = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Host"].getText()
+		port = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Port"].getText()
+		path = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Path"].getText()
+
+		# check if the host and path are blank
+		if host == "" and path == "":
+
+			# set the location to blank
+			self.setTextAreaIssueLocation("")
+
+			# do not continue
+			return
+
+		# check if the host ends with a slash and does not only contain slashes and does not start with the protocol
+		if host.endswith("/") and host != "https:/" and host != "http:/" and host != "https://" and host != "http://" and host.strip("/") != "":
+
+			# remove last character
+			host = host[:-1]
+
+		# check if host is blank
+		if host == "":
+
+			# set message that a host is required
+			host = protocol + "HOST_REQUIRED"
+
+		# check that the host starts with https://
+		elif host.startswith("https://"):
+
+			# add protocol and remove "https://"
+			host = protocol + host[8:]
 
 		# check that the host starts with http://
 		elif host.startswith("http://"):
 
-			# add protocol and remove "http://"
-			host = protocol + host[7:]
+			# add protocol and remove "http://"
+			host = protocol + host[7:]
+
+		# host is not blank
+		else:
+			# add protocol
+			host = protocol + host
+
+		# check if the port is blank
+		if port == "":
+
+			# set message that port is required
+			port = ":PORT_REQUIRED"
+
+		# port is not blank
+		else:
+			# add colon
+			port = ":" + port
+
+		# check that the first character of the path is not a slash
+		if not path.startswith("/"):
+
+			# add a slash
+			path = "/" + path
+
+		# set the location
+		self.setTextAreaIssueLocation(host + port + path)
+
+		# return
+		return
+
+
+	#
+	# set the text of the issue location only if it changed, so the text area does not fire document events when nothing changed
+	#
+
+	def setTextAreaIssueLocation(self, location):
+
+		# get the issue location text area
+		textArea = self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Location"]
+
+		# check if the location changed
+		if textArea.getText() != location:
+
+			# set the location
+			textArea.setText(location)
+
+		# return
+		return
+
+
+#
+# extend IHttpService to create a custom http service for a custom IHttpRequestResponse and a custom IScanIssue
+#
+
+class CustomIHttpService(IHttpService):
+
+	# initialize variables
+	def __init__(self, protocol, host, port):
+		self._protocol = protocol
+		self._host = host
+		self._port = port
+
+	# override getProtocol
+	def getProtocol(self):
+		return self._protocol
+
+	# override getHost
+	def getHost(self):
+		return self._host
+
+	# override getPort
+	def getPort(self):
+		return self._port
+
+
+#
+# extend IMessageEditorController to give the request and response message editors the message that the dialog was opened with
+#
+
+class CustomIMessageEditorController(IMessageEditorController):
+
+	# initialize variables
+	def __init__(self):
+		self.setMessage(None, None, None)
+
+	# set the http service, request, and response
+	def setMessage(self, httpService, request, response):
+		self._httpService = httpService
+		self._request = request
+		self._response = response
+
+	# override getHttpService
+	def getHttpService(self):
+		return self._httpService
+
+	# override getRequest
+	def getRequest(self):
+		return self._request
+
+	# override getResponse
+	def getResponse(self):
+		return self._response
+
+
+#
+# extend IHttpRequestResponse to create a request and response for a custom issue
+#
+
+class CustomIHttpRequestResponse(IHttpRequestResponse):
+
+	# initialize variables
+	def __init__(self, comment, highlight, httpService, request, response):
+		self._comment = comment
+		self._highlight = highlight
+		self._httpService = httpService
+		self._request = request
+		self._response = response
+
+	# override getRequest
+	def getRequest(self):
+		return self._request
+
+	# override setRequest
+	def setRequest(self, message):
+		self._request = message
+
+	# override getResponse
+	def getResponse(self):
+		return self._response
+
+	# override setResponse
+	def setResponse(self, message):
+		self._response = message
+
+	# override getComment
+	def getComment(self):
+		return self._comment
+
+	# override setComment
+	def setComment(self, comment):
+		self._comment = comment
+
+	# override getHighlight
+	def getHighlight(self):
+		return self._highlight
+
+	# override setHighlight
+	def setHighlight(self, color):
+		self._highlight = color
+
+	# override getHttpService
+	def getHttpService(self):
+		return self._httpService
+
+	# override setHttpService
+	def setHttpService(self, httpService):
+		self._httpService = httpService
+
+
+#
+# extend IScanIssue to create a new issue
+#
+
+class CustomScanIssue(IScanIssue):
+
+	# initialize variables
+	def __init__(self, httpService, url, httpMessages, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail):
+		self._httpService = httpService
+		self._url = url
+		self._httpMessages = httpMessages
+		self._issueName = issueName
+		self._issueDetail = issueDetail
+		self._confidence = confidence
+		self._severity = severity
+		self._issueBackground = issueBackground
+		self._remediationBackground = remediationBackground
+		self._remediationDetail = remediationDetail
+
+		# set issue type to Extension Generated Issue 0x08000000 == 134217728
+		self._issueType = 134217728
+
+	# override getUrl
+	def getUrl(self):
+		return self._url
+
+	# override getIssueName
+	def getIssueName(self):
+		return self._issueName
+
+	# override getIssueType
+	def getIssueType(self):
+		return self._issueType
+
+	# override getSeverity
+	def getSeverity(self):
+		return self._severity
+
+	# override getConfidence
+	def getConfidence(self):
+		return self._confidence
+
+	# override getIssueBackground
+	def getIssueBackground(self):
+		return self._issueBackground
+
+	# override getRemediationBackground
+	def getRemediationBackground(self):
+		return self._remediationBackground
+
+	# override getIssueDetail
+	def getIssueDetail(self):
+		return self._issueDetail
+
+	# override getRemediationDetail
+	def getRemediationDetail(self):
+		return self._remediationDetail
+
+	# override getHttpMessages
+	def getHttpMessages(self):
+		return self._httpMessages
+
+	# override getHttpService
+	def getHttpService(self):
+		return self._httpService
+
+
+#
+# extend JTextArea to allow tab key to transfer focus to next item
+#
+
+class CustomJTextArea(JTextArea):
+
+	# override processComponentKeyEvent
+	def processComponentKeyEvent(self, event):
+
+		# check if key code matches tab key code and that the key is being typed to avoid multiple triggers
+		if event.getKeyCode() == KeyEvent.VK_TAB and event.getID() == KeyEvent.KEY_PRESSED:
+
+			# cosume the event
+			event.consume()
+
+			# transfer focus to next area
+			self.transferFocus()
+
+		# check if key code matched tab key code and that event ID is KEY_RELEASED or KEY_TYPED
+		elif event.getKeyCode() == KeyEvent.VK_TAB:
+
+			# consume the event
+			event.consume()
+
+
+#
+# extend CustomUndoableEditListener to allow undo and redo actions in text areas
+#
+
+class CustomUndoableEditListener(UndoableEditListener):
+
+	# initialize variables
+	def __init__(self, extender):
+		self.extender = extender
+
+	# override UndoAction
+	def undoableEditHappened(self, event):
+		self.extender._undoManager.addEdit(event.getEdit())
+		self.extender._undoAction.update()
+		self.extender._redoAction.update()
+
+
+#
+# extend CustomAbstractAction to allow undo and redo actions in text areas
+#
+
+class CustomAbstractAction(AbstractAction):
+
+	# initialize variables
+	def __init__(self, extender, undoOrRedo):
+		self.extender = extender
+		self.undoOrRedo = undoOrRedo
+
+	# override UndoAction
+	def UndoAction(self):
+		AbstractAction.UndoAction(self.undoOrRedo)
+		self.setEnabled(False)
+
+	# override RedoAction
+	def RedoAction(self):
+		AbstractAction.RedoAction(self.undoOrRedo)
+		self.setEnabled(False)
+
+	# override actionPerformed
+	def actionPerformed(self, event):
+
+		# check if redo
+		if self.undoOrRedo == "Redo":
+
+			# try to redo
+			try:
+				# redo
+				self.extender._undoManager.redo()
+
+			except:
+				pass
+
+		# check if undo
+		elif self.undoOrRedo == "Undo":
+
+			# try to undo
+			try:
+				# undo
+				self.extender._undoManager.undo()
+
+			except:
+				pass
+
+		# update the undo and redo action
+		self.extender._undoAction.update()
+		self.extender._redoAction.update()
+
+	# override update
+	def update(self):
+
+		# check if redo
+		if self.undoOrRedo == "Redo":
+
+			# check if redo can be performed
+			if (self.extender._undoManager.canRedo()):
+
+				self.setEnabled(True)
+				self.putValue(Action.NAME, self.extender._undoManager.getRedoPresentationName())
+
+			else:
+				self.setEnabled(False)
+				self.putValue(Action.NAME, self.undoOrRedo)
+		# check if undo
+		elif self.undoOrRedo == "Undo":
+
+			# check if undo can be performed
+			if (self.extender._undoManager.canUndo()):
+
+				self.setEnabled(True)
+				self.putValue(Action.NAME, self.extender._undoManager.getUndoPresentationName())
+
+			else:
+				self.setEnabled(False)
+				self.putValue(Action.NAME, self.undoOrRedo)
+
+
+#
+# extend DocumentFilter to filter input for the issue name, host, port, and path
+#
+
+class CustomDocumentFilter(DocumentFilter):
+
+	# initialize variables
+	def __init__(self, filterType):
+		self.filterType = filterType
+
+	# override insertString
+	def insertString(self, filterBypass, offset, string, attributeSet):
+
+		# check if value is valid
+		if self.validateEdit(filterBypass.getDocument(), offset, 0, string):
+
+			# add default insertString
+			DocumentFilter.insertString(self, filterBypass, offset, string, attributeSet)
+
+	# override replace
+	def replace(self, filterBypass, offset, length, text, attributeSet):
+
+		# check if value is valid
+		if self.validateEdit(filterBypass.getDocument(), offset, length, text):
+
+			# add default replace
+			DocumentFilter.replace(self, filterBypass, offset, length, text, attributeSet)
+
+	# override remove
+	def remove(self, filterBypass, offset, length):
+
+		# check if value is valid
+		if self.validateEdit(filterBypass.getDocument(), offset, length, ""):
+
+			# add default remove
+			DocumentFilter.remove(self, filterBypass, offset, length)
+
+	# validate if replacing the length of text at the offset with the new text is allowed, by only checking the new text and the part of the document the rule needs since the current text is already valid
+	def validateEdit(self, document, offset, length, text):
+
+		# set the new text to blank if there is none
+		text = text or ""
+
+		# check if issue name filter
+		if self.filterType == "Issue Name":
+
+			# check if the first character is not being changed
+			if offset > 0:
+
+				# get the first character of the document
+				firstCharacter = document.getText(0, 1)
+
+			# check if the new text will be at the start
+			elif text != "":
+
+				# get the first character of the new text
+				firstCharacter = text[0]
+
+			# check if there is text after the removed text
+			elif length < document.getLength():
+
+				# get the first character after the removed text
+				firstCharacter = document.getText(length, 1)
+
+			# the document will be blank
+			else:
+				firstCharacter = ""
+
+			# check if the first character is allowed
+			return self.validateString(firstCharacter)
+
+		# check if port filter
+		elif self.filterType == "Port":
+
+			# check if the new text is not a number or the port would be longer than the largest port
+			if (text != "" and not text.isdigit()) or document.getLength() - length + len(text) > 5:
+
+				# text is not allowed
+				return False
+
+			# get the current port, which is at most five characters
+			port = document.getText(0, document.getLength())
+
+			# check if the new port is valid
+			return self.validateString(port[:offset] + text + port[offset + length:])
+
+		# host or path filter
+		elif self.filterType == "Host" or self.filterType == "Path":
+
+			# check if the new text is allowed, since removing text cannot add a space or newline character
+			return self.validateString(text)
+
+	# validate if the string is allowed
+	def validateString(self, text):
+
+		# check if issue name filter
+		if self.filterType == "Issue Name":
+
+			# check if the text starts with a space
+			if text.startswith(" "):
+
+				# text is not allowed
+				return False
+
+			# does not start with a space
+			else:
+				# text is allowed 
+				return True
+
+		# check if port filter
+		elif self.filterType == "Port":
+
+			# set if text is blank
+			blank = (text == "")
+
+			# check if text is not blank
+			if not blank:
+
+				# try to check if text is an integer
+				try:
+					# check if text is an integer
+					Integer.parseInt(text)
+
+				# text was not an integer
+				except:
+					# text is not allowed
+					return False
+
+				# set if port is valid
+				validPort = (int(text) > -1 and int(text) < 65536)
+
+				# set if port does not start with zero and has a length of greater than one
+				notStartWithZeroAndLengthGreaterThanOne = (not text.startswith("0") and len(text) > 1)
+
+				# set if port length is 1
+				lengthIsOne = (len(text) == 1)
+
+			# check if the text is blank or (a valid port and ((does not start with zero and is greater than one) or (length is one)))
+			if (blank or (validPort and (notStartWithZeroAndLengthGreaterThanOne or lengthIsOne))):
+
+				# text is allowed
+				return True
+			else:
+				# text is not allowed
+				return False
+
+		# host or path filter
+		elif self.filterType == "Host" or self.filterType == "Path":
+
+			# check if there is a space or newline character
+			if " " in text or "\n" in text:
+
+				# do not allow
+				return False
+
+			# no space or newline character
+			else:
+				return True
+
+
+#
+# index every word in the issue table so searches look up matching rows instead of scanning all of the text
+#
+
+class CustomInvertedIndex():
+
+	# initialize variables
+	def __init__(self):
+
+		# create a dictionary of each word to the set of row ids that contain it
+		self.dictionaryOfPostings = dict()
+
+		# create a sorted list of the words so words can be found by prefix while typing
+		self.sortedWords = []
+
+	# split text into lowercase words
+	def getWords(self, text):
+		return set(re.findall(r"\w+", text.lower(), re.UNICODE))
+
+	# get the words from all of the columns in a row
+	def getWordsFromRow(self, values):
+
+		# create a set of words
+		words = set()
+
+		# loop through each column
+		for text in values:
+
+			# add the words
+			words.update(self.getWords(text))
+
+		# return the words
+		return words
+
+	# add a row to the index
+	def addRow(self, rowId, values):
+
+		# loop through each word in the row
+		for word in self.getWordsFromRow(values):
+
+			# get the rows that contain the word
+			postings = self.dictionaryOfPostings.get(word)
+
+			# check if the word is new
+			if postings == None:
+
+				# add the word
+				postings = set()
+				self.dictionaryOfPostings[word] = postings
+				bisect.insort(self.sortedWords, word)
+
+			# add the row
+			postings.add(rowId)
+
+	# remove a row from the index
+	def removeRow(self, rowId, values):
+
+		# loop through each word in the row
+		for word in self.getWordsFromRow(values):
+
+			# get the rows that contain the word
+			postings = self.dictionaryOfPostings.get(word)
+
+			# check if the word is not in the index
+			if postings == None:
+				continue
+
+			# remove the row
+			postings.discard(rowId)
+
+			# check if no rows contain the word
+			if len(postings) == 0:
+
+				# remove the word
+				del self.dictionaryOfPostings[word]
+				del self.sortedWords[bisect.bisect_left(self.sortedWords, word)]
+
+	# get the row ids that contain a word starting with the prefix
+	def getRowIdsForPrefix(self, prefix):
+
+		# create a set of row ids
+		rowIds = set()
+
+		# loop through the sorted words starting with the first word that could match
+		for index in xrange(bisect.bisect_left(self.sortedWords, prefix), len(self.sortedWords)):
+
+			# get the word
+			word = self.sortedWords[index]
+
+			# check if the word does not start with the prefix, which means no words after it will either
+			if not word.startswith(prefix):
+				break
+
+			# add the rows that contain the word
+			rowIds.update(self.dictionaryOfPostings[word])
+
+		# return the row ids
+		return rowIds
+
+	# get the row ids that contain every word in the query, matching the start of words so results update while typing
+	def search(self, query):
+
+		# create the set of matching row ids
+		matchingRowIds = None
+
+		# loop through each word in the query, starting with the longest since it usually matches the fewest rows
+		for word in sorted(self.getWords(query), key=len, reverse=True):
+
+			# check if this is the first word
+			if matchingRowIds == None:
+
+				# get the rows that match the word
+				matchingRowIds = self.getRowIdsForPrefix(word)
+
+			# this is not the first word
+			else:
+				# keep the rows that also match the word
+				matchingRowIds &= self.getRowIdsForPrefix(word)
+
+			# check if no rows match
+			if len(matchingRowIds) == 0:
+				break
+
+		# return the matching row ids, or none if the query did not contain any words
+		return matchingRowIds
+
+
+#
+# index the trigrams of each issue name so issue names can be found even with typos and reordered words
+#
+
+class CustomTrigramIndex():
+
+	# initialize variables
+	def __init__(self):
+
+		# create a dictionary of each trigram to the set of row ids whose issue name contains it
+		self.dictionaryOfPostings = dict()
+
+		# create a dictionary of each row id to its issue name and the number of trigrams in it
+		self.dictionaryOfNames = dict()
+		self.dictionaryOfTrigramCounts = dict()
+
+	# split text into lowercase words and get the trigrams of each word padded with spaces, so the order of the words does not matter
+	def getTrigrams(self, text):
+
+		# create a set of trigrams
+		trigrams = set()
+
+		# loop through each word
+		for word in re.findall(r"\w+", text.lower(), re.UNICODE):
+
+			# pad the word so the start and end of the word are trigrams too
+			paddedWord = " " + word + " "
+
+			# loop through each trigram in the word
+			for index in xrange(len(paddedWord) - 2):
+
+				# add the trigram
+				trigrams.add(paddedWord[index:index + 3])
+
+		# return the trigrams
+		return trigrams
+
+	# add a row to the index
+	def addRow(self, rowId, issueName):
+
+		# get the trigrams of the issue name
+		trigrams = self.getTrigrams(issueName)
+
+		# loop through each trigram
+		for trigram in trigrams:
+
+			# get the rows that contain the trigram
+			postings = self.dictionaryOfPostings.get(trigram)
+
+			# check if the trigram is new
+			if postings == None:
+
+				# add the trigram
+				postings = set()
+				self.dictionaryOfPostings[trigram] = postings
+
+			# add the row
+			postings.add(rowId)
+
+		# store the issue name and the number of trigrams
+		self.dictionaryOfNames[rowId] = issueName
+		self.dictionaryOfTrigramCounts[rowId] = len(trigrams)
+
+	# remove a row from the index
+	def removeRow(self, rowId):
+
+		# get the issue name
+		issueName = self.dictionaryOfNames.pop(rowId, None)
+
+		# check if the row is not in the index
+		if issueName == None:
+			return
+
+		# remove the number of trigrams
+		del self.dictionaryOfTrigramCounts[rowId]
+
+		# loop through each trigram of the issue name
+		for trigram in self.getTrigrams(issueName):
+
+			# remove the row
+			postings = self.dictionaryOfPostings[trigram]
+			postings.discard(rowId)
+
+			# check if no rows contain the trigram
+			if len(postings) == 0:
+
+				# remove the trigram
+				del self.dictionaryOfPostings[trigram]
+
+	# get the issue name of a row
+	def getIssueName(self, rowId):
+		return self.dictionaryOfNames[rowId]
+
+	# get the best matching rows as a list of (score, row id), ranked by how much of the query was matched and then by how similar the whole issue name is
+	def search(self, query, maximumResults):
+
+		# get the trigrams of the query
+		queryTrigrams = self.getTrigrams(query)
+
+		# check if there are no trigrams
+		if len(queryTrigrams) == 0:
+			return []
+
+		# create a dictionary of each row id to the number of trigrams it shares with the query
+		dictionaryOfSharedCounts = dict()
+
+		# loop through each trigram in the query
+		for trigram in queryTrigrams:
+
+			# loop through each row that contains the trigram
+			for rowId in self.dictionaryOfPostings.get(trigram, ()):
+
+				# add to the count of shared trigrams
+				dictionaryOfSharedCounts[rowId] = dictionaryOfSharedCounts.get(rowId, 0) + 1
+
+		# set the number of trigrams in the query
+		queryCount = float(len(queryTrigrams))
+
+		# set the minimum number of shared trigrams, so unrelated names that share a single trigram are not returned
+		minimumSharedCount = queryCount / 2
+
+		# create the candidates with how much of the query was matched and how similar the whole issue name is
+		candidates = ((sharedCount / queryCount, sharedCount / (queryCount + self.dictionaryOfTrigramCounts[rowId] - sharedCount), rowId) for rowId, sharedCount in dictionaryOfSharedCounts.iteritems() if sharedCount >= minimumSharedCount)
+
+		# return the best matching rows
+		return [(matched + similarity, rowId) for matched, similarity, rowId in heapq.nlargest(maximumResults, candidates)]
+
+
+#
+# extend Comparator to order issue names by how well they matched a search
+#
+
+class CustomRankComparator(Comparator):
+
+	# initialize variables
+	def __init__(self, dictionaryOfScores):
+		self.dictionaryOfScores = dictionaryOfScores
+
+	# override compare
+	def compare(self, issueName1, issueName2):
+
+		# get the score for each issue name, issue names that only matched whole words have no score
+		score1 = self.dictionaryOfScores.get(issueName1, 0)
+		score2 = self.dictionaryOfScores.get(issueName2, 0)
+
+		# check if the scores are different
+		if score1 != score2:
+
+			# put the higher score first
+			return -1 if score1 > score2 else 1
+
+		# put issue names with the same score in alphabetical order
+		return cmp(issueName1.lower(), issueName2.lower())
+
+
+#
+# extend RowFilter to only show the rows that matched a search
+#
+
+class CustomRowFilter(RowFilter):
+
+	# initialize variables
+	def __init__(self, tableModel, matchingRowIds):
+		self.tableModel = tableModel
+		self.matchingRowIds = matchingRowIds
+
+	# override include
+	def include(self, entry):
+
+		# check if the row id of the row is in the matching row ids
+		return self.tableModel.getRowId(entry.getIdentifier()) in self.matchingRowIds
+
+
+#
+# extend DocumentListener to filter a table when text is typed into its search field
+#
+
+class CustomSearchDocumentListener(DocumentListener):
+
+	# initialize variables
+	def __init__(self, extender, tabName):
+		self.extender = extender
+		self.tabName = tabName
+
+	# override changedUpdate for when the style of text changes
+	def changedUpdate(self, event):
+		pass
+
+	# override insertUpdate for when text is inserted
+	def insertUpdate(self, event):
+
+		# filter the table
+		self.extender.filterTable(self.tabName)
+
+	# override removeUpdate for when text is removed
+	def removeUpdate(self, event):
+
+		# filter the table
+		self.extender.filterTable(self.tabName)
+
+
+#
+# extend DocumentListener to update the issue location when text is inserted or removed from the host, port, or path
+#
+
+class CustomDocumentListener(DocumentListener):
+
+	# initialize variables
+	def __init__(self, extender):
+		self.extender = extender
+
+	# override changedUpdate for when the style of text changes
+	def changedUpdate(self, event):
+		pass
+
+	# override changedUpdate for when text is inserted
+	def insertUpdate(self, event):
+
+		# update the issue location text area
+		self.extender.updateTextAreaIssueLocation()
+
+	# override changedUpdate for when text is removed
+	def removeUpdate(self, event):
+
+		# update the issue location text area
+		self.extender.updateTextAreaIssueLocation()
+
+
+#
+# extend ActionListener to update the issue location when the protocol combo box is changed
+#
+
+class CustomActionListener(ActionListener):
+
+	# initialize variables
+	def __init__(self, extender):
+		self.extender = extender
+
+	# override actionPerformed
+	def actionPerformed(self, event):
+
+		# get the selected protocol
+		protocol = self.extender._dictionaryOfComboBoxes[self.extender._DIALOG_TAB_1_NAME + " Protocol"].getSelectedItem().strip()
+
+		# get the port
+		port = self.extender._dictionaryOfTextAreas[self.extender._DIALOG_TAB_1_NAME + " Port"].getText()
+
+		# check if selected protocol is https and the current port is not 443
+		if protocol == "HTTPS" and port != "443":
+
+			# set port to 443
+			self.extender._dictionaryOfTextAreas[self.extender._DIALOG_TAB_1_NAME + " Port"].setText("443")
+
+		# check if selected protocol is http and the current port is not 80
+		elif protocol == "HTTP" and port != "80":
+
+			# set port to 80
+			self.extender._dictionaryOfTextAreas[self.extender._DIALOG_TAB_1_NAME + " Port"].setText("80")
+
+		# update the issue location text area
+		self.extender.updateTextAreaIssueLocation()
+
+
+#
+# extend JTable to handle cell selection for tables
+#
+
+class CustomJTable(JTable):
+
+	# initialize variables
+	def __init__(self, extender, tableModel, tabName):
+		self.extender = extender
+		self.tableModel = tableModel
+		self.setModel(tableModel)
+		self.tabName = tabName
+
+	# override changeSelection
+	def changeSelection(self, row, column, toggle, extend):
+
+		# get index of selected row
+		modelRowIndex = self.convertRowIndexToModel(row)
+
+		# get the last selected row and column
+		selectedRow = self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Row"]
+		selectedColumn = self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Column"]
+
+		# get the mouse state to not update if the mouse is pressed
+		mouseState = self.extender._mouseState
+
+		# check if the same cell was clicked again and that the row should be unselected
+		if selectedRow == modelRowIndex and selectedColumn == column and self.extender._allowTableRowToBeUnselected == True and mouseState == "Released":
+
+			# set toggle and extend variables
+			toggle = True
+			extend = False
+
+			# deselect row
+			JTable.changeSelection(self, row, column, toggle, extend)
+
+			# clear tab
+			self.extender.clearMainTabOrIssueSelectionTab(self.tabName)
+
+			# unselect the row
+			self.clearSelection()
+
+			# remove border from cell when unselected
+			selectionModel = self.getSelectionModel()
+			selectionModel.setAnchorSelectionIndex(-1)
+			selectionModel.setLeadSelectionIndex(-1)
+
+			# remove border from cell when unselected
+			columnModel = self.getColumnModel()
+			columnModel.getSelectionModel().setAnchorSelectionIndex(-1)
+			columnModel.getSelectionModel().setLeadSelectionIndex(-1)
+
+			# clear the last selected row and column
+			self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Row"] = -1
+			self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Column"] = -1
+
+			# do not continue
+			return
+
+		# different row selected or same row but different column
+		else:
+			pass
+
+		# set the last selected row and column
+		self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Row"] = self.convertRowIndexToModel(row)
+		self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Column"] = column
+
+		# add default changeSelection
+		JTable.changeSelection(self, row, column, toggle, extend)
+
+		# load the text of the selected issue if it has not been loaded yet
+		self.tableModel.loadRow(modelRowIndex)
+
+		# get values from selected row
+		selectedIssueName = self.getValueAt(row, 0)
+		selectedSeverity = self.getValueAt(row, 1)
+		selectedIssueDetail = self.getValueAt(row, 3)
+		selectedIssueBackground = self.getValueAt(row, 4)
+		selectedRemediationDetail = self.getValueAt(row, 5)
+		selectedRemediationBackground = self.getValueAt(row, 6)
+
+		# update text panes
+		self.extender._dictionaryOfTextPanes[self.tabName + " Issue Name"].setText(self.extender._HTML_FOR_TEXT_PANES[0] + selectedIssueName + self.extender._HTML_FOR_TEXT_PANES[1])
+		self.extender._dictionaryOfTextPanes[self.tabName + " Severity"].setText(self.extender._HTML_FOR_TEXT_PANES[0] + selectedSeverity + self.extender._HTML_FOR_TEXT_PANES[1])
+
+		# update text areas
+		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Detail"].setText(selectedIssueDetail)
+		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Background"].setText(selectedIssueBackground)
+		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Detail"].setText(selectedRemediationDetail)
+		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Background"].setText(selectedRemediationBackground)
+
+		# scroll to top of text panes
+		self.extender._dictionaryOfTextPanes[self.tabName + " Issue Name"].setCaretPosition(0)
+		self.extender._dictionaryOfTextPanes[self.tabName + " Severity"].setCaretPosition(0)
+
+		# scroll to top of text areas
+		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Detail"].setCaretPosition(0)
+		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Background"].setCaretPosition(0)
+		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Detail"].setCaretPosition(0)
+		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Background"].setCaretPosition(0)
+
+
+#
+# store each distinct block of text once and reference it by id, since many issues share the same background and remediation text
+#
+
+class CustomTextStore():
+
+	# initialize variables
+	def __init__(self):
+		self.texts = []
+		self.referenceCounts = array("i")
+		self.dictionaryOfTextIds = dict()
+		self.freeTextIds = []
+
+		# set the number of bytes that were not stored because the text was already in the store
+		self.bytesSaved = 0
+
+	# get the number of bytes the text takes up in memory, since java stores strings as utf-16
+	def getSizeOfText(self, text):
+		return len(text) * 2
+
+	# add text to the store and return its id
+	def addText(self, text):
+
+		# get the id of the text if it is already in the store
+		textId = self.dictionaryOfTextIds.get(text)
+
+		# check if the text is already in the store
+		if textId != None:
+
+			# add a reference to the text
+			self.referenceCounts[textId] += 1
+
+			# add the size of the text that did not need to be stored again
+			self.bytesSaved += self.getSizeOfText(text)
+
+			# return the id
+			return textId
+
+		# check if there is an id that can be reused
+		if len(self.freeTextIds) > 0:
+
+			# reuse the id
+			textId = self.freeTextIds.pop()
+			self.texts[textId] = text
+			self.referenceCounts[textId] = 1
+
+		# there are no ids to reuse
+		else:
+			# create a new id
+			textId = len(self.texts)
+			self.texts.append(text)
+			self.referenceCounts.append(1)
+
+		# index the text
+		self.dictionaryOfTextIds[text] = textId
+
+		# return the id
+		return textId
+
+	# get the text for an id
+	def getText(self, textId):
+		return self.texts[textId]
+
+	# remove a reference to the text for an id
+	def removeText(self, textId):
+
+		# get the text
+		text = self.texts[textId]
+
+		# remove the reference
+		self.referenceCounts[textId] -= 1
+
+		# check if there are other references to the text
+		if self.referenceCounts[textId] > 0:
+
+			# remove the size of the text that is no longer saved
+			self.bytesSaved -= self.getSizeOfText(text)
+
+		# there are no references to the text
+		else:
+			# remove the text so the id can be reused
+			del self.dictionaryOfTextIds[text]
+			self.texts[textId] = None
+			self.freeTextIds.append(textId)
+
+	# get the number of bytes saved by storing each distinct block of text once
+	def getBytesSaved(self):
+		return self.bytesSaved
+
+
+#
+# extend AbstractTableModel to store the issues in compact parallel arrays instead of a vector of vectors
+#
+
+class CustomIssueTableModel(AbstractTableModel):
+
+	# set the number of characters of text kept in each sort key
+	SORT_KEY_LENGTH = 32
+
+	# initialize variables
+	def __init__(self, columnNames, severityValues, issueTypeValues):
+		self.columnNames = columnNames
+
+		# create the known values for the severity and issue type, which are stored as small ordinals
+		self.severityValues = []
+		self.dictionaryOfSeverityOrdinals = dict()
+		self.issueTypeValues = []
+		self.dictionaryOfIssueTypeOrdinals = dict()
+
+		# add the known values so the default choices have the lowest ordinals
+		for severity in severityValues:
+			self.getOrdinal(severity, self.severityValues, self.dictionaryOfSeverityOrdinals)
+		for issueType in issueTypeValues:
+			self.getOrdinal(issueType, self.issueTypeValues, self.dictionaryOfIssueTypeOrdinals)
+
+		# create a parallel array for each column
+		self.issueNames = []
+		self.severities = array("i")
+		self.issueTypes = array("i")
+		self.issueDetails = []
+
+		# create a store for the background and remediation text, which is stored once and referenced by id from each row
+		self.textStore = CustomTextStore()
+		self.issueBackgrounds = array("i")
+		self.remediationDetails = array("i")
+		self.remediationBackgrounds = array("i")
+
+		# create an array of the loader and key for rows whose text has not been loaded yet, or none once the text is loaded
+		self.rowLoaders = []
+
+		# create an array of row ids that do not change when other rows are deleted, for indexes that refer to rows
+		self.rowIds = array("i")
+		self.nextRowId = 0
+
+		# create a parallel array of cached sort keys for each text column, which are created the first time the column is sorted
+		self.sortKeys = dict((column, []) for column in (0, 3, 4, 5, 6))
+
+		# create a parallel array of the generation each row was added in and a log of deleted rows, so only the changes since an export can be exported
+		self.generation = 0
+		self.rowGenerations = array("i")
+		self.deletionLog = []
+
+	# get the ordinal of a value, adding the value if it has not been seen before
+	def getOrdinal(self, value, values, dictionaryOfOrdinals):
+
+		# get the ordinal
+		ordinal = dictionaryOfOrdinals.get(value)
+
+		# check if the value has not been seen before
+		if ordinal == None:
+
+			# add the value
+			ordinal = len(values)
+			values.append(value)
+			dictionaryOfOrdinals[value] = ordinal
+
+		# return the ordinal
+		return ordinal
+
+	# override getRowCount
+	def getRowCount(self):
+		return len(self.issueNames)
+
+	# override getColumnCount
+	def getColumnCount(self):
+		return len(self.columnNames)
+
+	# override getColumnName
+	def getColumnName(self, column):
+		return self.columnNames[column]
+
+	# override isCellEditable
+	def isCellEditable(self, row, column):
+
+		# make cell uneditable
+		return False
+
+	# override getValueAt
+	def getValueAt(self, row, column):
+
+		# check which column to get the value from
+		if column == 0:
+			return self.issueNames[row]
+		elif column == 1:
+			return self.severityValues[self.severities[row]]
+		elif column == 2:
+			return self.issueTypeValues[self.issueTypes[row]]
+		elif self.rowLoaders[row] != None:
+			return self.getTextFromLoader(row, column)
+		elif column == 3:
+			return self.issueDetails[row]
+		elif column == 4:
+			return self.textStore.getText(self.issueBackgrounds[row])
+		elif column == 5:
+			return self.textStore.getText(self.remediationDetails[row])
+		elif column == 6:
+			return self.textStore.getText(self.remediationBackgrounds[row])
+
+	# get the text of a row that has not been loaded yet without keeping it, so rendering a row does not load it
+	def getTextFromLoader(self, row, column):
+
+		# get the loader and key
+		loader, key = self.rowLoaders[row]
+
+		# return the text for the column
+		return loader.loadTemplateBodies(key)[column - 3]
+
+	# get the id of a row
+	def getRowId(self, row):
+		return self.rowIds[row]
+
+	# normalize text for sorting by ignoring case and repeated whitespace
+	def normalizeText(self, text):
+		return u" ".join(text.replace(u"\x00", u"").lower().split())
+
+	# get the sort key of a text cell, which is the start of the normalized text followed by a null character if the text may continue past it
+	def getSortKey(self, row, column):
+
+		# get the cached sort key
+		sortKeys = self.sortKeys[column]
+		sortKey = sortKeys[row]
+
+		# check if the sort key has not been created
+		if sortKey == None:
+
+			# get the text
+			text = self.getValueAt(row, column)
+
+			# normalize the start of the text, with extra characters for the whitespace that is removed
+			sortKey = self.normalizeText(text[:self.SORT_KEY_LENGTH * 2])
+
+			# check if the text may continue past the sort key
+			if len(text) > self.SORT_KEY_LENGTH * 2 or len(sortKey) > self.SORT_KEY_LENGTH:
+
+				# shorten the sort key and mark that the full text is needed to break ties
+				sortKey = sortKey[:self.SORT_KEY_LENGTH] + u"\x00"
+
+			# cache the sort key
+			sortKeys[row] = sortKey
+
+		# return the sort key
+		return sortKey
+
+	# add empty sort keys for new rows
+	def addSortKeys(self, numberOfRows):
+
+		# loop through each text column
+		for sortKeys in self.sortKeys.itervalues():
+
+			# add the empty sort keys
+			sortKeys.extend([None] * numberOfRows)
+
+	# add a new row id and the generation the row was added in, which is the current generation unless another is given
+	def addRowId(self, generation=None):
+		self.rowIds.append(self.nextRowId)
+		self.nextRowId += 1
+		self.rowGenerations.append(self.generation if generation == None else generation)
+
+	# get the rows with ids in a set, from the bottom of the table up
+	def getRowsOfRowIds(self, setOfRowIds):
+		return [row for row in range(self.getRowCount() - 1, -1, -1) if self.rowIds[row] in setOfRowIds]
+
+	# start a new generation and return it, so rows added and deleted from now on can be told apart from earlier changes
+	def startGeneration(self):
+		self.generation += 1
+		return self.generation
+
+	# record the fingerprint of a row that is about to be removed, along with the generation it was added and removed in
+	def recordDeletion(self, row, fingerprint):
+		self.deletionLog.append((self.generation, self.rowGenerations[row], fingerprint))
+
+	# drop the deleted rows that were recorded before a generation
+	def discardDeletionsBefore(self, generation):
+		self.deletionLog = [deletion for deletion in self.deletionLog if deletion[0] >= generation]
+
+	# get the rows added and the fingerprints of the rows deleted since a generation
+	def getChangesSince(self, generation):
+
+		# get the rows added in or after the generation
+		listOfRows = [self.getRow(row) for row in range(self.getRowCount()) if self.rowGenerations[row] >= generation]
+
+		# get the rows deleted in or after the generation, except rows that were also added after it
+		listOfFingerprints = [fingerprint for deletedGeneration, addedGeneration, fingerprint in self.deletionLog if deletedGeneration >= generation and addedGeneration < generation]
+
+		# return the changes
+		return listOfRows, listOfFingerprints
+
+	# get all of the values in a row
+	def getRow(self, row):
+		return [self.getValueAt(row, column) for column in range(7)]
+
+	# get the values of a row to search, which for rows whose text is decoded each time it is needed, such as a mounted library, are only the issue name, severity, and issue type so searching does not decode the whole library
+	def getSearchableRow(self, row):
+
+		# check if the text of the row is not kept in the table
+		if self.rowLoaders[row] != None and not self.rowLoaders[row][0].KEEP_LOADED_TEXT:
+
+			# return the values that are kept in the table
+			return [self.getValueAt(row, column) for column in range(3)] + [u""] * 4
+
+		# return all of the values
+		return self.getRow(row)
+
+	# check if a row was added by a loader, such as a mounted library
+	def isRowFromLoader(self, row, loader):
+		return self.rowLoaders[row] != None and self.rowLoaders[row][0] is loader
+
+	# add a row
+	def addRow(self, row):
+		self.addRows([row])
+
+	# add multiple rows with a single table changed event
+	def addRows(self, rows):
+
+		# check if there are no rows to add
+		if len(rows) == 0:
+			return
+
+		# get the index of the first new row
+		firstRow = self.getRowCount()
+
+		# loop through each row
+		for issueName, severity, issueType, issueDetail, issueBackground, remediationDetail, remediationBackground in rows:
+
+			# get the ordinals before adding to any column, so a value that cannot be stored does not leave the columns different lengths
+			severityOrdinal = self.getOrdinal(severity, self.severityValues, self.dictionaryOfSeverityOrdinals)
+			issueTypeOrdinal = self.getOrdinal(issueType, self.issueTypeValues, self.dictionaryOfIssueTypeOrdinals)
+
+			# add the value for each column
+			self.issueNames.append(issueName)
+			self.severities.append(severityOrdinal)
+			self.issueTypes.append(issueTypeOrdinal)
+			self.issueDetails.append(issueDetail)
+			self.issueBackgrounds.append(self.textStore.addText(issueBackground))
+			self.remediationDetails.append(self.textStore.addText(remediationDetail))
+			self.remediationBackgrounds.append(self.textStore.addText(remediationBackground))
+			self.rowLoaders.append(None)
+			self.addRowId()
+
+		# add the sort keys for the new rows
+		self.addSortKeys(len(rows))
+
+		# fire a single event so each table and row sorter only update once
+		self.fireTableRowsInserted(firstRow, self.getRowCount() - 1)
+
+	# add rows that only contain the issue name, severity, and issue type, and load the rest of the text when the row is selected
+	def addLazyRows(self, loader, index, generation=None):
+
+		# check if there are no rows to add
+		if len(index) == 0:
+			return
+
+		# get the index of the first new row
+		firstRow = self.getRowCount()
+
+		# loop through each row
+		for key, issueName, severity, issueType in index:
+
+			# get the ordinals before adding to any column, so a value that cannot be stored does not leave the columns different lengths
+			severityOrdinal = self.getOrdinal(severity, self.severityValues, self.dictionaryOfSeverityOrdinals)
+			issueTypeOrdinal = self.getOrdinal(issueType, self.issueTypeValues, self.dictionaryOfIssueTypeOrdinals)
+
+			# add the value for each column that is loaded now
+			self.issueNames.append(issueName)
+			self.severities.append(severityOrdinal)
+			self.issueTypes.append(issueTypeOrdinal)
+
+			# add placeholders for the text that is loaded later
+			self.issueDetails.append(None)
+			self.issueBackgrounds.append(-1)
+			self.remediationDetails.append(-1)
+			self.remediationBackgrounds.append(-1)
+
+			# add the loader and key to load the text with
+			self.rowLoaders.append((loader, key))
+			self.addRowId(generation)
+
+		# add the sort keys for the new rows
+		self.addSortKeys(len(index))
+
+		# fire a single event so each table and row sorter only update once
+		self.fireTableRowsInserted(firstRow, self.getRowCount() - 1)
+
+	# load the text of a row if it has not been loaded yet
+	def loadRow(self, row):
+
+		# check if the row has already been loaded
+		if self.rowLoaders[row] == None:
+			return
+
+		# get the loader and key
+		loader, key = self.rowLoaders[row]
+
+		# check if the loader decodes the text each time it is needed instead of having it kept in the table, such as a mounted library
+		if not loader.KEEP_LOADED_TEXT:
+			return
+
+		# load the text
+		issueDetail, issueBackground, remediationDetail, remediationBackground = loader.loadTemplateBodies(key)
+
+		# store the text
+		self.issueDetails[row] = issueDetail
+		self.issueBackgrounds[row] = self.textStore.addText(issueBackground)
+		self.remediationDetails[row] = self.textStore.addText(remediationDetail)
+		self.remediationBackgrounds[row] = self.textStore.addText(remediationBackground)
+
+		# set that the row has been loaded
+		self.rowLoaders[row] = None
+
+	# remove a row
+	def removeRow(self, row):
+
+		# check if the text of the row has been loaded
+		if self.rowLoaders[row] == None:
+
+			# remove the references to the stored text
+			self.textStore.removeText(self.issueBackgrounds[row])
+			self.textStore.removeText(self.remediationDetails[row])
+			self.textStore.removeText(self.remediationBackgrounds[row])
+
+		# remove the value for each column
+		del self.issueNames[row]
+		del self.severities[row]
+		del self.issueTypes[row]
+		del self.issueDetails[row]
+		del self.issueBackgrounds[row]
+		del self.remediationDetails[row]
+		del self.remediationBackgrounds[row]
+		del self.rowLoaders[row]
+		del self.rowIds[row]
+		del self.rowGenerations[row]
+
+		# loop through each text column
+		for sortKeys in self.sortKeys.itervalues():
+
+			# remove the sort key
+			del sortKeys[row]
+
+		# update the tables
+		self.fireTableRowsDeleted(row, row)
+
+	# remove multiple rows by building each column once without them, with a single table changed event
+	def removeRows(self, listOfRows):
+
+		# get the rows to remove
+		setOfRows = set(listOfRows)
+
+		# check if there are no rows to remove
+		if len(setOfRows) == 0:
+			return
+
+		# loop through each row to remove
+		for row in setOfRows:
+
+			# check if the text of the row has been loaded
+			if self.rowLoaders[row] == None:
+
+				# remove the references to the stored text
+				self.textStore.removeText(self.issueBackgrounds[row])
+				self.textStore.removeText(self.remediationDetails[row])
+				self.textStore.removeText(self.remediationBackgrounds[row])
+
+		# get the rows to keep
+		listOfRowsToKeep = [row for row in range(self.getRowCount()) if row not in setOfRows]
+
+		# build the value for each column from the rows to keep
+		self.issueNames = [self.issueNames[row] for row in listOfRowsToKeep]
+		self.severities = array("i", [self.severities[row] for row in listOfRowsToKeep])
+		self.issueTypes = array("i", [self.issueTypes[row] for row in listOfRowsToKeep])
+		self.issueDetails = [self.issueDetails[row] for row in listOfRowsToKeep]
+		self.issueBackgrounds = array("i", [self.issueBackgrounds[row] for row in listOfRowsToKeep])
+		self.remediationDetails = array("i", [self.remediationDetails[row] for row in listOfRowsToKeep])
+		self.remediationBackgrounds = array("i", [self.remediationBackgrounds[row] for row in listOfRowsToKeep])
+		self.rowLoaders = [self.rowLoaders[row] for row in listOfRowsToKeep]
+		self.rowIds = array("i", [self.rowIds[row] for row in listOfRowsToKeep])
+		self.rowGenerations = array("i", [self.rowGenerations[row] for row in listOfRowsToKeep])
+
+		# loop through each text column
+		for column, sortKeys in self.sortKeys.items():
+
+			# build the sort keys from the rows to keep
+			self.sortKeys[column] = [sortKeys[row] for row in listOfRowsToKeep]
+
+		# fire a single event so each table and row sorter only update once
+		self.fireTableDataChanged()
+
+
+#
+# extend TableStringConverter to convert text cells to their cached sort keys
+#
+
+class CustomSortKeyStringConverter(TableStringConverter):
+
+	# override toString
+	def toString(self, tableModel, row, column):
+
+		# get the sort key
+		sortKey = tableModel.getSortKey(row, column)
+
+		# check if the full text is needed to break ties
+		if sortKey.endswith(u"\x00"):
+
+			# add the row so the comparator can get the full text
+			return sortKey + unicode(row)
+
+		# return the sort key
+		return sortKey
+
+
+#
+# extend Comparator to compare text cells by their sort keys and only compare the full text when the sort keys are the same
+#
+
+class CustomSortKeyComparator(Comparator):
+
+	# initialize variables
+	def __init__(self, tableModel, column):
+		self.tableModel = tableModel
+		self.column = column
+
+	# override compare
+	def compare(self, sortKey1, sortKey2):
+
+		# split each sort key into the start of the text and the row to get the full text from
+		prefix1, separator1, row1 = sortKey1.partition(u"\x00")
+		prefix2, separator2, row2 = sortKey2.partition(u"\x00")
+
+		# compare the start of the text
+		result = cmp(prefix1, prefix2)
+
+		# check if the start of the text is different or the full text is not needed to break the tie
+		if result != 0 or not separator1 or not separator2:
+
+			# put text that ends at the sort key first
+			return result or cmp(len(separator1), len(separator2))
+
+		# compare the full text
+		return cmp(self.tableModel.normalizeText(self.tableModel.getValueAt(int(row1), self.column)), self.tableModel.normalizeText(self.tableModel.getValueAt(int(row2), self.column)))
+
+
+#
+# extend Comparator to compare values by their ordinals, such as severities by the order of the severity choices
+#
+
+class CustomOrdinalComparator(Comparator):
+
+	# initialize variables
+	def __init__(self, dictionaryOfOrdinals):
+		self.dictionaryOfOrdinals = dictionaryOfOrdinals
+
+	# override compare
+	def compare(self, value1, value2):
+
+		# get the ordinal of each value, values without an ordinal go last
+		ordinal1 = self.dictionaryOfOrdinals.get(value1, sys.maxint)
+		ordinal2 = self.dictionaryOfOrdinals.get(value2, sys.maxint)
+
+		# compare the ordinals
+		return cmp(ordinal1, ordinal2)
+
+
+#
+# extend TableRowSorter to toggle sorting (ascending, descending, unsorted)
+#
+
+class CustomTableRowSorter(TableRowSorter):
+
+	# set that the table is not ordered by how well issue names matched a search
+	rankingActive = False
+
+	# sort the severity column by severity and the text columns by the cached sort keys of the table model
+	def useSortKeys(self):
+
+		# get the table model
+		tableModel = self.getModel()
+
+		# convert text cells to their sort keys
+		self.setStringConverter(CustomSortKeyStringConverter())
+
+		# sort the severity column by the order of the severity choices
+		self.setComparator(1, CustomOrdinalComparator(tableModel.dictionaryOfSeverityOrdinals))
+
+		# loop through each text column
+		for column in tableModel.sortKeys:
+
+			# sort the text column by its sort keys
+			self.setComparator(column, CustomSortKeyComparator(tableModel, column))
+
+	# override useToString so the text columns are compared by their sort keys, except when issue names are ordered by score
+	def useToString(self, column):
+		return column in self.getModel().sortKeys and not (column == 0 and self.rankingActive)
+
+	# order the table by the scores of issue names that matched a search, or stop ordering by the scores if there are none
+	def setRanking(self, dictionaryOfScores):
+
+		# check if there are no scores
+		if dictionaryOfScores == None:
+
+			# check if the table is ordered by the scores
+			if self.rankingActive:
+
+				# stop ordering by the scores and unsort the table
+				self.clearRanking()
+				self.setSortKeys(None)
+
+			# do not continue
+			return
+
+		# check if the user has sorted the table by a column, which takes priority over the scores
+		if not self.rankingActive and not self.getSortKeys().isEmpty():
+			return
+
+		# order the issue name column by the scores
+		self.rankingActive = True
+		self.setComparator(0, CustomRankComparator(dictionaryOfScores))
+		self.setSortKeys([RowSorter.SortKey(0, SortOrder.ASCENDING)])
+
+	# stop ordering the issue name column by the scores
+	def clearRanking(self):
+		self.rankingActive = False
+		self.setComparator(0, CustomSortKeyComparator(self.getModel(), 0))
+
+	# override toggleSortOrder
+	def toggleSortOrder(self, column):
+
+		# check if the table is ordered by the scores
+		if self.rankingActive:
+
+			# stop ordering by the scores so the clicked column is sorted normally
+			self.clearRanking()
+			self.setSortKeys(None)
+
+		# check if valid column 
+		if column >= 0:
+
+			# get the sort keys
+			keys = self.getSortKeys()
+
+			# check if the sort keys are not empty
+			if keys.isEmpty() == False:
+
+				# get the sort key
+				sortKey = keys.get(0)
+
+				# check if the column clicked is sorted in descending order
+				if sortKey.getColumn() == column and sortKey.getSortOrder() == SortOrder.DESCENDING:
+
+					# clear sorting
+					self.setSortKeys(None)
+
+					# do not continue
+					return
+
+		# toggle default toggleSortOrder
+		TableRowSorter.toggleSortOrder(self, column)
+
+
+#
+# extend MouseListener to detect mouse clicks on tables so row doesn't flash (select and unselect constantly) when dragging a clicked mouse
+#
+
+class CustomMouseListener(MouseListener):
+
+	# initialize variables
+	def __init__(self, extender):
+		self.extender = extender
+
+	# override mousePressed
+	def mousePressed(self, event):
+
+		# set mouse state
+		self.extender._mouseState = "Pressed"
+
+	# override mouseReleased
+	def mouseReleased(self, event):
+
+		# set mouse state
+		self.extender._mouseState = "Released"
+
+	# override mouseClicked
+	def mouseClicked(self, event):
+		pass
+
+	# override mouseEntered
+	def mouseEntered(self, event):
+		pass
+
+	# override mouseExited
+	def mouseExited(self, event):
+		pass
+
+
+#
+# extend FileFilter to match files by a suffix that can have more than one extension, such as .csv.gz
+#
+
+class CustomFileNameSuffixFilter(FileFilter):
+
+	# initialize variables
+	def __init__(self, description, suffix):
+		self.description = description
+		self.suffix = suffix
+
+	# override accept
+	def accept(self, fileToFilter):
+
+		# show directories and files that end with the suffix
+		return fileToFilter.isDirectory() or fileToFilter.getName().lower().endswith(self.suffix)
+
+	# override getDescription
+	def getDescription(self):
+		return self.description
+
+
+#
+# extend Runnable to run a function on the Swing event thread or on a background thread
+#
+
+class CustomRunnable(Runnable):
+
+	# initialize variables
+	def __init__(self, function):
+		self.function = function
+
+	# override run
+	def run(self):
+		self.function()
+
+
+#
+# write issues to a binary snapshot: a header, a table of block offsets, and blocks of length prefixed rows that can each be compressed
+#
+
+class CustomIssueSnapshotWriter():
+
+	# initialize variables
+	def __init__(self, fileObject, rowCount, compress=True, blockSize=256):
+		self.fileObject = fileObject
+		self.rowCount = rowCount
+		self.compress = compress
+		self.blockSize = blockSize
+
+		# set the number of blocks
+		self.blockCount = (rowCount + blockSize - 1) // blockSize
+
+		# create the rows of the current block and the offset, stored length, and length of each block written
+		self.blockOfRows = []
+		self.blockEntries = []
+
+		# write the header
+		self.fileObject.write(struct.pack(CustomIssueSnapshotReader.HEADER_FORMAT, CustomIssueSnapshotReader.MAGIC, CustomIssueSnapshotReader.VERSION, CustomIssueSnapshotReader.FLAG_COMPRESSED if compress else 0, rowCount, blockSize, self.blockCount))
+
+		# reserve space for the block table, which is written once the blocks have been written
+		self.fileObject.write("\x00" * (self.blockCount * CustomIssueSnapshotReader.BLOCK_ENTRY_SIZE))
+
+	# add a row of unicode values
+	def addRow(self, row):
+
+		# encode each value
+		self.blockOfRows.append([value.encode("utf-8") for value in row])
+
+		# check if the block is full
+		if len(self.blockOfRows) == self.blockSize:
+
+			# write the block
+			self.writeBlock()
+
+	# write the rows of the current block
+	def writeBlock(self):
+
+		# create the offset of each row in the block and the rows
+		rowOffsets = []
+		rowData = []
+		offset = 0
+
+		# loop through each row
+		for row in self.blockOfRows:
+
+			# add the offset of the row
+			rowOffsets.append(offset)
+
+			# loop through each value
+			for value in row:
+
+				# add the length and the value
+				rowData.append(struct.pack(">I", len(value)))
+				rowData.append(value)
+				offset += 4 + len(value)
+
+		# create the block with the number of rows, the offset of each row, and the rows
+		block = struct.pack(">I%dI" % len(rowOffsets), len(rowOffsets), *rowOffsets) + "".join(rowData)
+
+		# compress the block if compression is on
+		storedBlock = zlib.compress(block) if self.compress else block
+
+		# add the block to the block table and write it
+		self.blockEntries.append(struct.pack(CustomIssueSnapshotReader.BLOCK_ENTRY_FORMAT, self.fileObject.tell(), len(storedBlock), len(block)))
+		self.fileObject.write(storedBlock)
+
+		# start a new block
+		self.blockOfRows = []
+
+	# write the last block and the block table
+	def close(self):
+
+		# check if there are rows in the last block
+		if len(self.blockOfRows) > 0:
+
+			# write the last block
+			self.writeBlock()
+
+		# check if every row was written
+		if len(self.blockEntries) != self.blockCount:
+			raise ValueError("The snapshot has " + str(len(self.blockEntries)) + " blocks instead of " + str(self.blockCount))
+
+		# write the block table after the header
+		self.fileObject.seek(CustomIssueSnapshotReader.HEADER_SIZE)
+		self.fileObject.write("".join(self.blockEntries))
+
+
+#
+# read issues from a binary snapshot by block, or read a single row without parsing the rest of the snapshot
+#
+
+class CustomIssueSnapshotReader():
+
+	# set the format of the header: the magic, version, flags, number of rows, rows per block, and number of blocks
+	MAGIC = "ATCI"
+	VERSION = 1
+	FLAG_COMPRESSED = 1
+	HEADER_FORMAT = ">4sHHIII"
+	HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+	# set the format of each entry in the block table: the offset of the block, its stored length, and its length after decompressing
+	BLOCK_ENTRY_FORMAT = ">QII"
+	BLOCK_ENTRY_SIZE = struct.calcsize(BLOCK_ENTRY_FORMAT)
+
+	# initialize variables with a function that reads a length of bytes from an offset and the size of the file
+	def __init__(self, readBytes, fileSize):
+		self.readBytes = readBytes
+
+		# read the header
+		magic, version, self.flags, self.rowCount, self.blockSize, blockCount = struct.unpack(self.HEADER_FORMAT, readBytes(0, self.HEADER_SIZE))
+
+		# check if this is not a snapshot
+		if magic != self.MAGIC:
+			raise ValueError("The file is not an issue snapshot.")
+
+		# check if the snapshot is from a newer version
+		if version > self.VERSION:
+			raise ValueError("The issue snapshot is version " + str(version) + ", which is newer than this extension supports.")
+
+		# check if the number of blocks does not match the number of rows, so a damaged header cannot read past the last block
+		if (self.blockSize == 0 and self.rowCount != 0) or (self.blockSize != 0 and blockCount != (self.rowCount + self.blockSize - 1) // self.blockSize):
+			raise ValueError("The header of the issue snapshot is corrupt.")
+
+		# check if the block table does not fit in the file
+		if self.HEADER_SIZE + blockCount * self.BLOCK_ENTRY_SIZE > fileSize:
+			raise ValueError("The issue snapshot is truncated.")
+
+		# read the block table
+		blockTable = readBytes(self.HEADER_SIZE, blockCount * self.BLOCK_ENTRY_SIZE)
+		self.blockEntries = [struct.unpack_from(self.BLOCK_ENTRY_FORMAT, blockTable, index * self.BLOCK_ENTRY_SIZE) for index in range(blockCount)]
+
+		# loop through each block
+		for blockIndex, (offset, storedLength, length) in enumerate(self.blockEntries):
+
+			# check if the block does not fit in the file
+			if offset < self.HEADER_SIZE + blockCount * self.BLOCK_ENTRY_SIZE or offset + storedLength > fileSize:
+				raise ValueError("Block " + str(blockIndex) + " of the issue snapshot is corrupt.")
+
+		# create a cache of the last block read, since rows next to each other are usually read together
+		self.cachedBlock = (-1, None)
+
+	# create a reader for a file that is open in binary mode
+	@staticmethod
+	def fromFile(fileObject):
+
+		# read a length of bytes from an offset in the file
+		def readBytes(offset, length):
+
+			# read the bytes
+			fileObject.seek(offset)
+			data = fileObject.read(length)
+
+			# check if the file ended early
+			if len(data) != length:
+				raise ValueError("The issue snapshot is truncated.")
+
+			# return the bytes
+			return data
+
+		# get the size of the file
+		fileObject.seek(0, os.SEEK_END)
+		fileSize = fileObject.tell()
+
+		# return the reader
+		return CustomIssueSnapshotReader(readBytes, fileSize)
+
+	# get the number of rows
+	def getRowCount(self):
+		return self.rowCount
+
+	# read a block, decompressing it if needed
+	def readBlock(self, blockIndex):
+
+		# get the cached block and its index together, so a block cached by another thread at the same time cannot be mixed up with another index
+		cachedBlockIndex, block = self.cachedBlock
+
+		# check if the block is not cached
+		if blockIndex != cachedBlockIndex:
+
+			# get the offset and lengths of the block
+			offset, storedLength, length = self.blockEntries[blockIndex]
+
+			# read the block
+			block = self.readBytes(offset, storedLength)
+
+			# check if the block is compressed
+			if self.flags & self.FLAG_COMPRESSED:
+
+				# decompress the block
+				block = zlib.decompress(block)
+
+			# check if the block is not the expected length
+			if len(block) != length:
+				raise ValueError("Block " + str(blockIndex) + " of the issue snapshot is corrupt.")
+
+			# cache the block
+			self.cachedBlock = (blockIndex, block)
+
+		# return the block
+		return block
+
+	# read the row at an offset in a block and get the offset of the next row
+	def readRowFromBlock(self, block, offset):
+
+		# create the row
+		row = []
+
+		# loop through each column
+		for column in range(7):
+
+			# read the length and the value
+			length = struct.unpack_from(">I", block, offset)[0]
+			row.append(block[offset + 4:offset + 4 + length].decode("utf-8"))
+			offset += 4 + length
+
+		# return the row and the offset of the next row
+		return row, offset
+
+	# read a single row by reading only the block that contains it
+	def readRow(self, index):
+
+		# read the block that contains the row
+		block = self.readBlock(index // self.blockSize)
+
+		# get the number of rows in the block and the offset of the row
+		numberOfRows = struct.unpack_from(">I", block, 0)[0]
+		rowOffset = struct.unpack_from(">I", block, 4 + 4 * (index % self.blockSize))[0]
+
+		# read the row, which starts after the row offsets
+		return self.readRowFromBlock(block, 4 + 4 * numberOfRows + rowOffset)[0]
+
+	# read every row one block at a time
+	def readRows(self):
+
+		# loop through each block
+		for blockIndex in range(len(self.blockEntries)):
+
+			# read the block
+			block = self.readBlock(blockIndex)
+
+			# get the number of rows in the block and where the rows start
+			numberOfRows = struct.unpack_from(">I", block, 0)[0]
+			offset = 4 + 4 * numberOfRows
+
+			# loop through each row in the block
+			for index in range(numberOfRows):
+
+				# read the row
+				row, offset = self.readRowFromBlock(block, offset)
+
+				# return the row
+				yield row
+
+
+#
+# mount a binary snapshot as a read only issue library through a memory mapped buffer, so only the index of rows is kept on the heap and the text is decoded each time it is needed
+#
+
+class CustomMappedIssueLibrary():
+
+	# decode the text each time it is needed instead of keeping it in the table
+	KEEP_LOADED_TEXT = False
+
+	# initialize variables
+	def __init__(self, path):
+		self.path = path
+
+		# open the file
+		randomAccessFile = RandomAccessFile(path, "r")
+
+		# try to map the file, which stays mapped after the file is closed
+		try:
+			fileChannel = randomAccessFile.getChannel()
+			self.mappedBuffer = fileChannel.map(FileChannel.MapMode.READ_ONLY, 0, fileChannel.size())
+
+		# close the file
+		finally:
+			randomAccessFile.close()
+
+		# create the reader, which reads the header and block table
+		self.reader = CustomIssueSnapshotReader(self.readBytes, self.mappedBuffer.capacity())
+
+	# read a length of bytes from an offset in the mapped file
+	def readBytes(self, offset, length):
+
+		# check if the file ended early
+		if offset + length > self.mappedBuffer.capacity():
+			raise ValueError("The issue snapshot is truncated.")
+
+		# copy the bytes from a separate view of the buffer so reads do not share a position
+		mappedBuffer = self.mappedBuffer.duplicate()
+		mappedBuffer.position(offset)
+		data = jarray.zeros(length, "b")
+		mappedBuffer.get(data)
+
+		# return the bytes
+		return data.tostring()
+
+	# get the number of rows
+	def getRowCount(self):
+		return self.reader.getRowCount()
+
+	# read the index of each row along with the fingerprint of the row, so the text is decoded once without being kept
+	def readIndexAndFingerprints(self, createFingerprint):
+
+		# loop through each row
+		for key, row in enumerate(self.reader.readRows()):
+
+			# return the index and fingerprint of the row
+			yield (key, row[0], row[1], row[2]), createFingerprint(row[0], row[1], row[3], row[4], row[5], row[6])
+
+	# decode the issue detail, issue background, remediation detail, and remediation background of a row
+	def loadTemplateBodies(self, key):
+		return self.reader.readRow(key)[3:7]
+
+
+#
+# keep the issue library in a local snapshot and an append-only journal so it survives unloading the extension or burp crashing
+#
+
+class CustomIssueJournal():
+
+	# initialize variables
+	def __init__(self, directory, createFingerprint):
+		self.createFingerprint = createFingerprint
+
+		# set the paths of the snapshot, the journal, the journal that is being compacted, and the snapshot that is being written
+		self.directory = directory
+		self.snapshotPath = os.path.join(directory, "snapshot.jsonl")
+		self.journalPath = os.path.join(directory, "journal.jsonl")
+		self.oldJournalPath = os.path.join(directory, "journal.old.jsonl")
+		self.temporarySnapshotPath = os.path.join(directory, "snapshot.tmp.jsonl")
+
+		# set the path of the file that is locked while the journal is open, so only one instance of burp writes to the journal
+		self.lockPath = os.path.join(directory, "journal.lock")
+		self.lockFile = None
+		self.fileLock = None
+		self.readOnly = False
+
+		# set the least number of records to write to the journal before it is compacted into the snapshot, which grows with the snapshot so each compaction is paid for by as many new records as it rewrites
+		self.compactAfterRecords = 1000
+
+		# create variables for writing to the journal on a background thread while it is compacted on another background thread
+		self.lock = Lock()
+		self.journalFile = None
+		self.journalGeneration = 0
+		self.recordsSinceCompaction = 0
+		self.snapshotRecords = 0
+		self.compacting = False
+		self.compactionThread = None
+
+		# create the queue of records to write, so json encoding and forcing records to disk never run on the Swing event thread
+		self.writeQueue = Queue.Queue()
+		self.writerThread = None
+
+	# read each record from a file, skipping a partial last line left by a crash
+	def readRecords(self, path):
+
+		# check if the file does not exist
+		if not os.path.exists(path):
+			return
+
+		# open the file
+		with open(path, "rb") as recordFile:
+
+			# loop through each line
+			for line in recordFile:
+
+				# try to read the record
+				try:
+					record = json.loads(line)
+
+				# the line was not a complete record
+				except:
+					continue
+
+				# return the record
+				yield record
+
+	# read the generation written as the first record of a file, or none if the file does not exist or has no generation
+	def readGeneration(self, path):
+
+		# check if the file does not exist
+		if not os.path.exists(path):
+			return None
+
+		# read the first line
+		with open(path, "rb") as recordFile:
+			line = recordFile.readline()
+
+		# try to read the record
+		try:
+			record = json.loads(line)
+
+		# the line was not a complete record
+		except:
+			return None
+
+		# return the generation if the record is one
+		return record[1] if isinstance(record, list) and len(record) == 2 and record[0] == "G" else None
+
+	# get the files to fold, leaving out a journal that was already compacted into the snapshot, which is left over if a crash happened before it was removed
+	def getPathsToFold(self, removeCompactedJournal):
+
+		# get the generation of the last journal compacted into the snapshot
+		snapshotGeneration = self.readGeneration(self.snapshotPath)
+
+		# get the generation of the journal that was being compacted
+		oldJournalGeneration = self.readGeneration(self.oldJournalPath)
+
+		# check if the journal that was being compacted is already in the snapshot
+		if snapshotGeneration != None and oldJournalGeneration != None and oldJournalGeneration <= snapshotGeneration:
+
+			# check if the journal can be removed
+			if removeCompactedJournal:
+
+				# remove the journal so its deletes are not applied again
+				os.remove(self.oldJournalPath)
+
+			# fold only the snapshot and the journal
+			return [self.snapshotPath, self.journalPath]
+
+		# fold the snapshot, then the journal that was being compacted, then the journal
+		return [self.snapshotPath, self.oldJournalPath, self.journalPath]
+
+	# fold the records of each file into the rows that were added and the fingerprints of rows that were deleted but not added by the journal, along with the number of records in each file
+	def foldRecords(self, paths):
+
+		# create an ordered dictionary of the fingerprint of each added row to the row
+		dictionaryOfAddedRows = OrderedDict()
+
+		# create a dictionary of the fingerprint of each deleted row to the number of times it was deleted
+		dictionaryOfDeletedFingerprints = dict()
+
+		# create a list of the number of records read from each file
+		listOfNumberOfRecords = []
+
+		# loop through each file
+		for path in paths:
+
+			# create a count of the records read from the file
+			numberOfRecords = 0
+
+			# loop through each record
+			for record in self.readRecords(path):
+
+				# check if a row was added
+				if record[0] == "A" and len(record) == 8:
+
+					# add the row
+					row = record[1:]
+					dictionaryOfAddedRows[self.createFingerprint(row)] = row
+					numberOfRecords += 1
+
+				# check if a row was deleted
+				elif record[0] == "D" and len(record) == 2:
+
+					# check if the row was added by the journal
+					if record[1] in dictionaryOfAddedRows:
+
+						# remove the row
+						del dictionaryOfAddedRows[record[1]]
+
+					# the row was not added by the journal, such as a default issue
+					else:
+						# add the deleted fingerprint
+						dictionaryOfDeletedFingerprints[record[1]] = dictionaryOfDeletedFingerprints.get(record[1], 0) + 1
+
+					# add to the count of records
+					numberOfRecords += 1
+
+			# add the count of records read from the file
+			listOfNumberOfRecords.append(numberOfRecords)
+
+		# return the added rows, deleted fingerprints, and number of records in each file
+		return dictionaryOfAddedRows, dictionaryOfDeletedFingerprints, listOfNumberOfRecords
+
+	# take the lock of the journal, returning false if another instance of burp has it
+	def takeFileLock(self):
+
+		# try to lock the lock file without waiting
+		try:
+			self.lockFile = RandomAccessFile(self.lockPath, "rw")
+			self.fileLock = self.lockFile.getChannel().tryLock()
+
+		# the lock file could not be locked
+		except:
+			self.fileLock = None
+
+		# check if the lock was not taken
+		if self.fileLock == None:
+
+			# close the lock file
+			if self.lockFile != None:
+				self.lockFile.close()
+				self.lockFile = None
+
+			# return that the lock was not taken
+			return False
+
+		# return that the lock was taken
+		return True
+
+	# read the snapshot and journals and open the journal for new records, or only read them if another instance of burp has the journal open
+	def restore(self):
+
+		# create the directory if it does not exist
+		if not os.path.isdir(self.directory):
+			os.makedirs(self.directory)
+
+		# check if another instance of burp has the journal open
+		if not self.takeFileLock():
+
+			# set that the journal is only read, so this instance never renames, removes, or appends to the files of the other instance
+			self.readOnly = True
+
+			# read the snapshot and journals
+			dictionaryOfAddedRows, dictionaryOfDeletedFingerprints, listOfNumberOfRecords = self.foldRecords(self.getPathsToFold(False))
+
+			# return the added rows and deleted fingerprints
+			return dictionaryOfAddedRows.values(), dictionaryOfDeletedFingerprints
+
+		# check if a crash happened after the old snapshot was removed but before the new one replaced it
+		if not os.path.exists(self.snapshotPath) and os.path.exists(self.temporarySnapshotPath):
+
+			# use the new snapshot, which is complete since the old snapshot is only removed after it is written
+			os.rename(self.temporarySnapshotPath, self.snapshotPath)
+
+		# read the snapshot and journals, removing a journal left over from a compaction that finished
+		dictionaryOfAddedRows, dictionaryOfDeletedFingerprints, listOfNumberOfRecords = self.foldRecords(self.getPathsToFold(True))
+
+		# get the generation of the journal
+		self.journalGeneration = self.readGeneration(self.journalPath)
+
+		# open the journal for new records
+		self.journalFile = open(self.journalPath, "ab")
+
+		# check if the journal does not have a generation, such as a new journal
+		if self.journalGeneration == None:
+
+			# set the generation after the generations of the snapshot and the journal that was being compacted
+			self.journalGeneration = max(self.readGeneration(self.snapshotPath), self.readGeneration(self.oldJournalPath), 0) + 1
+
+			# check if the journal is empty
+			if self.journalFile.tell() == 0:
+
+				# write the generation as the first record
+				self.journalFile.write(json.dumps(["G", self.journalGeneration]) + "\n")
+				self.syncFile(self.journalFile)
+
+		# start the thread that writes records to the journal
+		self.writerThread = Thread(CustomRunnable(self.runWriter))
+		self.writerThread.setDaemon(True)
+		self.writerThread.start()
+
+		# compact the journal and snapshot if the journals contain as many records as the snapshot
+		self.snapshotRecords = listOfNumberOfRecords[0]
+		self.recordsSinceCompaction = sum(listOfNumberOfRecords[1:])
+		self.compactIfNeeded()
+
+		# return the added rows and deleted fingerprints
+		return dictionaryOfAddedRows.values(), dictionaryOfDeletedFingerprints
+
+	# flush a file and force it to disk
+	def syncFile(self, recordFile):
+
+		# flush the file
+		recordFile.flush()
+
+		# try to force the file to disk
+		try:
+			os.fsync(recordFile.fileno())
+
+		# the file cannot be forced to disk, but it has been flushed
+		except:
+			pass
+
+	# hand records to the writer thread
+	def appendRecords(self, records):
+		self.writeQueue.put_nowait(records)
+
+	# write the records in the queue to the journal on the background thread, forcing each batch to disk once
+	def runWriter(self):
+
+		# loop until the journal is closed
+		while True:
+
+			# wait for records, then take any other records that are waiting so they are forced to disk together
+			listOfBatches = [self.writeQueue.get()]
+			while True:
+				try:
+					listOfBatches.append(self.writeQueue.get_nowait())
+				except Queue.Empty:
+					break
+
+			# get the records, with none marking that the journal is being closed
+			records = [record for batch in listOfBatches if batch != None for record in batch]
+
+			# try to write the records
+			try:
+				with self.lock:
+
+					# write each record on its own line
+					for record in records:
+						self.journalFile.write(json.dumps(record) + "\n")
+
+					# force the batch to disk
+					self.syncFile(self.journalFile)
+
+					# add to the count of records since the last compaction
+					self.recordsSinceCompaction += len(records)
+
+			# the records could not be written
+			except:
+				# print the error
+				print("Failed to write to the issue journal: " + str(sys.exc_info()[1]))
+
+			# check if the journal is being closed
+			if None in listOfBatches:
+				return
+
+			# compact the journal if it contains many records
+			self.compactIfNeeded()
+
+	# write records for rows that were added
+	def appendAdds(self, rows):
+		self.appendRecords([["A"] + list(row) for row in rows])
+
+	# write a record for a row that was deleted
+	def appendDelete(self, fingerprint):
+		self.appendRecords([["D", fingerprint]])
+
+	# write records for rows that were deleted
+	def appendDeletes(self, listOfFingerprints):
+		self.appendRecords([["D", fingerprint] for fingerprint in listOfFingerprints])
+
+	# start compacting on a background thread if the journal contains at least as many records as the snapshot and it is not already being compacted
+	def compactIfNeeded(self):
+
+		# check if the journal should be compacted
+		with self.lock:
+			if self.compacting or self.recordsSinceCompaction < max(self.compactAfterRecords, self.snapshotRecords):
+				return
+			self.compacting = True
+
+			# compact on a background thread
+			self.compactionThread = Thread(CustomRunnable(self.compact))
+			self.compactionThread.setDaemon(True)
+			self.compactionThread.start()
+
+	# fold the snapshot and journal into a new snapshot on the background thread
+	def compact(self):
 
-		# host is not blank
-		else:
-			# add protocol
-			host = protocol + host
+		# try to compact
+		try:
+			# start a new journal so new records are not written to the one being compacted
+			with self.lock:
 
-		# check if the port is blank
-		if port == "":
+				# check if a journal is not left over from a compaction that did not finish
+				if not os.path.exists(self.oldJournalPath):
 
-			# set message that port is required
-			port = ":PORT_REQUIRED"
+					# move the journal so it can be compacted
+					self.journalFile.close()
+					os.rename(self.journalPath, self.oldJournalPath)
 
-		# port is not blank
-		else:
-			# add colon
-			port = ":" + port
+					# start the new journal with the next generation
+					self.journalGeneration += 1
+					self.journalFile = open(self.journalPath, "ab")
+					self.journalFile.write(json.dumps(["G", self.journalGeneration]) + "\n")
+					self.syncFile(self.journalFile)
 
-		# check that the first character of the path is not a slash
-		if not path.startswith("/"):
+					# reset the count of records since the last compaction, which is only done once the journal has moved so a left over journal does not hide the records in the current one
+					self.recordsSinceCompaction = 0
 
-			# add a slash
-			path = "/" + path
+			# get the generation of the journal being compacted, which is written to the snapshot so a journal left over by a crash is not folded again
+			oldJournalGeneration = self.readGeneration(self.oldJournalPath)
 
-		# set the location
-		self._dictionaryOfTextAreas[self._DIALOG_TAB_1_NAME + " Issue Location"].setText(host + port + path)
+			# read the snapshot and the journal being compacted
+			dictionaryOfAddedRows, dictionaryOfDeletedFingerprints, listOfNumberOfRecords = self.foldRecords([self.snapshotPath, self.oldJournalPath])
 
-		# return
-		return
+			# write the new snapshot to a temporary file
+			with open(self.temporarySnapshotPath, "wb") as snapshotFile:
 
+				# check if the journal has a generation
+				if oldJournalGeneration != None:
 
-#
-# extend IHttpService to create a custom http service for a custom IHttpRequestResponse and a custom IScanIssue
-#
+					# write the generation of the journal as the first record
+					snapshotFile.write(json.dumps(["G", oldJournalGeneration]) + "\n")
 
-class CustomIHttpService(IHttpService):
+				# write the deleted fingerprints
+				for fingerprint, count in dictionaryOfDeletedFingerprints.iteritems():
+					for index in range(count):
+						snapshotFile.write(json.dumps(["D", fingerprint]) + "\n")
 
-	# initialize variables
-	def __init__(self, protocol, host, port):
-		self._protocol = protocol
-		self._host = host
-		self._port = port
+				# write the added rows
+				for row in dictionaryOfAddedRows.itervalues():
+					snapshotFile.write(json.dumps(["A"] + row) + "\n")
 
-	# override getProtocol
-	def getProtocol(self):
-		return self._protocol
+				# force the snapshot to disk before it replaces the old one
+				self.syncFile(snapshotFile)
 
-	# override getHost
-	def getHost(self):
-		return self._host
+			# try to replace the snapshot
+			try:
+				os.rename(self.temporarySnapshotPath, self.snapshotPath)
 
-	# override getPort
-	def getPort(self):
-		return self._port
+			# the snapshot cannot be replaced while it exists on some systems
+			except OSError:
+				os.remove(self.snapshotPath)
+				os.rename(self.temporarySnapshotPath, self.snapshotPath)
+
+			# remove the journal that was compacted
+			os.remove(self.oldJournalPath)
+
+			# set the number of records in the new snapshot
+			with self.lock:
+				self.snapshotRecords = sum(dictionaryOfDeletedFingerprints.itervalues()) + len(dictionaryOfAddedRows)
+
+		# the compaction failed, the snapshot and journals are left as they were so nothing is lost
+		except:
+			# print the error
+			print("Failed to compact the issue journal: " + str(sys.exc_info()[1]))
+
+		# allow another compaction
+		with self.lock:
+			self.compacting = False
+
+	# write the records that are waiting, wait for a compaction to finish, and close the journal
+	def close(self):
+
+		# check if the writer thread was started
+		if self.writerThread != None:
+
+			# stop the writer thread after it writes the records that are waiting
+			self.writeQueue.put_nowait(None)
+			self.writerThread.join()
+			self.writerThread = None
+
+		# get the compaction thread
+		with self.lock:
+			compactionThread = self.compactionThread
+
+		# wait for the compaction to finish so files are not renamed after the lock is released
+		if compactionThread != None:
+			compactionThread.join()
+
+		# close the journal file
+		with self.lock:
+			if self.journalFile != None:
+				self.journalFile.close()
+				self.journalFile = None
+
+			# release the lock so another instance of burp can open the journal
+			if self.lockFile != None:
+				self.fileLock.release()
+				self.lockFile.close()
+				self.lockFile = None
 
 
 #
-# extend IHttpRequestResponse to create a request and response for a custom issue
+# index the issues already in burp by location, name, and severity, so checking for a duplicate is a lookup instead of a scan of every issue
 #
 
-class CustomIHttpRequestResponse(IHttpRequestResponse):
+class CustomScanIssueIndex():
 
 	# initialize variables
-	def __init__(self, comment, highlight, httpService, request, response):
-		self._comment = comment
-		self._highlight = highlight
-		self._httpService = httpService
-		self._request = request
-		self._response = response
+	def __init__(self, callbacks):
+		self.callbacks = callbacks
 
-	# override getRequest
-	def getRequest(self):
-		return self._request
+		# create the set of keys of the issues in burp, and the set of keys without the query for the popup dialog, which has no field for the query
+		self.setOfKeys = set()
+		self.setOfPathKeys = set()
 
-	# override setRequest
-	def setRequest(self, message):
-		self._request = message
+		# create the event that is set once the issues in burp have been added
+		self.seeded = Event()
 
-	# override getResponse
-	def getResponse(self):
-		return self._response
+		# add the issues in burp on a background thread since there can be many
+		thread = Thread(CustomRunnable(self.seed))
+		thread.setDaemon(True)
+		thread.start()
 
-	# override setResponse
-	def setResponse(self, message):
-		self._response = message
+	# add each issue in burp to the index on the background thread
+	def seed(self):
 
-	# override getComment
-	def getComment(self):
-		return self._comment
+		# try to add the issues
+		try:
+			# loop through each issue in burp
+			for issue in self.callbacks.getScanIssues(None):
 
-	# override setComment
-	def setComment(self, comment):
-		self._comment = comment
+				# add the issue
+				self.addIssue(issue)
 
-	# override getHighlight
-	def getHighlight(self):
-		return self._highlight
+		# the issues could not be read
+		except:
+			# print the error
+			print("Failed to index existing issues: " + str(sys.exc_info()[1]))
 
-	# override setHighlight
-	def setHighlight(self, color):
-		self._highlight = color
+		# set that the index has been seeded
+		self.seeded.set()
 
-	# override getHttpService
-	def getHttpService(self):
-		return self._httpService
+	# wait until the issues in burp have been added, which should only be done from a background thread
+	def waitUntilSeeded(self):
+		self.seeded.wait()
 
-	# override setHttpService
-	def setHttpService(self, httpService):
-		self._httpService = httpService
+	# check if the issues in burp have been added
+	def isSeeded(self):
+		return self.seeded.isSet()
+
+	# create the key of an issue from its url, issue name, and severity, with the url normalized so the default port and case of the host do not matter
+	def createKey(self, url, issueName, severity, includeQuery=True):
+
+		# get the port, or the default port of the protocol if there is none
+		port = url.getPort()
+		if port == -1:
+			port = url.getDefaultPort()
+
+		# return the key, using the path and query unless only the path is wanted
+		return (url.getProtocol().lower(), url.getHost().lower(), port, url.getFile() if includeQuery else url.getPath(), issueName, severity)
+
+	# add an issue to the index
+	def addIssue(self, issue):
+		self.setOfKeys.add(self.createKey(issue.getUrl(), issue.getIssueName(), issue.getSeverity()))
+		self.setOfPathKeys.add(self.createKey(issue.getUrl(), issue.getIssueName(), issue.getSeverity(), False))
+
+	# check if the index contains a key
+	def containsKey(self, key):
+		return key in self.setOfKeys
+
+	# check if the index contains an issue with the values from the popup dialog
+	def containsIssue(self, protocol, host, port, path, issueName, severity):
+
+		# try to create the url the issue would have
+		try:
+			url = URL(protocol + "://" + host + ":" + unicode(port) + path)
+
+		# the url is not valid so there cannot be an issue with it
+		except:
+			return False
+
+		# check if the index contains an issue at the path with any query
+		return self.createKey(url, issueName, severity, False) in self.setOfPathKeys
 
 
 #
-# extend IScanIssue to create a new issue
+# add issues to burp one at a time from a single background thread, so calls to addScanIssue never block the Swing event thread
 #
 
-class CustomScanIssue(IScanIssue):
+class CustomScanIssueSubmissionQueue():
 
 	# initialize variables
-	def __init__(self, httpService, url, httpMessages, issueName, issueDetail, confidence, severity, issueBackground, remediationBackground, remediationDetail):
-		self._httpService = httpService
-		self._url = url
-		self._httpMessages = httpMessages
-		self._issueName = issueName
-		self._issueDetail = issueDetail
-		self._confidence = confidence
-		self._severity = severity
-		self._issueBackground = issueBackground
-		self._remediationBackground = remediationBackground
-		self._remediationDetail = remediationDetail
+	def __init__(self, callbacks, scanIssueIndex, extensionName):
+		self.callbacks = callbacks
+		self.scanIssueIndex = scanIssueIndex
+		self.extensionName = extensionName
 
-		# set issue type to Extension Generated Issue 0x08000000 == 134217728
-		self._issueType = 134217728
+		# create the queue of issues to add, which is not limited so adding an issue from the Swing event thread never waits
+		self.queue = Queue.Queue()
 
-	# override getUrl
-	def getUrl(self):
-		return self._url
+		# create the slots for bulk issues, so a bulk add waits for burp to catch up once this many of its issues are in the queue
+		self.bulkIssueSlots = Semaphore(1000)
 
-	# override getIssueName
-	def getIssueName(self):
-		return self._issueName
+		# set that the queue has not been stopped
+		self.stopped = False
 
-	# override getIssueType
-	def getIssueType(self):
-		return self._issueType
+		# create variables for reporting the throughput of bulk issues each time the queue is emptied
+		self.issuesAdded = 0
+		self.issuesFailed = 0
+		self.firstSubmitTime = None
 
-	# override getSeverity
-	def getSeverity(self):
-		return self._severity
+		# start the background thread
+		thread = Thread(CustomRunnable(self.run))
+		thread.setDaemon(True)
+		thread.start()
 
-	# override getConfidence
-	def getConfidence(self):
-		return self._confidence
+	# add a function that creates an issue to the queue without waiting, such as from the Swing event thread
+	def submit(self, function, arguments):
 
-	# override getIssueBackground
-	def getIssueBackground(self):
-		return self._issueBackground
+		# check if the queue was stopped
+		if self.stopped:
+			return
 
-	# override getRemediationBackground
-	def getRemediationBackground(self):
-		return self._remediationBackground
+		# add the function and its arguments
+		self.queue.put_nowait((function, arguments, False))
 
-	# override getIssueDetail
-	def getIssueDetail(self):
-		return self._issueDetail
+	# add an issue that was already created by a bulk add to the queue, which waits on the bulk add thread while too many of its issues are waiting
+	def submitBulkIssue(self, issue):
 
-	# override getRemediationDetail
-	def getRemediationDetail(self):
-		return self._remediationDetail
+		# wait for a slot, checking if the queue was stopped each time the wait times out since the background thread does not free slots once it has stopped
+		while not self.bulkIssueSlots.tryAcquire(100, TimeUnit.MILLISECONDS):
 
-	# override getHttpMessages
-	def getHttpMessages(self):
-		return self._httpMessages
+			# check if the queue was stopped
+			if self.stopped:
+				return
 
-	# override getHttpService
-	def getHttpService(self):
-		return self._httpService
+		# add the issue
+		self.queue.put_nowait((None, issue, True))
 
+	# get the number of issues waiting to be added
+	def getDepth(self):
+		return self.queue.qsize()
 
-#
-# extend JTextArea to allow tab key to transfer focus to next item
-#
+	# stop the background thread after the issues already in the queue are added
+	def stop(self):
 
-class CustomJTextArea(JTextArea):
+		# set that the queue was stopped
+		self.stopped = True
 
-	# override processComponentKeyEvent
-	def processComponentKeyEvent(self, event):
+		# wake the background thread without waiting
+		self.queue.put_nowait(None)
 
-		# check if key code matches tab key code and that the key is being typed to avoid multiple triggers
-		if event.getKeyCode() == KeyEvent.VK_TAB and event.getID() == KeyEvent.KEY_PRESSED:
+	# create and add each issue in the queue on the background thread
+	def run(self):
 
-			# cosume the event
-			event.consume()
+		# loop until the queue is stopped
+		while True:
 
-			# transfer focus to next area
-			self.transferFocus()
+			# get the next issue, or the function and arguments that create it
+			item = self.queue.get()
 
-		# check if key code matched tab key code and that event ID is KEY_RELEASED or KEY_TYPED
-		elif event.getKeyCode() == KeyEvent.VK_TAB:
+			# check if the queue was stopped
+			if item == None:
+				return
 
-			# consume the event
-			event.consume()
+			# get if the issue is from a bulk add
+			function, arguments, isBulkIssue = item
 
+			# check if this is the first bulk issue since the queue was last empty
+			if isBulkIssue and self.firstSubmitTime == None:
 
-#
-# extend CustomUndoableEditListener to allow undo and redo actions in text areas
-#
+				# set the start time
+				self.firstSubmitTime = time.time()
 
-class CustomUndoableEditListener(UndoableEditListener):
+			# try to create and add the issue
+			try:
+				# create the issue if it was not already created
+				issue = arguments if function == None else function(*arguments)
 
-	# initialize variables
-	def __init__(self, extender):
-		self.extender = extender
+				# add new issue
+				self.callbacks.addScanIssue(issue)
 
-	# override UndoAction
-	def undoableEditHappened(self, event):
-		self.extender._undoManager.addEdit(event.getEdit())
-		self.extender._undoAction.update()
-		self.extender._redoAction.update()
+				# add the issue to the index of issues already in burp
+				self.scanIssueIndex.addIssue(issue)
+
+				# check if the issue is from a bulk add
+				if isBulkIssue:
+
+					# add to the count of issues added
+					self.issuesAdded += 1
+
+			# the issue could not be created or added
+			except:
+				# get the error
+				error = sys.exc_info()[1]
+
+				# check if the issue is from a bulk add
+				if isBulkIssue:
+
+					# add to the count of issues that failed, which is printed with the throughput
+					self.issuesFailed += 1
+
+					# print the error
+					print("Failed to add issue: " + str(error))
+
+				# the issue was added from the popup dialog
+				else:
+					# display the error on the Swing event thread
+					SwingUtilities.invokeLater(CustomRunnable(lambda error=error: JOptionPane.showMessageDialog(None, "Failed to add issue.\n" + str(error), self.extensionName, JOptionPane.ERROR_MESSAGE)))
+
+			# check if the issue is from a bulk add
+			if isBulkIssue:
+
+				# free the slot for the next bulk issue
+				self.bulkIssueSlots.release()
+
+			# check if bulk issues were added and the queue is empty
+			if self.firstSubmitTime != None and self.queue.empty():
+
+				# get the elapsed time
+				elapsedTime = max(time.time() - self.firstSubmitTime, 0.001)
+
+				# print the throughput
+				print("Added %d issues to Burp in %.3f seconds (%.1f issues per second, %d failed)" % (self.issuesAdded, elapsedTime, self.issuesAdded / elapsedTime, self.issuesFailed))
+
+				# reset the counts
+				self.issuesAdded = 0
+				self.issuesFailed = 0
+				self.firstSubmitTime = None
 
 
 #
-# extend CustomAbstractAction to allow undo and redo actions in text areas
+# run an import, export, or bulk add on a background thread with a progress bar, a cancel button, and a summary when finished
 #
 
-class CustomAbstractAction(AbstractAction):
+class CustomImportExportTask():
 
 	# initialize variables
-	def __init__(self, extender, undoOrRedo):
+	def __init__(self, extender, taskType, work, onSuccess):
 		self.extender = extender
-		self.undoOrRedo = undoOrRedo
-
-	# override UndoAction
-	def UndoAction(self):
-		AbstractAction.UndoAction(self.undoOrRedo)
-		self.setEnabled(False)
-
-	# override RedoAction
-	def RedoAction(self):
-		AbstractAction.RedoAction(self.undoOrRedo)
-		self.setEnabled(False)
-
-	# override actionPerformed
-	def actionPerformed(self, event):
+		self.taskType = taskType
+		self.work = work
+		self.onSuccess = onSuccess
+
+		# set the number of issues to collect, or the number of seconds to wait, before handing them to the Swing event thread
+		self.batchSize = 500
+		self.batchSeconds = 0.2
+
+		# create counters for the summary
+		self.rowsRead = 0
+		self.rowsInvalid = 0
+		self.rowsAdded = 0
+		self.rowsDuplicate = 0
+		self.rowsDeleted = 0
+		self.rowsWritten = 0
+
+		# create variables for the progress bar
+		self.progressValue = 0
+		self.progressText = ""
+
+		# create variables for handing issues to the Swing event thread
+		self.lock = Lock()
+		self.batchOfIssues = []
+		self.pendingIssues = []
+		self.updateScheduled = False
+
+		# create variables for cancelling and timing
+		self.cancelled = False
+		self.startTime = 0
+		self.lastFlushTime = 0
+
+	# create the progress dialog and start the background thread
+	def start(self):
+
+		# create the progress dialog
+		self.dialog = JDialog()
+		self.dialog.setTitle(self.extender._EXTENSION_NAME + " - " + self.taskType)
+		self.dialog.setDefaultCloseOperation(JDialog.DO_NOTHING_ON_CLOSE)
+
+		# create the progress bar
+		self.progressBar = JProgressBar(0, 100)
+		self.progressBar.setStringPainted(True)
+
+		# create the label for the row counts
+		self.label = JLabel(self.taskType + "ing...")
+		self.label.setHorizontalAlignment(JLabel.CENTER)
+
+		# create the cancel button
+		self.buttonCancel = JButton("Cancel", actionPerformed=lambda x: self.cancel())
+
+		# create the panel for the cancel button
+		panelButton = JPanel()
+		panelButton.add(self.buttonCancel)
+
+		# create the panel for the dialog
+		panel = JPanel()
+		panel.setLayout(BorderLayout(10, 10))
+		panel.setBorder(BorderFactory.createEmptyBorder(10, 10, 10, 10))
+		panel.add(self.label, BorderLayout.NORTH)
+		panel.add(self.progressBar, BorderLayout.CENTER)
+		panel.add(panelButton, BorderLayout.SOUTH)
+
+		# add the panel to the dialog
+		self.dialog.add(panel)
+		self.dialog.setSize(400, 150)
+		self.dialog.setLocationRelativeTo(self.extender.getUiComponent())
+		self.dialog.setVisible(True)
+
+		# set the start time
+		self.startTime = time.time()
+		self.lastFlushTime = self.startTime
+
+		# start the background thread
+		thread = Thread(CustomRunnable(self.run))
+		thread.setDaemon(True)
+		thread.start()
+
+	# run the work on the background thread
+	def run(self):
+
+		# set the error to none
+		error = None
+
+		# try to run the import or export
+		try:
+			# run the import or export
+			self.work(self)
 
-		# check if redo
-		if self.undoOrRedo == "Redo":
+			# hand any remaining issues to the Swing event thread
+			self.flushIssues()
 
-			# try to redo
-			try:
-				# redo
-				self.extender._undoManager.redo()
+		# the import or export failed
+		except:
+			# get the error
+			error = sys.exc_info()[1]
 
-			except:
-				pass
+		# finish on the Swing event thread
+		SwingUtilities.invokeLater(CustomRunnable(lambda: self.finish(error)))
 
-		# check if undo
-		elif self.undoOrRedo == "Undo":
+	# cancel the import or export
+	def cancel(self):
 
-			# try to undo
-			try:
-				# undo
-				self.extender._undoManager.undo()
+		# set the task to cancelled
+		self.cancelled = True
 
-			except:
-				pass
+		# disable the cancel button
+		self.buttonCancel.setEnabled(False)
 
-		# update the undo and redo action
-		self.extender._undoAction.update()
-		self.extender._redoAction.update()
+		# update the label
+		self.label.setText("Cancelling...")
 
-	# override update
-	def update(self):
+	# check if the import or export was cancelled
+	def isCancelled(self):
+		return self.cancelled
 
-		# check if redo
-		if self.undoOrRedo == "Redo":
+	# read lines from a file while updating the progress bar
+	def readLinesWithProgress(self, fileObject, fileSize):
 
-			# check if redo can be performed
-			if (self.extender._undoManager.canRedo()):
+		# set the number of bytes read
+		bytesRead = 0
 
-				self.setEnabled(True)
-				self.putValue(Action.NAME, self.extender._undoManager.getRedoPresentationName())
+		# loop through each line in the file
+		for line in fileObject:
 
-			else:
-				self.setEnabled(False)
-				self.putValue(Action.NAME, self.undoOrRedo)
-		# check if undo
-		elif self.undoOrRedo == "Undo":
+			# add the size of the line
+			bytesRead += len(line)
 
-			# check if undo can be performed
-			if (self.extender._undoManager.canUndo()):
+			# update the progress, using the position in the compressed file for gzip files since the file size is the compressed size
+			self.setProgress(self.getFilePosition(fileObject) if isinstance(fileObject, gzip.GzipFile) else bytesRead, fileSize)
 
-				self.setEnabled(True)
-				self.putValue(Action.NAME, self.extender._undoManager.getUndoPresentationName())
+			# return the line
+			yield line
 
-			else:
-				self.setEnabled(False)
-				self.putValue(Action.NAME, self.undoOrRedo)
+	# get how much of a file has been read, which is the position in the compressed file for gzip files
+	def getFilePosition(self, fileObject):
+		return (fileObject.fileobj if isinstance(fileObject, gzip.GzipFile) else fileObject).tell()
 
+	# set the progress from the background thread
+	def setProgress(self, done, total):
 
-#
-# extend DocumentFilter to filter input for the issue name, host, port, and path
-#
+		# check if the total is not zero
+		if total > 0:
 
-class CustomDocumentFilter(DocumentFilter):
+			# set the progress value
+			self.progressValue = int(done * 100 / total)
 
-	# initialize variables
-	def __init__(self, filterType):
-		self.filterType = filterType
+		# update the dialog
+		self.scheduleUpdate()
 
-	# override insertString
-	def insertString(self, filterBypass, offset, string, attributeSet):
+	# add an issue that was read from the file on the background thread
+	def addIssue(self, issue):
 
-		# create string builder
-		documentFilterBypass = filterBypass.getDocument()
-		stringBuilder = StringBuilder()
-		stringBuilder.append(documentFilterBypass.getText(0, documentFilterBypass.getLength()))
-		stringBuilder.insert(offset, string)
+		# add to the count of rows read
+		self.rowsRead += 1
 
-		# check if value is valid
-		if self.validateString(stringBuilder.toString()):
+		# check if the row was not a valid issue
+		if issue == None:
 
-			# add default insertString
-			DocumentFilter.insertString(self, filterBypass, offset, string, attributeSet)
+			# add to the count of invalid rows
+			self.rowsInvalid += 1
 
-	# override replace
-	def replace(self, filterBypass, offset, length, text, attributeSet):
+			# do not continue
+			return
 
-		# create string builder
-		documentFilterBypass = filterBypass.getDocument()
-		stringBuilder = StringBuilder()
-		stringBuilder.append(documentFilterBypass.getText(0, documentFilterBypass.getLength()))
-		stringBuilder.replace(offset, offset + length, text)
+		# add the issue to the current batch
+		self.batchOfIssues.append(issue)
 
-		# check if value is valid
-		if self.validateString(stringBuilder.toString()):
+		# check if the batch is full or the batch has waited long enough, so the first rows show up right away
+		if len(self.batchOfIssues) >= self.batchSize or time.time() - self.lastFlushTime >= self.batchSeconds:
 
-			# add default replace
-			DocumentFilter.replace(self, filterBypass, offset, length, text, attributeSet)
+			# hand the batch to the Swing event thread
+			self.flushIssues()
 
-	# override remove
-	def remove(self, filterBypass, offset, length):
+	# add a row that was written to the file on the background thread
+	def addRowWritten(self, total):
 
-		# create string builder
-		documentFilterBypass = filterBypass.getDocument()
-		stringBuilder = StringBuilder()
-		stringBuilder.append(documentFilterBypass.getText(0, documentFilterBypass.getLength()))
-		stringBuilder.delete(offset, offset + length)
+		# add to the count of rows written
+		self.rowsWritten += 1
 
-		# check if value is valid
-		if self.validateString(stringBuilder.toString()):
+		# update the progress
+		self.setProgress(self.rowsWritten, total)
 
-			# add default remove
-			DocumentFilter.remove(self, filterBypass, offset, length)
+	# hand the current batch of issues to the Swing event thread
+	def flushIssues(self):
 
-	# validate if the string is allowed
-	def validateString(self, text):
+		# check if there are no issues in the batch
+		if len(self.batchOfIssues) == 0:
+			return
 
-		# check if issue name filter
-		if self.filterType == "Issue Name":
+		# add the batch to the pending issues
+		with self.lock:
+			self.pendingIssues.extend(self.batchOfIssues)
 
-			# check if the text starts with a space
-			if text.startswith(" "):
+		# start a new batch
+		self.batchOfIssues = []
+		self.lastFlushTime = time.time()
 
-				# text is not allowed
-				return False
+		# update the table and dialog
+		self.scheduleUpdate()
 
-			# does not start with a space
-			else:
-				# text is allowed 
-				return True
+	# schedule a single update on the Swing event thread no matter how many updates are requested before it runs
+	def scheduleUpdate(self):
 
-		# check if port filter
-		elif self.filterType == "Port":
+		# check if an update is already scheduled
+		with self.lock:
+			if self.updateScheduled:
+				return
+			self.updateScheduled = True
 
-			# set if text is blank
-			blank = (text == "")
+		# run the update on the Swing event thread
+		SwingUtilities.invokeLater(CustomRunnable(self.applyPendingUpdates))
 
-			# check if text is not blank
-			if not blank:
+	# add the pending issues to the table and update the dialog on the Swing event thread
+	def applyPendingUpdates(self):
 
-				# try to check if text is an integer
-				try:
-					# check if text is an integer
-					Integer.parseInt(text)
+		# get the pending issues and allow another update to be scheduled
+		with self.lock:
+			pendingIssues = self.pendingIssues
+			self.pendingIssues = []
+			self.updateScheduled = False
 
-				# text was not an integer
-				except:
-					# text is not allowed
-					return False
+		# check if there are pending issues
+		if len(pendingIssues) > 0:
 
-				# set if port is valid
-				validPort = (int(text) > -1 and int(text) < 65536)
+			# add all of the pending issues to the table model at once
+			rowsAdded = self.extender.addIssuesToTableModel(pendingIssues)
 
-				# set if port does not start with zero and has a length of greater than one
-				notStartWithZeroAndLengthGreaterThanOne = (not text.startswith("0") and len(text) > 1)
+			# update the counts
+			self.rowsAdded += rowsAdded
+			self.rowsDuplicate += len(pendingIssues) - rowsAdded
 
-				# set if port length is 1
-				lengthIsOne = (len(text) == 1)
+		# update the progress bar
+		self.progressBar.setValue(self.progressValue)
 
-			# check if the text is blank or (a valid port and ((does not start with zero and is greater than one) or (length is one)))
-			if (blank or (validPort and (notStartWithZeroAndLengthGreaterThanOne or lengthIsOne))):
+		# check if the task has not been cancelled
+		if not self.cancelled:
 
-				# text is allowed
-				return True
-			else:
-				# text is not allowed
-				return False
+			# check if this is an import
+			if self.taskType == "Import":
 
-		# host or path filter
-		elif self.filterType == "Host" or self.filterType == "Path":
+				# update the label
+				self.label.setText("Rows read: " + str(self.rowsRead) + "    Added: " + str(self.rowsAdded))
 
-			# check if there is a space or newline character
-			if " " in text or "\n" in text:
+			# check if this is a mount
+			elif self.taskType == "Mount":
 
-				# do not allow
-				return False
+				# update the label
+				self.label.setText("Rows indexed: " + str(self.rowsRead))
 
-			# no space or newline character
+			# check if this is a bulk add
+			elif self.taskType == "Bulk Add":
+
+				# update the label
+				self.label.setText("Messages read: " + str(self.rowsRead) + "    Issues submitted: " + str(self.rowsWritten) + "    Waiting for Burp: " + str(self.extender._scanIssueSubmissionQueue.getDepth()))
+
+			# this is an export
 			else:
-				return True
+				# update the label
+				self.label.setText("Rows written: " + str(self.rowsWritten))
 
+	# close the dialog and display the summary on the Swing event thread
+	def finish(self, error):
 
-#
-# extend DocumentListener to update the issue location when text is inserted or removed from the host, port, or path
-#
+		# add any issues that have not been added yet
+		self.applyPendingUpdates()
 
-class CustomDocumentListener(DocumentListener):
+		# get the elapsed time
+		elapsedTime = time.time() - self.startTime
 
-	# initialize variables
-	def __init__(self, extender):
-		self.extender = extender
+		# close the progress dialog
+		self.dialog.dispose()
 
-	# override changedUpdate for when the style of text changes
-	def changedUpdate(self, event):
-		pass
+		# allow another import or export to run
+		self.extender._importExportTask = None
 
-	# override changedUpdate for when text is inserted
-	def insertUpdate(self, event):
+		# check if the task failed
+		if error != None:
 
-		# update the issue location text area
-		self.extender.updateTextAreaIssueLocation()
+			# display the error
+			JOptionPane.showMessageDialog(None, self.taskType + " failed.\n" + str(error), self.extender._EXTENSION_NAME, JOptionPane.ERROR_MESSAGE)
 
-	# override changedUpdate for when text is removed
-	def removeUpdate(self, event):
+			# do not continue
+			return
 
-		# update the issue location text area
-		self.extender.updateTextAreaIssueLocation()
+		# check if the task finished and has something to do afterwards
+		if not self.cancelled and self.onSuccess != None:
+
+			# run the function
+			self.onSuccess()
+
+		# create the summary
+		if self.taskType == "Import":
+			summary = "Rows read: " + str(self.rowsRead) + "\nAdded: " + str(self.rowsAdded) + "\nSkipped as duplicates: " + str(self.rowsDuplicate) + "\nSkipped as invalid: " + str(self.rowsInvalid)
+			if self.rowsDeleted > 0:
+				summary += "\nDeleted: " + str(self.rowsDeleted)
+			summary += "\nDeduplicated text saved: " + str(self.extender._tableModelShared.textStore.getBytesSaved()) + " bytes"
+		elif self.taskType == "Mount":
+			summary = "Rows read: " + str(self.rowsRead) + "\nMounted: " + str(self.rowsAdded) + "\nSkipped as duplicates: " + str(self.rowsDuplicate)
+		elif self.taskType == "Bulk Add":
+			summary = "Messages read: " + str(self.rowsRead) + "\nIssues submitted: " + str(self.rowsWritten) + "\nSkipped as already in Burp: " + str(self.rowsDuplicate) + "\nSkipped as invalid: " + str(self.rowsInvalid)
+		else:
+			summary = "Rows written: " + str(self.rowsWritten)
+
+		# add the elapsed time
+		summary += "\nElapsed time: " + ("%.2f" % elapsedTime) + " seconds"
+
+		# display the summary
+		JOptionPane.showMessageDialog(None, summary, self.extender._EXTENSION_NAME + " - " + self.taskType + (" Cancelled" if self.cancelled else " Complete"), JOptionPane.INFORMATION_MESSAGE)
 
 
 #
-# extend ActionListener to update the issue location when the protocol combo box is changed
+# read the issues from a JSON file one at a time instead of loading the whole file into memory
 #
 
-class CustomActionListener(ActionListener):
+class CustomJsonIssueReader():
 
 	# initialize variables
-	def __init__(self, extender):
-		self.extender = extender
+	def __init__(self, fileObject):
+		self.fileObject = fileObject
+		self.decoder = json.JSONDecoder()
+		self.buffer = u""
+		self.position = 0
+		self.endOfFile = False
 
-	# override actionPerformed
-	def actionPerformed(self, event):
+		# set the number of characters to read from the file at a time
+		self.chunkSize = 65536
 
-		# get the selected protocol
-		protocol = self.extender._dictionaryOfComboBoxes[self.extender._DIALOG_TAB_1_NAME + " Protocol"].getSelectedItem().strip()
+	# read more of the file into the buffer and drop the part of the buffer that has already been parsed
+	def readChunk(self, size):
 
-		# get the port
-		port = self.extender._dictionaryOfTextAreas[self.extender._DIALOG_TAB_1_NAME + " Port"].getText()
+		# read from the file
+		chunk = self.fileObject.read(size)
 
-		# check if selected protocol is https and the current port is not 443
-		if protocol == "HTTPS" and port != "443":
+		# check if the end of the file was reached
+		if not chunk:
 
-			# set port to 443
-			self.extender._dictionaryOfTextAreas[self.extender._DIALOG_TAB_1_NAME + " Port"].setText("443")
+			# set end of file
+			self.endOfFile = True
 
-		# check if selected protocol is http and the current port is not 80
-		elif protocol == "HTTP" and port != "80":
+			# return that nothing was read
+			return False
 
-			# set port to 80
-			self.extender._dictionaryOfTextAreas[self.extender._DIALOG_TAB_1_NAME + " Port"].setText("80")
+		# add the chunk to the part of the buffer that has not been parsed
+		self.buffer = self.buffer[self.position:] + chunk
+		self.position = 0
 
-		# update the issue location text area
-		self.extender.updateTextAreaIssueLocation()
+		# return that the chunk was read
+		return True
 
+	# get the next character that is not whitespace without consuming it
+	def peekCharacter(self):
 
-#
-# extend JTable to handle cell selection for tables
-#
+		# loop until a character is found or the end of the file is reached
+		while True:
 
-class CustomJTable(JTable):
+			# skip whitespace
+			while self.position < len(self.buffer) and self.buffer[self.position] in u" \t\r\n":
+				self.position += 1
 
-	# initialize variables
-	def __init__(self, extender, tableModel, tabName):
-		self.extender = extender
-		self.tableModel = tableModel
-		self.setModel(tableModel)
-		self.tabName = tabName
+			# check if a character was found
+			if self.position < len(self.buffer):
 
-	# override changeSelection
-	def changeSelection(self, row, column, toggle, extend):
+				# return the character
+				return self.buffer[self.position]
 
-		# get index of selected row
-		modelRowIndex = self.convertRowIndexToModel(row)
+			# check if the end of the file was reached
+			if not self.readChunk(self.chunkSize):
 
-		# get the last selected row and column
-		selectedRow = self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Row"]
-		selectedColumn = self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Column"]
+				# return that there are no characters left
+				return None
 
-		# get the mouse state to not update if the mouse is pressed
-		mouseState = self.extender._mouseState
+	# consume the next character that is not whitespace and check that it is one of the expected characters
+	def readCharacter(self, expectedCharacters):
 
-		# check if the same cell was clicked again and that the row should be unselected
-		if selectedRow == modelRowIndex and selectedColumn == column and self.extender._allowTableRowToBeUnselected == True and mouseState == "Released":
+		# get the next character
+		character = self.peekCharacter()
 
-			# set toggle and extend variables
-			toggle = True
-			extend = False
+		# check if the character was not expected
+		if character == None or character not in expectedCharacters:
 
-			# deselect row
-			JTable.changeSelection(self, row, column, toggle, extend)
+			# the file is not valid json
+			raise ValueError("Expected one of '" + expectedCharacters + "' in JSON file but found " + repr(character))
 
-			# clear tab
-			self.extender.clearMainTabOrIssueSelectionTab(self.tabName)
+		# consume the character
+		self.position += 1
 
-			# unselect the row
-			self.clearSelection()
+		# return the character
+		return character
 
-			# remove border from cell when unselected
-			selectionModel = self.getSelectionModel()
-			selectionModel.setAnchorSelectionIndex(-1)
-			selectionModel.setLeadSelectionIndex(-1)
+	# decode the next json value, reading more of the file until the whole value is in the buffer
+	def readValue(self):
 
-			# remove border from cell when unselected
-			columnModel = self.getColumnModel()
-			columnModel.getSelectionModel().setAnchorSelectionIndex(-1)
-			columnModel.getSelectionModel().setLeadSelectionIndex(-1)
+		# skip whitespace
+		self.peekCharacter()
 
-			# clear the last selected row and column
-			self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Row"] = -1
-			self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Column"] = -1
+		# set the size of the next read
+		readSize = self.chunkSize
 
-			# do not continue
-			return
+		# loop until the value is decoded
+		while True:
 
-		# different row selected or same row but different column
-		else:
-			pass
+			# try to decode the value
+			try:
+				# decode the value
+				value, end = self.decoder.raw_decode(self.buffer, self.position)
 
-		# set the last selected row and column
-		self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Row"] = self.convertRowIndexToModel(row)
-		self.extender._dictionaryOfLastSelectedRowsAndColumns[self.tabName + " Column"] = column
+				# check if the value did not end at the end of the buffer, since a number could continue in the next chunk
+				if end < len(self.buffer) or self.endOfFile:
 
-		# add default changeSelection
-		JTable.changeSelection(self, row, column, toggle, extend)
+					# consume the value
+					self.position = end
 
-		# get values from selected row
-		selectedIssueName = self.getValueAt(row, 0)
-		selectedSeverity = self.getValueAt(row, 1)
-		selectedIssueDetail = self.getValueAt(row, 3)
-		selectedIssueBackground = self.getValueAt(row, 4)
-		selectedRemediationDetail = self.getValueAt(row, 5)
-		selectedRemediationBackground = self.getValueAt(row, 6)
+					# return the value
+					return value
 
-		# update text panes
-		self.extender._dictionaryOfTextPanes[self.tabName + " Issue Name"].setText(self.extender._HTML_FOR_TEXT_PANES[0] + selectedIssueName + self.extender._HTML_FOR_TEXT_PANES[1])
-		self.extender._dictionaryOfTextPanes[self.tabName + " Severity"].setText(self.extender._HTML_FOR_TEXT_PANES[0] + selectedSeverity + self.extender._HTML_FOR_TEXT_PANES[1])
+			# value is not complete
+			except ValueError:
 
-		# update text areas
-		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Detail"].setText(selectedIssueDetail)
-		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Background"].setText(selectedIssueBackground)
-		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Detail"].setText(selectedRemediationDetail)
-		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Background"].setText(selectedRemediationBackground)
+				# check if there is nothing left to read
+				if self.endOfFile:
 
-		# scroll to top of text panes
-		self.extender._dictionaryOfTextPanes[self.tabName + " Issue Name"].setCaretPosition(0)
-		self.extender._dictionaryOfTextPanes[self.tabName + " Severity"].setCaretPosition(0)
+					# the file is not valid json
+					raise
 
-		# scroll to top of text areas
-		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Detail"].setCaretPosition(0)
-		self.extender._dictionaryOfTextAreas[self.tabName + " Issue Background"].setCaretPosition(0)
-		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Detail"].setCaretPosition(0)
-		self.extender._dictionaryOfTextAreas[self.tabName + " Remediation Background"].setCaretPosition(0)
+			# read more of the file, doubling the read size so very large values are not decoded over and over
+			self.readChunk(readSize)
+			readSize *= 2
 
+	# yield each object in the "Issues" array
+	def readIssues(self):
 
-#
-# extend DefaultTableModel to make table cells uneditable
-#
+		# read the start of the json object
+		self.readCharacter("{")
 
-class CustomDefaultTableModel(DefaultTableModel):
+		# check if the object is empty
+		if self.peekCharacter() == "}":
+			return
 
-	# override isCellEditable
-	def isCellEditable(self, row, column):
+		# loop through each key in the object
+		while True:
 
-		# make cell uneditable
-		return False
+			# read the key
+			key = self.readValue()
+			self.readCharacter(":")
 
+			# check if the key is for the issues and it is an array
+			if key == "Issues" and self.peekCharacter() == "[":
 
-#
-# extend TableRowSorter to toggle sorting (ascending, descending, unsorted)
-#
+				# read the start of the array
+				self.readCharacter("[")
 
-class CustomTableRowSorter(TableRowSorter):
+				# check if the array is not empty
+				if self.peekCharacter() != "]":
 
-	# override toggleSortOrder
-	def toggleSortOrder(self, column):
+					# loop through each issue in the array
+					while True:
 
-		# check if valid column 
-		if column >= 0:
+						# return the issue
+						yield self.readValue()
 
-			# get the sort keys
-			keys = self.getSortKeys()
+						# check if the end of the array was reached
+						if self.readCharacter(",]") == "]":
+							break
 
-			# check if the sort keys are not empty
-			if keys.isEmpty() == False:
+				# the array is empty
+				else:
+					# read the end of the array
+					self.readCharacter("]")
 
-				# get the sort key
-				sortKey = keys.get(0)
+			# the value is not the issues array
+			else:
+				# skip the value
+				self.readValue()
 
-				# check if the column clicked is sorted in descending order
-				if sortKey.getColumn() == column and sortKey.getSortOrder() == SortOrder.DESCENDING:
+			# check if the end of the object was reached
+			if self.readCharacter(",}") == "}":
+				return
 
-					# clear sorting
-					self.setSortKeys(None)
 
-					# do not continue
-					return
+#
+# default issues to choose from, stored as a template pack so only the issue names and severities are added to the table when the extension loads
+#
 
-		# toggle default toggleSortOrder
-		TableRowSorter.toggleSortOrder(self, column)
+class DefaultTemplatePack():
 
+	# set the issue type for the default issues
+	ISSUE_TYPE = "Default"
 
-#
-# extend MouseListener to detect mouse clicks on tables so row doesn't flash (select and unselect constantly) when dragging a clicked mouse
-#
+	# keep the text of a template in the table once it is selected
+	KEEP_LOADED_TEXT = True
 
-class CustomMouseListener(MouseListener):
+	# set the name of the file of templates that is bundled next to the extension, with one json array per line: issue name, severity, issue detail, issue background, remediation detail, and remediation background
+	FILE_NAME = "Add & Track Custom Issues Templates.jsonl"
 
 	# initialize variables
-	def __init__(self, extender):
-		self.extender = extender
+	def __init__(self, directory):
+		self.path = os.path.join(directory, self.FILE_NAME)
 
-	# override mousePressed
-	def mousePressed(self, event):
+		# create variables for reading templates by offset, with the last template read cached since rendering a row reads each text column in turn
+		self.lock = Lock()
+		self.templateFile = None
+		self.cachedTemplate = (-1, None)
 
-		# set mouse state
-		self.extender._mouseState = "Pressed"
+	# get the index of issue names and severities that is added to the table when the extension loads, keyed by the offset of each template in the file
+	def getIndex(self):
 
-	# override mouseReleased
-	def mouseReleased(self, event):
+		# create the index
+		index = []
 
-		# set mouse state
-		self.extender._mouseState = "Released"
+		# open the file
+		with open(self.path, "rb") as templateFile:
 
-	# override mouseClicked
-	def mouseClicked(self, event):
-		pass
+			# loop through each line
+			while True:
 
-	# override mouseEntered
-	def mouseEntered(self, event):
-		pass
+				# get the offset and read the line
+				offset = templateFile.tell()
+				line = templateFile.readline()
 
-	# override mouseExited
-	def mouseExited(self, event):
-		pass
+				# check if the end of the file was reached
+				if line == "":
+					break
 
+				# add the key, issue name, severity, and issue type of the template, and let the text of the template be freed
+				template = json.loads(line)
+				index.append((offset, template[0], template[1], self.ISSUE_TYPE))
 
-#
-# populate the shared table model with some default issues to choose from
-#
+		# keep the file open to load templates from
+		self.templateFile = open(self.path, "rb")
 
-class PopulateSharedTableModel():
+		# return the index
+		return index
 
-	# initialize variables
-	def __init__(self, extender):
-		self.extender = extender
+	# load the issue detail, issue background, remediation detail, and remediation background of a template
+	def loadTemplateBodies(self, key):
 
-	# populate the table model
-	def populate(self):
-
-		# create a new issue for the table model
-		# tempIssueName = ""
-		# tempSeverity = ""
-		# tempIssueType = ""
-		# tempIssueDetail = ""
-		# tempIssueBackground = ""
-		# tempRemediationDetail = ""
-		# tempRemediationBackground = ""
-		# self._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueType = "Default"
-
-		tempIssueName = "Cleartext Submission Of Password"
-		tempSeverity = "High"
-		tempIssueDetail = "A Cleartext Submission Of Password vulnerability was discovered."
-		tempIssueBackground = "Some applications transmit passwords over unencrypted connections, making them vulnerable to interception. To exploit this vulnerability, an attacker must be suitably positioned to eavesdrop on the victim's network traffic. This scenario typically occurs when a client communicates with the server over an insecure connection such as public Wi-Fi, or a corporate or home network that is shared with a compromised computer. Common defenses such as switched networks are not sufficient to prevent this. An attacker situated in the user's ISP or the application's hosting infrastructure could also perform this attack. Note that an advanced adversary could potentially target any connection made over the Internet's core infrastructure.\n\nVulnerabilities that result in the disclosure of users' passwords can result in compromises that are extremely difficult to investigate due to obscured audit trails. Even if the application itself only handles non-sensitive information, exposing passwords puts users who have re-used their password elsewhere at risk."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Applications should use transport-level encryption (SSL or TLS) to protect all sensitive communications passing between the client and the server. Communications that should be protected include the login mechanism and related functionality, and any functions where sensitive data can be accessed or privileged actions can be performed. These areas should employ their own session handling mechanism, and the session tokens used should never be transmitted over unencrypted communications. If HTTP cookies are used for transmitting session tokens, then the secure flag should be set to prevent transmission over clear-text HTTP."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Cross-Site Scripting (XSS) - DOM-Based"
-		tempSeverity = "High"
-		tempIssueDetail = "A DOM-Based Cross-Site Scripting (XSS) vulnerability was discovered."
-		tempIssueBackground = "DOM-based vulnerabilities arise when a client-side script reads data from a controllable part of the DOM (for example, the URL) and processes this data in an unsafe way.\n\nDOM-based cross-site scripting arises when a script writes controllable data into the HTML document in an unsafe way. An attacker may be able to use the vulnerability to construct a URL that, if visited by another application user, will cause JavaScript code supplied by the attacker to execute within the user's browser in the context of that user's session with the application.\n\nThe attacker-supplied code can perform a wide variety of actions, such as stealing the victim's session token or login credentials, performing arbitrary actions on the victim's behalf, and logging their keystrokes.\n\nUsers can be induced to visit the attacker's crafted URL in various ways, similar to the usual attack delivery vectors for reflected cross-site scripting vulnerabilities.\n\nBurp Suite automatically identifies this issue using static code analysis, which may lead to false positives that are not actually exploitable. The relevant code and execution paths should be reviewed to determine whether this vulnerability is indeed present, or whether mitigations are in place that would prevent exploitation."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "The most effective way to avoid DOM-based cross-site scripting vulnerabilities is not to dynamically write data from any untrusted source into the HTML document. If the desired functionality of the application means that this behavior is unavoidable, then defenses must be implemented within the client-side code to prevent malicious data from introducing script code into the document. In many cases, the relevant data can be validated on a whitelist basis, to allow only content that is known to be safe. In other cases, it will be necessary to sanitize or encode the data. This can be a complex task, and depending on the context that the data is to be inserted may need to involve a combination of JavaScript escaping, HTML encoding, and URL encoding, in the appropriate sequence."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Cross-Site Scripting (XSS) - Reflected"
-		tempSeverity = "High"
-		tempIssueDetail = "A Reflected Cross-Site Scripting (XSS) vulnerability was discovered."
-		tempIssueBackground = "Reflected cross-site scripting vulnerabilities arise when data is copied from a request and echoed into the application's immediate response in an unsafe way. An attacker can use the vulnerability to construct a request that, if issued by another application user, will cause JavaScript code supplied by the attacker to execute within the user's browser in the context of that user's session with the application.\n\nThe attacker-supplied code can perform a wide variety of actions, such as stealing the victim's session token or login credentials, performing arbitrary actions on the victim's behalf, and logging their keystrokes.\n\nUsers can be induced to issue the attacker's crafted request in various ways. For example, the attacker can send a victim a link containing a malicious URL in an email or instant message. They can submit the link to popular web sites that allow content authoring, for example in blog comments. And they can create an innocuous looking web site that causes anyone viewing it to make arbitrary cross-domain requests to the vulnerable application (using either the GET or the POST method).\n\nThe security impact of cross-site scripting vulnerabilities is dependent upon the nature of the vulnerable application, the kinds of data and functionality that it contains, and the other applications that belong to the same domain and organization. If the application is used only to display non-sensitive public content, with no authentication or access control functionality, then a cross-site scripting flaw may be considered low risk. However, if the same application resides on a domain that can access cookies for other more security-critical applications, then the vulnerability could be used to attack those other applications, and so may be considered high risk. Similarly, if the organization that owns the application is a likely target for phishing attacks, then the vulnerability could be leveraged to lend credibility to such attacks, by injecting Trojan functionality into the vulnerable application and exploiting users' trust in the organization in order to capture credentials for other applications that it owns. In many kinds of application, such as those providing online banking functionality, cross-site scripting should always be considered high risk."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "In most situations where user-controllable data is copied into application responses, cross-site scripting attacks can be prevented using two layers of defenses:\n\nInput should be validated as strictly as possible on arrival, given the kind of content that it is expected to contain. For example, personal names should consist of alphabetical and a small range of typographical characters, and be relatively short; a year of birth should consist of exactly four numerals; email addresses should match a well-defined regular expression. Input which fails the validation should be rejected, not sanitized.\n\nUser input should be HTML-encoded at any point where it is copied into application responses. All HTML metacharacters, including < > \" ' and =, should be replaced with the corresponding HTML entities (&lt; &gt; etc).\n\nIn cases where the application's functionality allows users to author content using a restricted subset of HTML tags and attributes (for example, blog comments which allow limited formatting and linking), it is necessary to parse the supplied HTML to validate that it does not use any dangerous syntax; this is a non-trivial task."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Cross-Site Scripting (XSS) - Stored"
-		tempSeverity = "High"
-		tempIssueDetail = "A Stored Cross-Site Scripting (XSS) vulnerability was discovered."
-		tempIssueBackground = "Stored cross-site scripting vulnerabilities arise when user input is stored and later embedded into the application's responses in an unsafe way. An attacker can use the vulnerability to inject malicious JavaScript code into the application, which will execute within the browser of any user who views the relevant application content.\n\nThe attacker-supplied code can perform a wide variety of actions, such as stealing victims' session tokens or login credentials, performing arbitrary actions on their behalf, and logging their keystrokes.\n\nMethods for introducing malicious content include any function where request parameters or headers are processed and stored by the application, and any out-of-band channel whereby data can be introduced into the application's processing space (for example, email messages sent over SMTP that are ultimately rendered within a web mail application).\n\nStored cross-site scripting flaws are typically more serious than reflected vulnerabilities because they do not require a separate delivery mechanism in order to reach target users, and are not hindered by web browsers' XSS filters. Depending on the affected page, ordinary users may be exploited during normal use of the application. In some situations this can be used to create web application worms that spread exponentially and ultimately exploit all active users.\n\nNote that automated detection of stored cross-site scripting vulnerabilities cannot reliably determine whether attacks that are persisted within the application can be accessed by any other user, only by authenticated users, or only by the attacker themselves. You should review the functionality in which the vulnerability appears to determine whether the application's behavior can feasibly be used to compromise other application users."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "In most situations where user-controllable data is copied into application responses, cross-site scripting attacks can be prevented using two layers of defenses:\n\nInput should be validated as strictly as possible on arrival, given the kind of content that it is expected to contain. For example, personal names should consist of alphabetical and a small range of typographical characters, and be relatively short; a year of birth should consist of exactly four numerals; email addresses should match a well-defined regular expression. Input which fails the validation should be rejected, not sanitized.\n\nUser input should be HTML-encoded at any point where it is copied into application responses. All HTML metacharacters, including < > \" ' and =, should be replaced with the corresponding HTML entities (&lt; &gt; etc).\n\nIn cases where the application's functionality allows users to author content using a restricted subset of HTML tags and attributes (for example, blog comments which allow limited formatting and linking), it is necessary to parse the supplied HTML to validate that it does not use any dangerous syntax; this is a non-trivial task."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Directory Traversal (File Path Traversal '../')"
-		tempSeverity = "High"
-		tempIssueDetail = "A Directory Traversal (File Path Traversal '../') vulnerability was discovered."
-		tempIssueBackground = "File path traversal vulnerabilities arise when user-controllable data is used within a filesystem operation in an unsafe manner. Typically, a user-supplied filename is appended to a directory prefix in order to read or write the contents of a file. If vulnerable, an attacker can supply path traversal sequences (using dot-dot-slash characters) to break out of the intended directory and read or write files elsewhere on the filesystem.\n\nThis is typically a very serious vulnerability, enabling an attacker to access sensitive files containing configuration data, passwords, database records, log data, source code, and program scripts and binaries."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Ideally, application functionality should be designed in such a way that user-controllable data does not need to be passed to filesystem operations. This can normally be achieved by referencing known files via an index number rather than their name, and using application-generated filenames to save user-supplied file content.\n\nIf it is considered unavoidable to pass user-controllable data to a filesystem operation, three layers of defense can be employed to prevent path traversal attacks:\n\nUser-controllable data should be strictly validated before being passed to any filesystem operation. In particular, input containing dot-dot sequences should be blocked.\n\nAfter validating user input, the application can use a suitable filesystem API to verify that the file to be accessed is actually located within the base directory used by the application. In Java, this can be achieved by instantiating a java.io.File object using the user-supplied filename and then calling the getCanonicalPath method on this object. If the string returned by this method does not begin with the name of the start directory, then the user has somehow bypassed the application's input filters, and the request should be rejected. In ASP.NET, the same check can be performed by passing the user-supplied filename to the System.Io.Path.GetFullPath method and checking the returned string in the same way as described for Java.\n\nThe directory used to store files that are accessed using user-controllable data can be located on a separate logical volume to other sensitive application and operating system files, so that these cannot be reached via path traversal attacks. In Unix-based systems, this can be achieved using a chrooted filesystem; on Windows, this can be achieved by mounting the base directory as a new logical drive and using the associated drive letter to access its contents."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "File Path Manipulation"
-		tempSeverity = "High"
-		tempIssueDetail = "A File Path Manipulation vulnerability was discovered."
-		tempIssueBackground = "File path manipulation vulnerabilities arise when user-controllable data is placed into a file or URL path that is used on the server to access local resources, which may be within or outside the web root. If vulnerable, an attacker can modify the file path to access different resources, which may contain sensitive information. Even where an attack is constrained within the web root, it is often possible to retrieve items that are normally protected from direct access, such as application configuration files, the source code for server-executable scripts, or files with extensions that the web server is not configured to serve directly."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Ideally, application functionality should be designed in such a way that user-controllable data does not need to be placed into file or URL paths in order to access local resources on the server. This can normally be achieved by referencing known files via an index number rather than their name.\n\nIf it is considered unavoidable to place user data into file or URL paths, the data should be strictly validated against a whitelist of accepted values. Note that when accessing resources within the web root, simply blocking input containing file path traversal sequences (such as dot-dot-slash) is not always sufficient to prevent retrieval of sensitive information, because some protected items may be accessible at the original path without using any traversal sequences."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "LDAP Injection"
-		tempSeverity = "High"
-		tempIssueDetail = "An LDAP Injection vulnerability was discovered."
-		tempIssueBackground = "LDAP injection arises when user-controllable data is copied in an unsafe way into an LDAP query that is performed by the application. If an attacker can inject LDAP metacharacters into the query, then they can interfere with the query's logic. Depending on the function for which the query is used, the attacker may be able to retrieve sensitive data to which they are not authorized, or subvert the application's logic to perform some unauthorized action.\n\nNote that automated difference-based tests for LDAP injection flaws can often be unreliable and are prone to false positive results. Scanner results should be manually reviewed to confirm whether a vulnerability is actually present."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "If possible, applications should avoid copying user-controllable data into LDAP queries. If this is unavoidable, then the data should be strictly validated to prevent LDAP injection attacks. In most situations, it will be appropriate to allow only short alphanumeric strings to be copied into queries, and any other input should be rejected. At a minimum, input containing any LDAP metacharacters should be rejected; characters that should be blocked include ( ) ; , * | & = and whitespace."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "OS Command Injection"
-		tempSeverity = "High"
-		tempIssueDetail = "An OS Command Injection vulnerability was discovered."
-		tempIssueBackground = "Operating system command injection vulnerabilities arise when an application incorporates user-controllable data into a command that is processed by a shell command interpreter. If the user data is not strictly validated, an attacker can use shell metacharacters to modify the command that is executed, and inject arbitrary further commands that will be executed by the server.\n\nOS command injection vulnerabilities are usually very serious and may lead to compromise of the server hosting the application, or of the application's own data and functionality. It may also be possible to use the server as a platform for attacks against other systems. The exact potential for exploitation depends upon the security context in which the command is executed, and the privileges that this context has regarding sensitive resources on the server."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "If possible, applications should avoid incorporating user-controllable data into operating system commands. In almost every situation, there are safer alternative methods of performing server-level tasks, which cannot be manipulated to perform additional commands than the one intended.\n\nIf it is considered unavoidable to incorporate user-supplied data into operating system commands, the following two layers of defense should be used to prevent attacks:\n\nThe user data should be strictly validated. Ideally, a whitelist of specific accepted values should be used. Otherwise, only short alphanumeric strings should be accepted. Input containing any other data, including any conceivable shell metacharacter or whitespace, should be rejected.\n\nThe application should use command APIs that launch a specific process via its name and command-line parameters, rather than passing a command string to a shell interpreter that supports command chaining and redirection. For example, the Java API Runtime.exec and the ASP.NET API Process.Start do not support shell metacharacters. This defense can mitigate the impact of an attack even in the event that an attacker circumvents the input validation defenses."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Out-Of-Band Resource Load (HTTP)"
-		tempSeverity = "High"
-		tempIssueDetail = "An Out-Of-Band Resource Load (HTTP) vulnerability was discovered."
-		tempIssueBackground = "Out-of-band resource load arises when it is possible to induce an application to fetch content from an arbitrary external location, and incorporate that content into the application's own response(s). The ability to trigger arbitrary out-of-band resource load does not constitute a vulnerability in its own right, and in some cases might even be the intended behavior of the application. However, in many cases, it can indicate a vulnerability with serious consequences.\n\nThe ability to request and retrieve web content from other systems can allow the application server to be used as a two-way attack proxy. By submitting suitable payloads, an attacker can cause the application server to attack, or retrieve content from, other systems that it can interact with. This may include public third-party systems, internal systems within the same organization, or services available on the local loopback adapter of the application server itself. Depending on the network architecture, this may expose highly vulnerable internal services that are not otherwise accessible to external attackers.\n\nAdditionally, the application's processing of web content that is retrieved from arbitrary URLs exposes some important and non-conventional attack surface. An attacker can deploy a web server that returns malicious content, and then induce the application to retrieve and process that content. This processing might give rise to the types of input-based vulnerabilities that are normally found when unexpected input is submitted directly in requests to the application. The out-of-band attack surface that the application exposes should be thoroughly tested for these types of vulnerabilities."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "You should review the purpose and intended use of the relevant application functionality, and determine whether the ability to trigger arbitrary out-of-band resource load is intended behavior. If so, you should be aware of the types of attacks that can be performed via this behavior and take appropriate measures. These measures might include blocking network access from the application server to other internal systems, and hardening the application server itself to remove any services available on the local loopback adapter. You should also ensure that content retrieved from other systems is processed in a safe manner, with the usual precautions that are applicable when processing input from direct incoming web requests.\n\nIf the ability to trigger arbitrary out-of-band resource load is not intended behavior, then you should implement a whitelist of permitted URLs, and block requests to URLs that do not appear on this whitelist."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "SQL Injection (SQLi)"
-		tempSeverity = "High"
-		tempIssueDetail = "A SQL Injection (SQLi) vulnerability was discovered."
-		tempIssueBackground = "SQL injection vulnerabilities arise when user-controllable data is incorporated into database SQL queries in an unsafe manner. An attacker can supply crafted input to break out of the data context in which their input appears and interfere with the structure of the surrounding query.\n\nA wide range of damaging attacks can often be delivered via SQL injection, including reading or modifying critical application data, interfering with application logic, escalating privileges within the database and taking control of the database server."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "The most effective way to prevent SQL injection attacks is to use parameterized queries (also known as prepared statements) for all database access. This method uses two steps to incorporate potentially tainted data into SQL queries: first, the application specifies the structure of the query, leaving placeholders for each item of user input; second, the application specifies the contents of each placeholder. Because the structure of the query has already been defined in the first step, it is not possible for malformed data in the second step to interfere with the query structure. You should review the documentation for your database and application platform to determine the appropriate APIs which you can use to perform parameterized queries. It is strongly recommended that you parameterize every variable data item that is incorporated into database queries, even if it is not obviously tainted, to prevent oversights occurring and avoid vulnerabilities being introduced by changes elsewhere within the code base of the application.\n\nYou should be aware that some commonly employed and recommended mitigations for SQL injection vulnerabilities are not always effective:\n\nOne common defense is to double up any single quotation marks appearing within user input before incorporating that input into a SQL query. This defense is designed to prevent malformed data from terminating the string into which it is inserted. However, if the data being incorporated into queries is numeric, then the defense may fail, because numeric data may not be encapsulated within quotes, in which case only a space is required to break out of the data context and interfere with the query. Further, in second-order SQL injection attacks, data that has been safely escaped when initially inserted into the database is subsequently read from the database and then passed back to it again. Quotation marks that have been doubled up initially will return to their original form when the data is reused, allowing the defense to be bypassed.\n\nAnother often cited defense is to use stored procedures for database access. While stored procedures can provide security benefits, they are not guaranteed to prevent SQL injection attacks. The same kinds of vulnerabilities that arise within standard dynamic SQL queries can arise if any SQL is dynamically constructed within stored procedures. Further, even if the procedure is sound, SQL injection can arise if the procedure is invoked in an unsafe manner using user-controllable data."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "User Enumeration"
-		tempSeverity = "High"
-		tempIssueDetail = "Valid usernames can be distinguished from invalid usernames."
-		tempIssueBackground = "Valid usernames can be identified based on the response of the web application."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "The server should response with a generic message for both valid and invalid usernames."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "XML External Entity Injection (XXE)"
-		tempSeverity = "High"
-		tempIssueDetail = "An XML External Entity Injection (XXE) vulnerability was discovered."
-		tempIssueBackground = "XML external entity (XXE) injection vulnerabilities arise when applications process user-supplied XML documents without disabling references to external resources. XML parsers typically support external references by default, even though they are rarely required by applications during normal usage.\n\nExternal entities can reference files on the parser's filesystem; exploiting this feature may allow retrieval of arbitrary files, or denial of service by causing the server to read from a file such as /dev/random.\n\nExternal entities can often also reference network resources via the HTTP protocol handler. The ability to send requests to other systems can allow the vulnerable server to be used as an attack proxy. By submitting suitable payloads, an attacker can cause the application server to attack other systems that it can interact with. This may include public third-party systems, internal systems within the same organization, or services available on the local loopback adapter of the application server itself. Depending on the network architecture, this may expose highly vulnerable internal services that are not otherwise accessible to external attackers."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Parsers that are used to process XML from untrusted sources should be configured to disable processing of all external resources. This is usually possible, and will prevent a number of related attacks. You should consult the documentation for your XML parsing library to determine how to achieve this.\n\nXML external entity injection makes use of the DOCTYPE tag to define the injected entity. It may also be possible to disable the DOCTYPE tag or use input validation to block input containing it."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "XPath Injection"
-		tempSeverity = "High"
-		tempIssueDetail = "An XPath Injection vulnerability was discovered."
-		tempIssueBackground = "XPath injection vulnerabilities arise when user-controllable data is incorporated into XPath queries in an unsafe manner. An attacker can supply crafted input to break out of the data context in which their input appears and interfere with the structure of the surrounding query.\n\nDepending on the purpose for which the vulnerable query is being used, an attacker may be able to exploit an XPath injection flaw to read sensitive application data or interfere with application logic."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "User input should be strictly validated before being incorporated into XPath queries. In most cases, it will be appropriate to accept input containing only short alphanumeric strings. At the very least, input containing any XPath metacharacters such as \" ' / @ = * [ ] ( and ) should be rejected."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Cross-Site Request Forgery (CSRF)"
-		tempSeverity = "Medium"
-		tempIssueDetail = "A Cross-Site Request Forgery (CSRF) vulnerability was discovered."
-		tempIssueBackground = "Cross-site request forgery (CSRF) vulnerabilities may arise when applications rely solely on HTTP cookies to identify the user that has issued a particular request. Because browsers automatically add cookies to requests regardless of their origin, it may be possible for an attacker to create a malicious web site that forges a cross-domain request to the vulnerable application. For a request to be vulnerable to CSRF, the following conditions must hold:\n\nThe request can be issued cross-domain, for example using an HTML form. If the request contains non-standard headers or body content, then it may only be issuable from a page that originated on the same domain.\n\nThe application relies solely on HTTP cookies or Basic Authentication to identify the user that issued the request. If the application places session-related tokens elsewhere within the request, then it may not be vulnerable.\n\nThe request performs some privileged action within the application, which modifies the application's state based on the identity of the issuing user.\n\nThe attacker can determine all the parameters required to construct a request that performs the action. If the request contains any values that the attacker cannot determine or predict, then it is not vulnerable."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "The most effective way to protect against CSRF vulnerabilities is to include within relevant requests an additional token that is not transmitted in a cookie: for example, a parameter in a hidden form field. This additional token should contain sufficient entropy, and be generated using a cryptographic random number generator, such that it is not feasible for an attacker to determine or predict the value of any token that was issued to another user. The token should be associated with the user's session, and the application should validate that the correct token is received before performing any action resulting from the request.\n\nAn alternative approach, which may be easier to implement, is to validate that Host and Referer headers in relevant requests are both present and contain the same domain name. However, this approach is somewhat less robust: historically, quirks in browsers and plugins have often enabled attackers to forge cross-domain requests that manipulate these headers to bypass such defenses."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "XML Injection"
-		tempSeverity = "Medium"
-		tempIssueDetail = "An XML Injection vulnerability was discovered."
-		tempIssueBackground = "XML or SOAP injection vulnerabilities arise when user input is inserted into a server-side XML document or SOAP message in an unsafe way. It may be possible to use XML metacharacters to modify the structure of the resulting XML. Depending on the function in which the XML is used, it may be possible to interfere with the application's logic, to perform unauthorized actions or access sensitive data.\n\nThis kind of vulnerability can be difficult to detect and exploit remotely; you should review the application's response, and the purpose that the relevant input performs within the application's functionality, to determine whether it is indeed vulnerable."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "The application should validate or sanitize user input before incorporating it into an XML document or SOAP message. It may be possible to block any input containing XML metacharacters such as < and >. Alternatively, these characters can be replaced with the corresponding entities: &lt; and &gt;."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Link Manipulation"
-		tempSeverity = "Low"
-		tempIssueDetail = "A link was manipulated."
-		tempIssueBackground = "Link manipulation occurs when an application embeds user input into the path or domain of URLs that appear within application responses. An attacker can use this vulnerability to construct a link that, if visited by another application user, will modify the target of URLs within the response. It may be possible to leverage this to perform various attacks, such as:\n\nManipulating the path of an on-site link that has sensitive parameters in the URL. If the response from the modified path contains references to off-site resources, then the sensitive data might be leaked to external domains via the Referer header.\n\nManipulating the URL targeted by a form action, making the form submission have unintended side effects.\n\nManipulating the URL used by a CSS import statement to point to an attacker-uploaded file, resulting in CSS injection.\n\nInjecting on-site links containing XSS exploits, thereby bypassing browser anti-XSS defenses, since those defenses typically do not operate on on-site links.\n\nThe security impact of this issue depends largely on the nature of the application functionality. Even if it has no direct impact on its own, an attacker may use it in conjunction with other vulnerabilities to escalate their overall severity."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Consider using a whitelist to restrict user input to safe values. Please note that in some situations this issue will have no security impact, meaning no remediation is necessary."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Open Redirection"
-		tempSeverity = "Low"
-		tempIssueDetail = "An open redirection was discovered."
-		tempIssueBackground = "Open redirection vulnerabilities arise when an application incorporates user-controllable data into the target of a redirection in an unsafe way. An attacker can construct a URL within the application that causes a redirection to an arbitrary external domain. This behavior can be leveraged to facilitate phishing attacks against users of the application. The ability to use an authentic application URL, targeting the correct domain and with a valid SSL certificate (if SSL is used), lends credibility to the phishing attack because many users, even if they verify these features, will not notice the subsequent redirection to a different domain."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "If possible, applications should avoid incorporating user-controllable data into redirection targets. In many cases, this behavior can be avoided in two ways:\n\nRemove the redirection function from the application, and replace links to it with direct links to the relevant target URLs.\n\nMaintain a server-side list of all URLs that are permitted for redirection. Instead of passing the target URL as a parameter to the redirector, pass an index into this list.\n\nIf it is considered unavoidable for the redirection function to receive user-controllable input and incorporate this into the redirection target, one of the following measures should be used to minimize the risk of redirection attacks:\n\nThe application should use relative URLs in all of its redirects, and the redirection function should strictly validate that the URL received is a relative URL.\n\nThe application should use URLs relative to the web root for all of its redirects, and the redirection function should validate that the URL received starts with a slash character. It should then prepend http://yourdomainname.com to the URL before issuing the redirect.\n\nThe application should use absolute URLs for all of its redirects, and the redirection function should verify that the user-supplied URL begins with http://yourdomainname.com/ before issuing the redirect."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Password Submitted Using GET Method"
-		tempSeverity = "Low"
-		tempIssueDetail = "A password was submitted using the GET method."
-		tempIssueBackground = "Some applications use the GET method to submit passwords, which are transmitted within the query string of the requested URL. Sensitive information within URLs may be logged in various locations, including the user's browser, the web server, and any forward or reverse proxy servers between the two endpoints. URLs may also be displayed on-screen, bookmarked or emailed around by users. They may be disclosed to third parties via the Referer header when any off-site links are followed. Placing passwords into the URL increases the risk that they will be captured by an attacker.\n\nVulnerabilities that result in the disclosure of users' passwords can result in compromises that are extremely difficult to investigate due to obscured audit trails. Even if the application itself only handles non-sensitive information, exposing passwords puts users who have re-used their password elsewhere at risk."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "All forms submitting passwords should use the POST method. To achieve this, applications should specify the method attribute of the FORM tag as method=\"POST\". It may also be necessary to modify the corresponding server-side form handler to ensure that submitted passwords are properly retrieved from the message body, rather than the URL."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Base64-Encoded Data In Parameter"
-		tempSeverity = "Information"
-		tempIssueDetail = "A Base64-encoded parameter was discovered."
-		tempIssueBackground = "Applications sometimes Base64-encode parameters in an attempt to obfuscate them from users or facilitate transport of binary data. The presence of Base64-encoded data may indicate security-sensitive information or functionality that is worthy of further investigation. The data should be reviewed to determine whether it contains any interesting information, or provides any additional entry points for malicious input."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Confirm that the Base64-encoded parameters do not contain sensitive information."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "File Upload Functionality"
-		tempSeverity = "Information"
-		tempIssueDetail = "File upload functionality was discovered."
-		tempIssueBackground = "File upload functionality is commonly associated with a number of vulnerabilities, including:\nFile path traversal\nPersistent cross-site scripting\nPlacing of other client-executable code into the domain\nTransmission of viruses and other malware\nDenial of service\n\nYou should review file upload functionality to understand its purpose, and establish whether uploaded content is ever returned to other application users, either through their normal usage of the application or by being fed a specific link by an attacker.\n\nSome factors to consider when evaluating the security impact of this functionality include:\n\nWhether uploaded content can subsequently be downloaded via a URL within the application.\n\nWhat Content-type and Content-disposition headers the application returns when the file's content is downloaded.\n\nWhether it is possible to place executable HTML/JavaScript into the file, which executes when the file's contents are viewed.\n\nWhether the application performs any filtering on the file extension or MIME type of the uploaded file.\n\nWhether it is possible to construct a hybrid file containing both executable and non-executable content, to bypass any content filters - for example, a file containing both a GIF image and a Java archive (known as a GIFAR file).\n\nWhat location is used to store uploaded content, and whether it is possible to supply a crafted filename to escape from this location.\n\nWhether archive formats such as ZIP are unpacked by the application.\n\nHow the application handles attempts to upload very large files, or decompression bomb files."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "File upload functionality is not straightforward to implement securely. Some recommendations to consider in the design of this functionality include:\n\nUse a server-generated filename if storing uploaded files on disk.\n\nInspect the content of uploaded files, and enforce a whitelist of accepted, non-executable content types. Additionally, enforce a blacklist of common executable formats, to hinder hybrid file attacks.\n\nEnforce a whitelist of accepted, non-executable file extensions.\n\nIf uploaded files are downloaded by users, supply an accurate non-generic Content-Type header, the X-Content-Type-Options: nosniff header, and also a Content-Disposition header that specifies that browsers should handle the file as an attachment.\n\nEnforce a size limit on uploaded files (for defense-in-depth, this can be implemented both within application code and in the web server's configuration).\n\nReject attempts to upload archive formats such as ZIP."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Information Leakage"
-		tempSeverity = "Information"
-		tempIssueDetail = "Information Leakage was discovered."
-		tempIssueBackground = "Applications sometimes leak information. This information could contain sensitive data or be used by an attacker to exploit the application."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Applications should not leak information."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Information Leakage (Document Metadata)"
-		tempSeverity = "Information"
-		tempIssueDetail = "Information Leakage was discovered in document metadata."
-		tempIssueBackground = "Documents sometimes leak information in the document metadata. This information can be quite useful to attackers and can be used to perform attacks including password attacks and social engineering attacks."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Documents should not leak information from the document metadata. Remove metadata from documents."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Information Leakage (Improper Error Handling)"
-		tempSeverity = "Information"
-		tempIssueDetail = "Information Leakage was discovered in an error message."
-		tempIssueBackground = "Applications sometimes leak information in error messages displayed to end users. These error messages can be quite useful to attackers and may be useful in exploiting a vulnerability."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Applications should not leak information from the error messages."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Input Returned In Response"
-		tempSeverity = "Information"
-		tempIssueDetail = "User input was returned in a response."
-		tempIssueBackground = "User input was echoed into the application's response.\n\nInput being returned in application responses is not a vulnerability in its own right. However, it is a prerequisite for many client-side vulnerabilities, including cross-site scripting, open redirection, content spoofing, and response header injection. Additionally, some server-side vulnerabilities such as SQL injection are often easier to identify and exploit when input is returned in responses. In applications where input retrieval is rare and the environment is resistant to automated testing (for example, due to a web application firewall), it might be worth subjecting instances of it to focused manual testing."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Confirm that the input that was echoed cannot be used by an attacker to exploit a vulnerability."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Interesting Parameter Passed To Web Page"
-		tempSeverity = "Information"
-		tempIssueDetail = "An interesting parameter was passed to a web page."
-		tempIssueBackground = "An interesting parameter was passed to a web page."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Confirm that the parameter passed to the web page is by design and cannot be used to exploit a vulnerability."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Long Redirection Response"
-		tempSeverity = "Information"
-		tempIssueDetail = "A long redirection response was discovered."
-		tempIssueBackground = "The application returned a redirection response containing a \"long\" message body. Ordinarily, this content is not displayed to the user, because the browser automatically follows the redirection.\n\nOccasionally, redirection responses contain sensitive data. For example, if the user requests a page that they are not authorized to view, then an application might issue a redirection to a different page, but also include the contents of the prohibited page.\n\nYou should review the contents of the response to determine whether it contains anything sensitive."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "In cases where the application handles requests for unauthorized content by redirecting to a different URL, the application should ensure that no sensitive content is included within the redirection response. Depending on the application and the platform, this might involve checking for proper authorization earlier in the request handling logic, or using a different API to perform the redirection."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Open Ports"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OPEN_PORTS_HERE"
-		tempIssueBackground = "The open ports were discovered by ENTER_DISCOVERY_METHOD_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = "Confirm that the port(s) listed should be open."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Robots.txt File Output"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_ROBOTS.TXT_OUTPUT_HERE"
-		tempIssueBackground = "The file robots.txt is used to give instructions to web robots, such as search engine crawlers, about locations within the web site that robots are allowed, or not allowed, to crawl and index.\n\nThe presence of the robots.txt does not in itself present any kind of security vulnerability. However, it is often used to identify restricted or private areas of a site's contents. The information in the file may therefore help an attacker to map out the site's contents, especially if some of the locations identified are not linked from elsewhere in the site. If the application relies on robots.txt to protect access to these areas, and does not enforce proper access control over them, then this presents a serious vulnerability."
-		tempRemediationDetail = ""
-		tempRemediationBackground = "The robots.txt file is not itself a security threat, and its correct use can represent good practice for non-security reasons. You should not assume that all web robots will honor the file's instructions. Rather, assume that attackers will pay close attention to any locations identified in the file. Do not rely on robots.txt to provide any kind of protection over unauthorized access."
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "DirBuster Results"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OUTPUT_HERE"
-		tempIssueBackground = "The command used was: ENTER_DIRBUSTER_COMMAND_USED_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = ""
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "DotDotPwn Results"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OUTPUT_HERE"
-		tempIssueBackground = "The command used was: ENTER_DOTDOTPWN_COMMAND_USED_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = ""
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Nikto Results"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OUTPUT_HERE"
-		tempIssueBackground = "The command used was: ENTER_NIKTO_COMMAND_USED_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = ""
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Nmap Results"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OUTPUT_HERE"
-		tempIssueBackground = "The command used was: ENTER_NMAP_COMMAND_USED_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = ""
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "SQLMap Results"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OUTPUT_HERE"
-		tempIssueBackground = "The command used was: ENTER_SQLMAP_COMMAND_USED_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = ""
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
-
-		tempIssueName = "Wfuzz Results"
-		tempSeverity = "Information"
-		tempIssueDetail = "ENTER_OUTPUT_HERE"
-		tempIssueBackground = "The command used was: ENTER_WFUZZ_COMMAND_USED_HERE"
-		tempRemediationDetail = ""
-		tempRemediationBackground = ""
-		self.extender._tableModelShared.addRow([tempIssueName, tempSeverity, tempIssueType, tempIssueDetail, tempIssueBackground, tempRemediationDetail, tempRemediationBackground])
+		# read the template from the file if it is not cached
+		with self.lock:
+			cachedKey, bodies = self.cachedTemplate
+			if key != cachedKey:
+				self.templateFile.seek(key)
+				bodies = tuple(json.loads(self.templateFile.readline())[2:6])
+				self.cachedTemplate = (key, bodies)
 
-		return
+		# return the text
+		return bodies
 
+	# close the file of templates
+	def close(self):
+		with self.lock:
+			if self.templateFile != None:
+				self.templateFile.close()
+				self.templateFile = None